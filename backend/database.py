@@ -1,5 +1,8 @@
 import os
-from sqlalchemy import create_engine, text
+from contextlib import contextmanager
+from typing import Iterator
+from sqlalchemy import create_engine, event, make_url, select, text
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import sessionmaker, declarative_base, Session
 from dotenv import load_dotenv
 from fastapi import Depends, Header, HTTPException
@@ -7,14 +10,45 @@ from fastapi import Depends, Header, HTTPException
 # .env 로드
 load_dotenv()
 
+from backend.utils.staff_cache import staff_role_cache
+from backend.utils.tokens import verify_token
+from backend.utils.pool_metrics import InstrumentedQueuePool, instrument_engine
+
 # 환경변수 읽기
 DATABASE_URL = os.getenv("DATABASE_URL")
 
 if not DATABASE_URL:
     raise ValueError("DATABASE_URL 환경변수가 설정되지 않았습니다. .env 파일을 확인하세요.")
 
+
+def _pool_options(staff_role: str | None = None) -> dict:
+    '''
+    커넥션 풀 설정 (환경변수)
+
+    - DB_POOL_SIZE / DB_MAX_OVERFLOW / DB_POOL_TIMEOUT / DB_POOL_RECYCLE / DB_POOL_PRE_PING
+    - staff_role 이 주어지면 DB_POOL_SIZE_SANTA 처럼 역할별 값을 우선 사용
+    '''
+    def env(name: str, default: str) -> str:
+        if staff_role:
+            value = os.getenv(f"{name}_{staff_role.upper()}")
+            if value is not None:
+                return value
+        return os.getenv(name, default)
+
+    return {
+        "poolclass": InstrumentedQueuePool,
+        "pool_logging_name": staff_role or "default",
+        "pool_size": int(env("DB_POOL_SIZE", "5")),
+        "max_overflow": int(env("DB_MAX_OVERFLOW", "10")),
+        "pool_timeout": float(env("DB_POOL_TIMEOUT", "30")),
+        "pool_recycle": int(env("DB_POOL_RECYCLE", "-1")),
+        "pool_pre_ping": env("DB_POOL_PRE_PING", "0") == "1",
+    }
+
+
 # PostgreSQL 엔진 생성
-engine = create_engine(DATABASE_URL)
+engine = create_engine(DATABASE_URL, **_pool_options())
+instrument_engine(engine, "default")
 
 # DB 세션 생성기
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine, expire_on_commit=False,)
@@ -37,41 +71,236 @@ ROLE_MAPPING = {
     "Keeper": "role_keeper"
 }
 
+# ---------------------------------------------------------
+# 역할별 커넥션 풀 모드 (DB_ROLE_POOLS=1)
+# - ROLE_MAPPING 의 역할마다 별도 엔진/풀을 만들고
+#   새 커넥션이 열릴 때 한 번만 SET ROLE 을 실행
+# - 요청마다 SET ROLE / RESET ROLE 을 보내지 않음
+# - 풀 설정은 DB_POOL_SIZE_<ROLE>, DB_MAX_OVERFLOW_<ROLE> 등으로 역할별 조정
+#   (예: DB_POOL_SIZE_SANTA=20, 없으면 공통 DB_POOL_SIZE)
+# ---------------------------------------------------------
+ROLE_POOLS_ENABLED = os.getenv("DB_ROLE_POOLS", "0") == "1"
+
+
+def _create_role_engine(staff_role: str, db_role: str):
+    role_engine = create_engine(DATABASE_URL, **_pool_options(staff_role))
+    instrument_engine(role_engine, staff_role)
+
+    @event.listens_for(role_engine, "connect")
+    def _set_role_on_connect(dbapi_connection, connection_record):
+        # 트랜잭션 밖에서 실행해야 롤백되어도 role 이 유지됨
+        autocommit = dbapi_connection.autocommit
+        dbapi_connection.autocommit = True
+        cursor = dbapi_connection.cursor()
+        cursor.execute(f"SET ROLE {db_role}")
+        cursor.close()
+        dbapi_connection.autocommit = autocommit
+
+    return role_engine
+
+
+role_engines = {}
+RoleSessionLocal = {}
+
+if ROLE_POOLS_ENABLED:
+    for staff_role, db_role in ROLE_MAPPING.items():
+        role_engines[db_role] = _create_role_engine(staff_role, db_role)
+        RoleSessionLocal[db_role] = sessionmaker(
+            autocommit=False, autoflush=False, bind=role_engines[db_role], expire_on_commit=False,
+        )
+
+
+@event.listens_for(Session, "after_begin")
+def _apply_session_role(session, transaction, connection):
+    '''
+    기본 모드 세션은 트랜잭션이 시작될 때마다 SET LOCAL ROLE 적용
+    - open_role_session 이 session.info["session_role"] 을 설정한 세션만 해당
+    - AsyncSession 도 내부 동기 Session 의 이벤트로 처리됨
+    '''
+    db_role = session.info.get("session_role")
+    if db_role:
+        connection.exec_driver_sql(f"SET LOCAL ROLE {db_role}")
+
+
+@contextmanager
+def open_role_session(db_role: str, db: Session | None = None) -> Iterator[Session]:
+    '''
+    db_role 권한으로 동작하는 세션을 연다
+
+    - 역할별 풀 모드: 이미 role 이 설정된 풀에서 세션 생성
+    - 기본 모드: 공유 풀 세션(db 또는 새 세션)의 트랜잭션마다 SET LOCAL ROLE
+    - 요청 밖(백그라운드 작업, 스트리밍 등)에서도 사용 가능
+    '''
+    if ROLE_POOLS_ENABLED:
+        role_db = RoleSessionLocal[db_role]()
+        role_db.info["db_role"] = db_role
+        try:
+            yield role_db
+        except Exception as e:
+            role_db.rollback()
+            raise e
+        finally:
+            role_db.close()
+        return
+
+    if db is None:
+        db = SessionLocal()
+
+    try:
+        # 권한 부여: 트랜잭션마다 SET LOCAL ROLE (_apply_session_role)
+        # - 롤백/COMMIT 으로 트랜잭션이 끝나면 role 도 자동 해제 -> RESET ROLE / 추가 COMMIT 불필요
+        # - 역할 조회(staff SELECT)로 이미 열린 트랜잭션에는 여기서 바로 적용
+        db.info["session_role"] = db_role
+        if db.in_transaction():
+            db.execute(text(f"SET LOCAL ROLE {db_role}"))
+        db.info["db_role"] = db_role
+
+        yield db
+
+    except Exception as e:
+        # 로직 수행 중 에러 발생 시 롤백
+        db.rollback()
+        raise e
+
+    finally:
+        db.info.pop("session_role", None)
+        db.info.pop("db_role", None)
+        # close 시 진행 중인 트랜잭션 롤백 -> SET LOCAL ROLE 도 함께 해제된 채로 풀에 반납
+        db.close()
+
+
+def _db_role_for(staff_role: str) -> str:
+    db_role = ROLE_MAPPING.get(staff_role)
+
+    if not db_role:
+        raise HTTPException(status_code=403, detail=f"Role '{staff_role}' is not mapped to a DB role.")
+
+    return db_role
+
+
+def _resolve_identity(x_staff_id: str | None, authorization: str | None) -> tuple[int, str | None]:
+    '''
+    요청 헤더에서 (StaffID, DB Role) 을 구한다 (DB 조회 없음)
+
+    - DB Role 이 None 이면 호출한 쪽에서 staff 테이블을 조회해야 함
+    '''
+    # 1) 로그인 시 발급된 서명 토큰이 있으면 DB 조회 없이 검증
+    if authorization and authorization.startswith("Bearer "):
+        claims = verify_token(authorization[len("Bearer "):])
+        if claims is None:
+            raise HTTPException(status_code=401, detail="Session token is invalid or expired.")
+
+        staff_id, staff_role = claims
+
+        # 토큰과 다른 X-Staff-ID 를 함께 보내는 요청은 거부
+        if x_staff_id and x_staff_id != str(staff_id):
+            raise HTTPException(status_code=401, detail="X-Staff-ID does not match the session token.")
+
+        return staff_id, _db_role_for(staff_role)
+
+    # 2) 토큰이 없으면 기존 X-Staff-ID 헤더 방식
+    if not x_staff_id or not x_staff_id.isdigit():
+        raise HTTPException(status_code=401, detail="X-Staff-ID header is missing or invalid.")
+
+    staff_id = int(x_staff_id)
+
+    # 캐시에 있으면 staff 조회 생략
+    return staff_id, staff_role_cache.get(staff_id)
+
+
 # 권한이 설정된 DB 세션 의존성 함수
 def get_authorized_db(
     x_staff_id: str | None = Header(default=None, alias="x-staff-id"),
+    authorization: str | None = Header(default=None),
     db: Session = Depends(get_db)
 ):
-    if not x_staff_id or not x_staff_id.isdigit():
-        raise HTTPException(status_code=401, detail="X-Staff-ID header is missing or invalid.")
+    staff_id, db_role = _resolve_identity(x_staff_id, authorization)
 
-    staff_id = int(x_staff_id)
+    if db_role is None:
+        from backend.models.staff import Staff
+        staff = db.query(Staff).filter(Staff.StaffID == staff_id).first()
+
+        if not staff:
+            raise HTTPException(status_code=401, detail="Invalid Staff ID.")
 
-    from backend.models.staff import Staff
-    staff = db.query(Staff).filter(Staff.StaffID == staff_id).first()
+        db_role = _db_role_for(staff.Role)
+        staff_role_cache.set(staff_id, db_role)
 
-    if not staff:
-        raise HTTPException(status_code=401, detail="Invalid Staff ID.")
+    if ROLE_POOLS_ENABLED:
+        # 조회용 공유 커넥션은 바로 반납하고 역할 풀의 세션만 사용
+        db.close()
+        db = None
 
-    db_role = ROLE_MAPPING.get(staff.Role)
+    with open_role_session(db_role, db) as role_db:
+        role_db.info["staff_id"] = staff_id
+        yield role_db
 
-    if not db_role:
-        raise HTTPException(status_code=403, detail=f"Role '{staff.Role}' is not mapped to a DB role.")
+
+# ---------------------------------------------------------
+# 비동기 엔진 (ASYNC_DB=1)
+# - I/O 위주 조회 API 용 AsyncSession (asyncpg 드라이버)
+# - ASYNC_DATABASE_URL 이 없으면 DATABASE_URL 의 드라이버만 asyncpg 로 교체
+# - 권한은 동기 세션과 같이 트랜잭션마다 SET LOCAL ROLE 로 부여
+# ---------------------------------------------------------
+ASYNC_DB_ENABLED = os.getenv("ASYNC_DB", "0") == "1"
+
+async_engine = None
+AsyncSessionLocal = None
+
+if ASYNC_DB_ENABLED:
+    ASYNC_DATABASE_URL = os.getenv("ASYNC_DATABASE_URL") or (
+        make_url(DATABASE_URL)
+        .set(drivername="postgresql+asyncpg")
+        .render_as_string(hide_password=False)
+    )
+    async_engine = create_async_engine(ASYNC_DATABASE_URL)
+    instrument_engine(async_engine.sync_engine, "async")
+    AsyncSessionLocal = async_sessionmaker(async_engine, autoflush=False, expire_on_commit=False)
+
+
+# 비동기 FastAPI 의존성 주입 함수
+async def get_async_db():
+    if AsyncSessionLocal is None:
+        raise HTTPException(status_code=503, detail="Async database engine is not enabled (ASYNC_DB=1).")
+
+    async with AsyncSessionLocal() as db:
+        yield db
+
+
+# 권한이 설정된 비동기 DB 세션 의존성 함수
+async def get_async_authorized_db(
+    x_staff_id: str | None = Header(default=None, alias="x-staff-id"),
+    authorization: str | None = Header(default=None),
+    db: AsyncSession = Depends(get_async_db)
+):
+    staff_id, db_role = _resolve_identity(x_staff_id, authorization)
+
+    if db_role is None:
+        from backend.models.staff import Staff
+        staff_role = (
+            await db.execute(select(Staff.Role).where(Staff.StaffID == staff_id))
+        ).scalar()
+
+        if staff_role is None:
+            raise HTTPException(status_code=401, detail="Invalid Staff ID.")
+
+        db_role = _db_role_for(staff_role)
+        staff_role_cache.set(staff_id, db_role)
 
     try:
-        # 권한 부여
-        db.execute(text(f"SET ROLE {db_role}"))
-        
+        # 권한 부여: 동기 세션과 같이 트랜잭션마다 SET LOCAL ROLE (_apply_session_role)
+        db.info["session_role"] = db_role
+        if db.in_transaction():
+            await db.execute(text(f"SET LOCAL ROLE {db_role}"))
+        db.info["db_role"] = db_role
+        db.info["staff_id"] = staff_id
+
         yield db
 
     except Exception as e:
-        # 로직 수행 중 에러 발생 시 롤백
-        db.rollback()
+        await db.rollback()
         raise e
 
     finally:
-        try:
-            db.execute(text("RESET ROLE"))
-        except Exception:
-            db.rollback()
-        db.close()
\ No newline at end of file
+        db.info.pop("session_role", None)
+        db.info.pop("db_role", None)
@@ -1,34 +1,27 @@
 from fastapi import FastAPI
 from contextlib import asynccontextmanager
 
-from backend.database import Base, engine, SessionLocal
-from backend.utils.seed import (seed_raw_materials, seed_finished_goods, 
-                                seed_gift_bom, seed_reindeer, create_ready_reindeer_view, 
-                                seed_child_status_codes, seed_delivery_status_codes,
-                                seed_staff,seed_child,seed_regions)
-                     
-from backend.models import (gift, child, reindeer, delivery_log, delivery_group, region)
-from backend.utils.permissions import apply_permissions
+from backend.database import ASYNC_DB_ENABLED, async_engine
+from backend.services.jobs import recover_jobs, shutdown_jobs
+from backend.utils.bootstrap import run_bootstrap
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
-    Base.metadata.create_all(bind=engine)
-    seed_regions()
-    seed_finished_goods()
-    seed_raw_materials()
-    seed_gift_bom()
-    seed_reindeer()
-    create_ready_reindeer_view()
-    seed_child_status_codes()
-    seed_delivery_status_codes()
-    seed_staff() 
-    seed_child() 
-
-    apply_permissions(engine)
+    # 테이블 생성 + 시드 + VIEW + 권한 적용
+    # (FAST_START=1 이면 스키마/시드/권한 SQL 이 그대로일 때 생략)
+    run_bootstrap()
+
+    # 이전 실행에서 남은 백그라운드 작업 정리 / 재등록
+    recover_jobs()
     
     yield 
     print("Shutting down...")
 
+    shutdown_jobs()
+
+    if async_engine is not None:
+        await async_engine.dispose()
+
 app = FastAPI(lifespan=lifespan)
 
 # --- Routers ---
@@ -36,7 +29,8 @@ from backend.routers import (gift, production, reindeer,
                              list_elf_child, child_status_code, 
                              delivery_status_code,list_elf_stats,
                              staff, list_elf_rules, santa_view,
-                             santa, delivery_log, region, auth)
+                             santa, delivery_log, region, auth, internal,
+                             jobs)
 app.include_router(gift.router)
 app.include_router(production.router)
 app.include_router(reindeer.router)
@@ -51,6 +45,13 @@ app.include_router(list_elf_rules.router)
 app.include_router(santa_view.router)
 app.include_router(region.router)
 app.include_router(auth.router)
+app.include_router(internal.router)
+app.include_router(jobs.router)
+
+# 비동기 조회 API (/async/...) - ASYNC_DB=1 일 때만 등록
+if ASYNC_DB_ENABLED:
+    from backend.routers import async_read
+    app.include_router(async_read.router)
 
 from fastapi.staticfiles import StaticFiles
 app.mount("/", StaticFiles(directory="frontend", html=True), name="frontend")
@@ -0,0 +1,130 @@
+'''
+버전 관리형 마이그레이션
+
+- backend/migrations/versions/m<버전>_<설명>.py 파일 하나가 마이그레이션 하나
+    VERSION: int            적용 순서 (schema_migrations.version)
+    DESCRIPTION: str        설명
+    TRANSACTIONAL: bool     False 면 AUTOCOMMIT 으로 실행 (CREATE INDEX CONCURRENTLY 등)
+    upgrade(conn)           실제 변경 (재실행해도 안전하게 IF NOT EXISTS 사용)
+- 적용 이력은 schema_migrations 테이블에 기록하고, 아직 적용되지 않은 버전만 실행
+'''
+import importlib
+import pkgutil
+
+from sqlalchemy import text
+from sqlalchemy.engine import Connection, Engine
+
+# 여러 워커/CLI 가 동시에 마이그레이션하지 않도록 하는 advisory lock 키
+MIGRATION_LOCK_KEY = 72_012_252
+
+
+def discover_migrations() -> list:
+    '''
+    versions 패키지 안의 마이그레이션 모듈을 VERSION 순으로 반환
+    '''
+    from backend.migrations import versions
+
+    modules = [
+        importlib.import_module(f"{versions.__name__}.{info.name}")
+        for info in pkgutil.iter_modules(versions.__path__)
+        if info.name.startswith("m")
+    ]
+    modules.sort(key=lambda m: m.VERSION)
+
+    seen = set()
+    for m in modules:
+        if m.VERSION in seen:
+            raise RuntimeError(f"중복된 마이그레이션 버전: {m.VERSION}")
+        seen.add(m.VERSION)
+
+    return modules
+
+
+def _ensure_version_table(conn: Connection) -> None:
+    conn.execute(text('''
+        CREATE TABLE IF NOT EXISTS schema_migrations (
+            version     INTEGER PRIMARY KEY,
+            description VARCHAR NOT NULL,
+            applied_at  TIMESTAMPTZ NOT NULL DEFAULT now()
+        )
+    '''))
+
+
+def applied_versions(engine: Engine) -> set[int]:
+    with engine.begin() as conn:
+        _ensure_version_table(conn)
+        return {v for (v,) in conn.execute(text("SELECT version FROM schema_migrations"))}
+
+
+def _record(conn: Connection, migration) -> None:
+    conn.execute(
+        text("INSERT INTO schema_migrations (version, description) VALUES (:v, :d)"),
+        {"v": migration.VERSION, "d": migration.DESCRIPTION},
+    )
+
+
+def run_migrations(engine: Engine) -> list[int]:
+    '''
+    아직 적용되지 않은 마이그레이션을 순서대로 실행하고 적용한 버전 목록 반환
+    '''
+    applied_now = []
+
+    with engine.connect() as lock_conn:
+        lock_conn.execute(text("SELECT pg_advisory_lock(:key)"), {"key": MIGRATION_LOCK_KEY})
+        lock_conn.commit()
+
+        try:
+            done = applied_versions(engine)
+
+            for migration in discover_migrations():
+                if migration.VERSION in done:
+                    continue
+
+                print(f"migration {migration.VERSION}: {migration.DESCRIPTION}")
+
+                if getattr(migration, "TRANSACTIONAL", True):
+                    with engine.begin() as conn:
+                        migration.upgrade(conn)
+                        _record(conn, migration)
+                else:
+                    with engine.connect() as conn:
+                        conn = conn.execution_options(isolation_level="AUTOCOMMIT")
+                        migration.upgrade(conn)
+                        _record(conn, migration)
+
+                applied_now.append(migration.VERSION)
+
+        finally:
+            lock_conn.execute(text("SELECT pg_advisory_unlock(:key)"), {"key": MIGRATION_LOCK_KEY})
+            lock_conn.commit()
+
+    return applied_now
+
+
+def create_index_concurrently(conn: Connection, name: str, table: str, columns: str,
+                              where: str | None = None, using: str | None = None) -> None:
+    '''
+    CREATE INDEX CONCURRENTLY IF NOT EXISTS (AUTOCOMMIT 커넥션에서 호출)
+
+    - 이전에 실패해서 INVALID 상태로 남은 같은 이름의 인덱스는 먼저 삭제 후 재생성
+    - table / columns / where 는 따옴표까지 포함한 SQL 조각
+    '''
+    invalid = conn.execute(
+        text('''
+            SELECT 1
+            FROM pg_index i
+            JOIN pg_class c ON c.oid = i.indexrelid
+            WHERE c.relname = :name AND NOT i.indisvalid
+        '''),
+        {"name": name},
+    ).first()
+    if invalid:
+        conn.execute(text(f'DROP INDEX CONCURRENTLY IF EXISTS "{name}"'))
+
+    sql = f'CREATE INDEX CONCURRENTLY IF NOT EXISTS "{name}" ON {table}'
+    if using:
+        sql += f" USING {using}"
+    sql += f" ({columns})"
+    if where:
+        sql += f" WHERE {where}"
+    conn.execute(text(sql))
@@ -0,0 +1,30 @@
+'''
+마이그레이션 CLI
+
+사용법:
+    python -m backend.migrations           # 미적용 마이그레이션 실행
+    python -m backend.migrations --status  # 적용 현황만 출력
+'''
+import argparse
+
+from backend.database import engine
+from backend.migrations import applied_versions, discover_migrations, run_migrations
+
+
+def main():
+    parser = argparse.ArgumentParser(description="SCDMS schema migrations")
+    parser.add_argument("--status", action="store_true", help="적용 현황만 출력")
+    args = parser.parse_args()
+
+    if not args.status:
+        applied = run_migrations(engine)
+        print(f"적용한 마이그레이션: {applied or '없음'}")
+
+    done = applied_versions(engine)
+    for migration in discover_migrations():
+        mark = "x" if migration.VERSION in done else " "
+        print(f"[{mark}] {migration.VERSION:04d} {migration.DESCRIPTION}")
+
+
+if __name__ == "__main__":
+    main()
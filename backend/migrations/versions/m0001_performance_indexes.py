@@ -0,0 +1,35 @@
+from backend.migrations import create_index_concurrently
+
+VERSION = 1
+DESCRIPTION = "hot filter column indexes"
+
+# CREATE INDEX CONCURRENTLY 는 트랜잭션 안에서 실행할 수 없음
+TRANSACTIONAL = False
+
+INDEXES = [
+    # (인덱스 이름, 테이블, 컬럼)
+    ("ix_child_status_code", "child", '"StatusCode"'),
+    ("ix_child_delivery_status_code", "child", '"DeliveryStatusCode"'),
+    ("ix_child_region_id", "child", '"RegionID"'),
+    ("ix_wishlist_child_id_priority", "wishlist", '"ChildID", "Priority"'),
+    ("ix_wishlist_gift_id", "wishlist", '"GiftID"'),
+    ("ix_delivery_group_item_child_id", "delivery_group_item", "child_id"),
+    ("ix_delivery_group_item_group_id", "delivery_group_item", "group_id"),
+    ("ix_delivery_log_delivery_timestamp", "delivery_log", "delivery_timestamp"),
+    ("ix_production_log_timestamp", '"Production_Log"', "timestamp"),
+    ("ix_reindeer_health_log_reindeer_id", "reindeer_health_log", "reindeer_id, log_timestamp"),
+]
+
+
+def upgrade(conn):
+    for name, table, columns in INDEXES:
+        create_index_concurrently(conn, name, table, columns)
+
+    # 산타 배송 대상 (NICE + 미배송) 전용 부분 인덱스
+    create_index_concurrently(
+        conn,
+        "ix_child_santa_targets",
+        "child",
+        '"RegionID", "ChildID"',
+        where='"StatusCode" = \'NICE\' AND "DeliveryStatusCode" <> \'DELIVERED\'',
+    )
@@ -0,0 +1,49 @@
+from sqlalchemy import text
+
+VERSION = 2
+DESCRIPTION = "canonical (uppercase) status codes + CHECK constraints"
+
+TRANSACTIONAL = True
+
+# (코드 테이블, child 에서 참조하는 컬럼, CHECK 제약 이름)
+CODE_TABLES = [
+    ("child_status_code", '"StatusCode"', "ck_child_status_code_upper"),
+    ("delivery_status_code", '"DeliveryStatusCode"', "ck_delivery_status_code_upper"),
+]
+
+
+def upgrade(conn):
+    for table, child_column, constraint in CODE_TABLES:
+        # 1) 소문자/혼합 코드의 대문자 버전을 먼저 추가 (FK 가 깨지지 않도록)
+        conn.execute(text(f'''
+            INSERT INTO {table} ("Code", "Description")
+            SELECT DISTINCT ON (upper("Code")) upper("Code"), "Description"
+            FROM {table}
+            WHERE "Code" <> upper("Code")
+            ORDER BY upper("Code"), "Code"
+            ON CONFLICT ("Code") DO NOTHING
+        '''))
+
+        # 2) child 값 backfill
+        conn.execute(text(f'''
+            UPDATE child
+               SET {child_column} = upper({child_column})
+             WHERE {child_column} <> upper({child_column})
+        '''))
+
+        # 3) 더 이상 참조되지 않는 비정규 코드 삭제
+        conn.execute(text(f'DELETE FROM {table} WHERE "Code" <> upper("Code")'))
+
+        # 4) 코드 테이블에 대문자만 허용
+        #    (child 컬럼은 FK 로 이 테이블만 참조하므로 따로 제약 불필요)
+        conn.execute(text(f'''
+            DO $$
+            BEGIN
+                IF NOT EXISTS (SELECT 1 FROM pg_constraint WHERE conname = '{constraint}') THEN
+                    ALTER TABLE {table}
+                        ADD CONSTRAINT {constraint} CHECK ("Code" = upper("Code")) NOT VALID;
+                END IF;
+            END
+            $$;
+        '''))
+        conn.execute(text(f"ALTER TABLE {table} VALIDATE CONSTRAINT {constraint}"))
@@ -0,0 +1,19 @@
+from backend.migrations import create_index_concurrently
+
+VERSION = 3
+DESCRIPTION = "upper() expression indexes on child status columns"
+
+# CREATE INDEX CONCURRENTLY 는 트랜잭션 안에서 실행할 수 없음
+TRANSACTIONAL = False
+
+# 전환 기간 동안 upper(...) 로 조회하는 구버전 코드/수동 쿼리용
+# (현재 코드는 일반 인덱스 ix_child_status_code 등으로 동등 비교)
+INDEXES = [
+    ("ix_child_status_code_upper", "child", 'upper("StatusCode")'),
+    ("ix_child_delivery_status_code_upper", "child", 'upper("DeliveryStatusCode")'),
+]
+
+
+def upgrade(conn):
+    for name, table, columns in INDEXES:
+        create_index_concurrently(conn, name, table, columns)
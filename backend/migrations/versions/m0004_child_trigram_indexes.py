@@ -0,0 +1,22 @@
+from sqlalchemy import text
+
+from backend.migrations import create_index_concurrently
+
+VERSION = 4
+DESCRIPTION = "pg_trgm GIN indexes on child name/address"
+
+# CREATE INDEX CONCURRENTLY 는 트랜잭션 안에서 실행할 수 없음
+TRANSACTIONAL = False
+
+INDEXES = [
+    ("ix_child_name_trgm", "child", '"Name" gin_trgm_ops'),
+    ("ix_child_address_trgm", "child", '"Address" gin_trgm_ops'),
+]
+
+
+def upgrade(conn):
+    # pg_trgm 은 PostgreSQL 13+ 에서 trusted extension (DB 소유자면 생성 가능)
+    conn.execute(text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
+
+    for name, table, columns in INDEXES:
+        create_index_concurrently(conn, name, table, columns, using="gin")
@@ -0,0 +1,139 @@
+from sqlalchemy import text
+
+VERSION = 5
+DESCRIPTION = "santa_target_summary read model + child triggers"
+
+TRANSACTIONAL = True
+
+# 배송 대상 조건 (santa_view.santa_targets_query 와 동일)
+TARGET = '"StatusCode" = \'NICE\' AND "DeliveryStatusCode" <> \'DELIVERED\''
+
+
+def upgrade(conn):
+    conn.execute(text('''
+        CREATE TABLE IF NOT EXISTS santa_target_summary (
+            region_id    INTEGER PRIMARY KEY,
+            target_count BIGINT NOT NULL DEFAULT 0,
+            updated_at   TIMESTAMPTZ NOT NULL DEFAULT now()
+        )
+    '''))
+
+    # 증감분 반영 함수 (문장 단위 트리거에서 지역별로 한 번씩 UPSERT)
+    # - SECURITY DEFINER: child 를 수정하는 역할에 summary 쓰기 권한을 주지 않기 위함
+    # - 지역 ID 순서로 갱신해서 동시 트랜잭션 간 교착 방지
+    conn.execute(text(f'''
+        CREATE OR REPLACE FUNCTION santa_target_summary_apply()
+        RETURNS trigger
+        LANGUAGE plpgsql
+        SECURITY DEFINER
+        SET search_path = public
+        AS $$
+        BEGIN
+            IF TG_OP = 'INSERT' THEN
+                INSERT INTO santa_target_summary AS s (region_id, target_count)
+                SELECT "RegionID", count(*) FROM new_rows WHERE {TARGET}
+                GROUP BY "RegionID" ORDER BY "RegionID"
+                ON CONFLICT (region_id) DO UPDATE
+                   SET target_count = s.target_count + EXCLUDED.target_count,
+                       updated_at = now();
+
+            ELSIF TG_OP = 'DELETE' THEN
+                INSERT INTO santa_target_summary AS s (region_id, target_count)
+                SELECT "RegionID", -count(*) FROM old_rows WHERE {TARGET}
+                GROUP BY "RegionID" ORDER BY "RegionID"
+                ON CONFLICT (region_id) DO UPDATE
+                   SET target_count = s.target_count + EXCLUDED.target_count,
+                       updated_at = now();
+
+            ELSE
+                INSERT INTO santa_target_summary AS s (region_id, target_count)
+                SELECT region_id, sum(delta) FROM (
+                    SELECT "RegionID" AS region_id, 1 AS delta FROM new_rows WHERE {TARGET}
+                    UNION ALL
+                    SELECT "RegionID", -1 FROM old_rows WHERE {TARGET}
+                ) d
+                GROUP BY region_id
+                HAVING sum(delta) <> 0
+                ORDER BY region_id
+                ON CONFLICT (region_id) DO UPDATE
+                   SET target_count = s.target_count + EXCLUDED.target_count,
+                       updated_at = now();
+            END IF;
+
+            RETURN NULL;
+        END
+        $$
+    '''))
+
+    # 복구용 전체 재계산 (child 쓰기를 막고 다시 집계)
+    conn.execute(text(f'''
+        CREATE OR REPLACE FUNCTION santa_target_summary_rebuild()
+        RETURNS bigint
+        LANGUAGE plpgsql
+        SECURITY DEFINER
+        SET search_path = public
+        AS $$
+        DECLARE
+            total bigint;
+        BEGIN
+            LOCK TABLE child IN SHARE MODE;
+            LOCK TABLE santa_target_summary IN EXCLUSIVE MODE;
+
+            DELETE FROM santa_target_summary;
+
+            INSERT INTO santa_target_summary (region_id, target_count)
+            SELECT "RegionID", count(*) FROM child WHERE {TARGET}
+            GROUP BY "RegionID";
+
+            SELECT COALESCE(sum(target_count), 0) INTO total FROM santa_target_summary;
+            RETURN total;
+        END
+        $$
+    '''))
+
+    conn.execute(text('''
+        CREATE OR REPLACE FUNCTION santa_target_summary_truncate()
+        RETURNS trigger
+        LANGUAGE plpgsql
+        SECURITY DEFINER
+        SET search_path = public
+        AS $$
+        BEGIN
+            DELETE FROM santa_target_summary;
+            RETURN NULL;
+        END
+        $$
+    '''))
+
+    # 전이 테이블(REFERENCING)은 트리거마다 하나의 이벤트만 가능
+    conn.execute(text("DROP TRIGGER IF EXISTS trg_santa_target_summary_ins ON child"))
+    conn.execute(text("DROP TRIGGER IF EXISTS trg_santa_target_summary_upd ON child"))
+    conn.execute(text("DROP TRIGGER IF EXISTS trg_santa_target_summary_del ON child"))
+    conn.execute(text("DROP TRIGGER IF EXISTS trg_santa_target_summary_trunc ON child"))
+
+    conn.execute(text('''
+        CREATE TRIGGER trg_santa_target_summary_ins
+        AFTER INSERT ON child
+        REFERENCING NEW TABLE AS new_rows
+        FOR EACH STATEMENT EXECUTE FUNCTION santa_target_summary_apply()
+    '''))
+    conn.execute(text('''
+        CREATE TRIGGER trg_santa_target_summary_upd
+        AFTER UPDATE ON child
+        REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows
+        FOR EACH STATEMENT EXECUTE FUNCTION santa_target_summary_apply()
+    '''))
+    conn.execute(text('''
+        CREATE TRIGGER trg_santa_target_summary_del
+        AFTER DELETE ON child
+        REFERENCING OLD TABLE AS old_rows
+        FOR EACH STATEMENT EXECUTE FUNCTION santa_target_summary_apply()
+    '''))
+    conn.execute(text('''
+        CREATE TRIGGER trg_santa_target_summary_trunc
+        AFTER TRUNCATE ON child
+        FOR EACH STATEMENT EXECUTE FUNCTION santa_target_summary_truncate()
+    '''))
+
+    # 기존 데이터로 초기 집계
+    conn.execute(text("SELECT santa_target_summary_rebuild()"))
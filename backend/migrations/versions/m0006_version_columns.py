@@ -0,0 +1,18 @@
+from sqlalchemy import text
+
+VERSION = 6
+DESCRIPTION = "version_id columns for optimistic concurrency (stock / reindeer)"
+
+TRANSACTIONAL = True
+
+# 모델의 version_id_col 과 같은 컬럼
+# - 상수 DEFAULT 라서 PostgreSQL 11+ 에서는 테이블 재작성 없이 바로 추가됨
+TABLES = ['"Raw_Materials"', '"Finished_Goods"', "reindeer"]
+
+
+def upgrade(conn):
+    for table in TABLES:
+        conn.execute(text(f'''
+            ALTER TABLE {table}
+            ADD COLUMN IF NOT EXISTS version_id INTEGER NOT NULL DEFAULT 1
+        '''))
@@ -0,0 +1,30 @@
+from sqlalchemy import text
+
+from backend.migrations import create_index_concurrently
+
+VERSION = 7
+DESCRIPTION = "GiST trigram (KNN) + lower() prefix indexes for child search"
+
+# CREATE/DROP INDEX CONCURRENTLY 는 트랜잭션 안에서 실행할 수 없음
+TRANSACTIONAL = False
+
+INDEXES = [
+    # 3자 이상: ILIKE / % 조건 + <-> 거리순 정렬을 한 번의 인덱스 스캔으로 (LIMIT 에서 멈춤)
+    ("ix_child_name_trgm_gist", "child", '"Name" gist_trgm_ops', "gist"),
+    ("ix_child_address_trgm_gist", "child", '"Address" gist_trgm_ops', "gist"),
+    # 1~2자: trigram 이 없으므로 소문자 접두어 btree 범위 스캔
+    # (COLLATE "C" -> LIKE 'ab%' 범위 조건과 ORDER BY 모두 같은 인덱스 사용)
+    ("ix_child_name_lower_prefix", "child", 'lower("Name") COLLATE "C"', None),
+    ("ix_child_address_lower_prefix", "child", 'lower("Address") COLLATE "C"', None),
+]
+
+# GiST 인덱스가 같은 조건(ILIKE / %)을 처리하므로 m0004 의 GIN 인덱스는 제거 (쓰기 비용 절감)
+DROPPED = ["ix_child_name_trgm", "ix_child_address_trgm"]
+
+
+def upgrade(conn):
+    for name, table, columns, using in INDEXES:
+        create_index_concurrently(conn, name, table, columns, using=using)
+
+    for name in DROPPED:
+        conn.execute(text(f'DROP INDEX CONCURRENTLY IF EXISTS "{name}"'))
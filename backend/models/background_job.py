@@ -0,0 +1,40 @@
+from sqlalchemy import Column, DateTime, Integer, String, func
+from sqlalchemy.dialects.postgresql import JSONB
+
+from backend.database import Base
+
+
+class BackgroundJob(Base):
+    '''
+    백그라운드 작업 (배송 실행, 대량 등록 등)
+
+    - status: QUEUED -> RUNNING -> SUCCEEDED / FAILED
+    - progress_done / progress_total: 진행률 (작업 종류마다 단위가 다름)
+    - 실행은 backend/services/jobs.py 의 워커 풀이 담당
+    '''
+    __tablename__ = "background_job"
+
+    job_id = Column(Integer, primary_key=True, index=True)
+
+    # 작업 종류 (services/jobs.py 에 등록된 이름)
+    kind = Column(String, nullable=False)
+
+    status = Column(String, nullable=False, default="QUEUED")
+
+    params = Column(JSONB, nullable=False, default=dict)
+    result = Column(JSONB, nullable=True)
+    error = Column(String, nullable=True)
+
+    progress_done = Column(Integer, nullable=False, default=0)
+    progress_total = Column(Integer, nullable=True)
+
+    # 요청한 사람 / 작업을 실행할 DB Role
+    created_by_staff_id = Column(Integer, nullable=True)
+    db_role = Column(String, nullable=False)
+
+    created_at = Column(DateTime(timezone=True), nullable=False, server_default=func.now())
+    started_at = Column(DateTime(timezone=True), nullable=True)
+    finished_at = Column(DateTime(timezone=True), nullable=True)
+
+    # RUNNING 작업의 마지막 진행 보고 시각 (오래 멈춘 작업 정리용)
+    heartbeat_at = Column(DateTime(timezone=True), nullable=True)
@@ -9,6 +9,10 @@ class RawMaterial(Base):
     material_id = Column(Integer, primary_key=True, index=True)
     material_name = Column(String, unique=True, nullable=False)
     stock_quantity = Column(Integer, default=0)
+
+    # 낙관적 동시성 제어: UPDATE 마다 +1, 읽은 뒤 다른 트랜잭션이 바꿨으면 StaleDataError
+    version_id = Column(Integer, nullable=False, server_default="1")
+    __mapper_args__ = {"version_id_col": version_id}
     
     # GiftBOM에서 재료 역관계 참조 -> 재료가 어디 레시피에 쓰이는지 보고 싶을 때
     boms = relationship("GiftBOM", back_populates="input_material")
@@ -22,6 +26,10 @@ class FinishedGoods(Base):
     gift_id = Column(Integer, primary_key=True, index=True)
     gift_name = Column(String, nullable=False)
     stock_quantity = Column(Integer, default=0)
+
+    # 낙관적 동시성 제어 (RawMaterial 과 동일)
+    version_id = Column(Integer, nullable=False, server_default="1")
+    __mapper_args__ = {"version_id_col": version_id}
     
     # GiftBOM에서 선물 역관계 참조 -> 선물을 만들 때 쓰이는 레시피가 보고 싶을 때
     boms = relationship("GiftBOM", back_populates="output_gift")
@@ -0,0 +1,28 @@
+from sqlalchemy import Column, DateTime, Integer, String, func
+from sqlalchemy.dialects.postgresql import JSONB
+
+from backend.database import Base
+
+
+class IdempotencyKey(Base):
+    '''
+    Idempotency-Key 헤더로 받은 요청의 처리 결과
+
+    - (staff_id, idem_key) 가 PK -> 재전송 요청은 PK 조회 1번으로 저장된 응답 반환
+    - 행은 변경과 같은 트랜잭션에서 COMMIT 직전에 INSERT (처리 중 표시는 advisory lock)
+    - expires_at 이 지난 행은 만료 (같은 키로 다시 실행 가능, 주기적으로 삭제)
+    - 조회/저장은 요청 세션(DB Role), 만료 행 삭제는 서버(소유자 계정) 세션
+    '''
+    __tablename__ = "idempotency_key"
+
+    staff_id = Column(Integer, primary_key=True)
+    idem_key = Column(String(255), primary_key=True)
+
+    # 요청 fingerprint (메서드 + 경로 + 본문 JSON 의 sha256, hex)
+    request_hash = Column(String(64), nullable=False)
+
+    status_code = Column(Integer, nullable=True)
+    response = Column(JSONB, nullable=True)
+
+    created_at = Column(DateTime(timezone=True), nullable=False, server_default=func.now())
+    expires_at = Column(DateTime(timezone=True), nullable=False, index=True)
@@ -12,6 +12,10 @@ class Reindeer(Base):
 
     # READY / RESTING / ONDELIVERY
     status = Column(String, nullable=False, default="READY")
+
+    # 낙관적 동시성 제어 (stamina/magic 동시 수정 시 lost update 방지)
+    version_id = Column(Integer, nullable=False, server_default="1")
+    __mapper_args__ = {"version_id_col": version_id}
     
 class ReindeerHealthLog(Base):
     __tablename__ = "reindeer_health_log"
@@ -0,0 +1,17 @@
+from sqlalchemy import BigInteger, Column, DateTime, Integer, func
+
+from backend.database import Base
+
+
+class SantaTargetSummary(Base):
+    '''
+    지역별 배송 대상(NICE + 미배송) 아이 수 읽기 모델
+
+    - child 테이블의 statement-level 트리거가 증감분만 반영 (migration 0005)
+    - 직접 수정하지 않음, 복구는 python -m backend.scripts.rebuild_target_summary
+    '''
+    __tablename__ = "santa_target_summary"
+
+    region_id = Column(Integer, primary_key=True)
+    target_count = Column(BigInteger, nullable=False, default=0)
+    updated_at = Column(DateTime(timezone=True), nullable=False, server_default=func.now())
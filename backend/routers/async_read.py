@@ -0,0 +1,242 @@
+from typing import List
+
+from fastapi import APIRouter, Depends, Query, Response
+from sqlalchemy import select, func, case
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
+
+from backend.database import get_async_authorized_db
+from backend.models.child import Child, Wishlist
+from backend.models.delivery_log import DeliveryLog
+from backend.models.gift import FinishedGoods
+from backend.routers.list_elf_child import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE
+from backend.routers.santa_view import MAX_TARGET_PAGE_SIZE, TARGET_FIELDS, santa_targets_query
+from backend.schemas.child_schema import ChildFullOut, WishlistItemOut
+from backend.schemas.delivery_log import DeliveryLogListItemResponse
+from backend.schemas.santa_schema import SantaTargetOut
+from backend.schemas.stat_schema import GiftDemandOut, PriorityTop3, PriorityGroupOut
+
+# 조회 위주 API 의 비동기 버전 (ASYNC_DB=1 일 때만 등록)
+# - 동기 버전과 같은 경로에 /async 접두사를 붙여 제공
+router = APIRouter(
+    prefix="/async",
+    tags=["Async"],
+)
+
+
+# GET /async/list-elf/child/all
+@router.get("/list-elf/child/all", response_model=list[ChildFullOut])
+async def get_all_children(
+    response: Response,
+    cursor: int | None = None,
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    region_id: int | None = None,
+    status_code: str | None = None,
+    delivery_status_code: str | None = None,
+    db: AsyncSession = Depends(get_async_authorized_db),
+):
+    '''
+    /list-elf/child/all 비동기 버전
+    - 파라미터/X-Next-Cursor 헤더는 동기 버전과 동일
+    - wishlist 는 selectinload 로 한 번에 조회 (비동기 세션은 lazy load 불가)
+    '''
+    query = (
+        select(Child)
+        .options(selectinload(Child.wishlist_items))
+        .order_by(Child.ChildID.asc())
+    )
+
+    if cursor is not None:
+        query = query.where(Child.ChildID > cursor)
+    if region_id is not None:
+        query = query.where(Child.RegionID == region_id)
+    if status_code:
+        query = query.where(Child.StatusCode == status_code.upper())
+    if delivery_status_code:
+        query = query.where(Child.DeliveryStatusCode == delivery_status_code.upper())
+    query = query.limit(limit + 1)
+
+    children = (await db.execute(query)).scalars().all()
+
+    if len(children) > limit:
+        children = children[:limit]
+        response.headers["X-Next-Cursor"] = str(children[-1].ChildID)
+
+    return [
+        ChildFullOut(
+            child_id=c.ChildID,
+            name=c.Name,
+            address=c.Address,
+            region_id=c.RegionID,
+            status_code=c.StatusCode,
+            delivery_status_code=c.DeliveryStatusCode,
+            child_note=c.ChildNote,
+            wishlist=[
+                WishlistItemOut(
+                    wishlist_id=w.WishlistID,
+                    gift_id=w.GiftID,
+                    priority=w.Priority
+                )
+                for w in c.wishlist_items
+            ]
+        )
+        for c in children
+    ]
+
+
+# GET /async/santa/targets
+@router.get("/santa/targets", response_model=list[SantaTargetOut])
+async def get_santa_targets(
+    response: Response,
+    region_id: int | None = None,
+    cursor: int | None = None,
+    limit: int | None = Query(None, ge=1, le=MAX_TARGET_PAGE_SIZE),
+    db: AsyncSession = Depends(get_async_authorized_db),
+):
+    '''
+    /santa/targets 비동기 버전
+    - 동기 버전과 같은 쿼리 (지역명은 regions 와 JOIN 해서 한 번에 조회)
+    - cursor/limit, X-Next-Cursor 헤더는 동기 버전과 동일 (fields 는 미지원)
+    '''
+    query = santa_targets_query(list(TARGET_FIELDS), region_id, cursor)
+    if limit is not None:
+        query = query.limit(limit + 1)
+
+    rows = (await db.execute(query)).mappings().all()
+
+    if limit is not None and len(rows) > limit:
+        rows = rows[:limit]
+        response.headers["X-Next-Cursor"] = str(rows[-1]["child_id"])
+
+    return [SantaTargetOut(**row) for row in rows]
+
+
+# GET /async/delivery-log/
+@router.get("/delivery-log/", response_model=List[DeliveryLogListItemResponse])
+async def list_delivery_logs(
+    limit: int = 100,
+    offset: int = 0,
+    db: AsyncSession = Depends(get_async_authorized_db),
+):
+    '''
+    /delivery-log/ 비동기 버전
+    '''
+    query = (
+        select(
+            DeliveryLog.log_id,
+            DeliveryLog.child_id,
+            Child.Name.label("child_name"),
+            DeliveryLog.gift_id,
+            FinishedGoods.gift_name.label("gift_name"),
+            DeliveryLog.delivered_by_staff_id,
+            DeliveryLog.delivery_timestamp,
+        )
+        .join(Child, DeliveryLog.child_id == Child.ChildID)
+        .join(FinishedGoods, DeliveryLog.gift_id == FinishedGoods.gift_id)
+        .distinct(
+            DeliveryLog.log_id
+        )
+        .order_by(
+            DeliveryLog.log_id,
+            DeliveryLog.delivery_timestamp.desc()
+        )
+        .offset(offset)
+        .limit(limit)
+    )
+
+    rows = (await db.execute(query)).all()
+
+    return [
+        DeliveryLogListItemResponse(
+            log_id=row.log_id,
+            child_id=row.child_id,
+            child_name=row.child_name,
+            gift_id=row.gift_id,
+            gift_name=row.gift_name,
+            delivered_by_staff_id=row.delivered_by_staff_id,
+            delivery_timestamp=row.delivery_timestamp,
+        )
+        for row in rows
+    ]
+
+
+# GET /async/list-elf/stats/gift-demand/summary
+@router.get("/list-elf/stats/gift-demand/summary", response_model=list[GiftDemandOut])
+async def get_gift_demand_summary(db: AsyncSession = Depends(get_async_authorized_db)):
+    '''
+    /list-elf/stats/gift-demand/summary 비동기 버전
+    '''
+    rows = (
+        await db.execute(
+            select(
+                Wishlist.GiftID.label("gift_id"),
+                func.count(Wishlist.GiftID).label("total"),
+                func.sum(case((Wishlist.Priority == 1, 1), else_=0)).label("p1"),
+                func.sum(case((Wishlist.Priority == 2, 1), else_=0)).label("p2"),
+                func.sum(case((Wishlist.Priority == 3, 1), else_=0)).label("p3")
+            )
+            .join(Child, Wishlist.ChildID == Child.ChildID)
+            .where(Child.StatusCode == "NICE")
+            .where(Child.DeliveryStatusCode != "DELIVERED")
+            .group_by(Wishlist.GiftID)
+            .having(func.count(Wishlist.GiftID) > 0)
+            .order_by(func.count(Wishlist.GiftID).desc())
+        )
+    ).all()
+
+    return [
+        GiftDemandOut(
+            gift_id=row.gift_id,
+            count=row.total,
+            p1=row.p1,
+            p2=row.p2,
+            p3=row.p3
+        )
+        for row in rows
+    ]
+
+
+async def get_top3_for_priority(db: AsyncSession, priority: int):
+    '''
+    특정 Priority(1/2/3)에 대해 Top3 선물을 반환하는 내부 함수 (비동기)
+    '''
+    rows = (
+        await db.execute(
+            select(
+                Wishlist.GiftID.label("gift_id"),
+                FinishedGoods.gift_name.label("gift_name"),
+                func.count(Wishlist.GiftID).label("count")
+            )
+            .join(Child, Wishlist.ChildID == Child.ChildID)
+            .join(FinishedGoods, Wishlist.GiftID == FinishedGoods.gift_id)
+            .where(Wishlist.Priority == priority)
+            .where(Child.StatusCode == "NICE")
+            .where(Child.DeliveryStatusCode != "DELIVERED")
+            .group_by(Wishlist.GiftID, FinishedGoods.gift_name)
+            .order_by(func.count(Wishlist.GiftID).desc())
+            .limit(3)
+        )
+    ).all()
+
+    return [
+        PriorityTop3(
+            gift_id=row.gift_id,
+            gift_name=row.gift_name,
+            count=row.count
+        )
+        for row in rows
+    ]
+
+
+# GET /async/list-elf/stats/gift-demand/by-priority
+@router.get("/list-elf/stats/gift-demand/by-priority", response_model=PriorityGroupOut)
+async def get_gift_top3_by_priority(db: AsyncSession = Depends(get_async_authorized_db)):
+    '''
+    /list-elf/stats/gift-demand/by-priority 비동기 버전
+    - 한 세션에서 순서대로 실행 (AsyncSession 은 동시 실행 불가)
+    '''
+    return PriorityGroupOut(
+        priority1=await get_top3_for_priority(db, 1),
+        priority2=await get_top3_for_priority(db, 2),
+        priority3=await get_top3_for_priority(db, 3)
+    )
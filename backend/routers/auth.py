@@ -5,6 +5,7 @@ import bcrypt
 from backend.database import get_db
 from backend.models.staff import Staff
 from backend.schemas.auth import LoginRequest, LoginResponse
+from backend.utils.tokens import issue_token
 
 router = APIRouter(prefix="/auth", tags=["auth"])
 
@@ -30,10 +31,15 @@ def login(payload: LoginRequest, db: Session = Depends(get_db)):
             detail="아이디 또는 비밀번호가 올바르지 않습니다.",
         )
 
-    # 로그인 성공 -> 기본 정보 + Role 반환
+    # 로그인 성공 -> 서명된 세션 토큰 발급 (StaffID + Role + 만료시각)
+    token, expires_at = issue_token(user.StaffID, user.Role)
+
+    # 기본 정보 + Role + 토큰 반환
     return LoginResponse(
         staff_id=user.StaffID,
         username=user.Username,
         name=user.Name,
         role=user.Role,
+        token=token,
+        token_expires_at=expires_at,
     )
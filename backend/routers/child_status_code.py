@@ -20,11 +20,14 @@ def get_codes(db: Session = Depends(get_authorized_db)):
 # 새로운 상태 코드 생성
 @router.post("/", response_model=StatusCodeOut)
 def create_code(payload: StatusCodeCreate, db: Session = Depends(get_authorized_db)):
-    exists = db.query(ChildStatusCode).filter(ChildStatusCode.Code == payload.code).first()
+    # 코드는 항상 대문자로 저장 (조회 시 upper() 없이 인덱스 사용)
+    new_code = payload.code.upper()
+
+    exists = db.query(ChildStatusCode).filter(ChildStatusCode.Code == new_code).first()
     if exists:
         raise HTTPException(409, "Code already exists")
 
-    code = ChildStatusCode(Code=payload.code, Description=payload.description)
+    code = ChildStatusCode(Code=new_code, Description=payload.description)
     db.add(code)
     db.commit()
 
@@ -34,7 +37,7 @@ def create_code(payload: StatusCodeCreate, db: Session = Depends(get_authorized_
 # description 수정
 @router.patch("/{code}", response_model=StatusCodeOut)
 def update_code(code: str, payload: StatusCodeUpdate, db: Session = Depends(get_authorized_db)):
-    row = db.query(ChildStatusCode).filter(ChildStatusCode.Code == code).first()
+    row = db.query(ChildStatusCode).filter(ChildStatusCode.Code == code.upper()).first()
     if not row:
         raise HTTPException(404, "Not found")
 
@@ -47,6 +50,7 @@ def update_code(code: str, payload: StatusCodeUpdate, db: Session = Depends(get_
 # Child가 참조 중이면 삭제 불가
 @router.delete("/{code}")
 def delete_code(code: str, db: Session = Depends(get_authorized_db)):
+    code = code.upper()
 
     # Child.StatusCode에서 참조 중인지 체크
     ref = db.query(func.count(Child.ChildID)).filter(Child.StatusCode == code).scalar()
@@ -33,10 +33,13 @@ def create_code(payload: StatusCodeCreate, db: Session = Depends(get_authorized_
     - code 중복 시 409 Conflict
     """
 
+    # 코드는 항상 대문자로 저장 (조회 시 upper() 없이 인덱스 사용)
+    new_code = payload.code.upper()
+
     # 이미 같은 code가 있는지 확인
     existing = (
         db.query(DeliveryStatusCode)
-        .filter(DeliveryStatusCode.Code == payload.code)
+        .filter(DeliveryStatusCode.Code == new_code)
         .first()
     )
     if existing:
@@ -44,7 +47,7 @@ def create_code(payload: StatusCodeCreate, db: Session = Depends(get_authorized_
 
     # 실제 DB 컬럼 이름: Code / Description (대문자)
     new_row = DeliveryStatusCode(
-        Code=payload.code,
+        Code=new_code,
         Description=payload.description,
     )
 
@@ -65,7 +68,7 @@ def update_code(code: str, payload: StatusCodeUpdate, db: Session = Depends(get_
 
     row = (
         db.query(DeliveryStatusCode)
-        .filter(DeliveryStatusCode.Code == code)
+        .filter(DeliveryStatusCode.Code == code.upper())
         .first()
     )
     if not row:
@@ -87,6 +90,7 @@ def delete_code(code: str, db: Session = Depends(get_authorized_db)):
     배송 상태 코드 삭제
     - 아직 Child.DeliveryStatusCode에서 FK로 참조 중이면 나중에 막을 수도 있음
     """
+    code = code.upper()
 
     row = (
         db.query(DeliveryStatusCode)
@@ -1,10 +1,12 @@
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, Header, HTTPException, Request
 from sqlalchemy.orm import Session
 from typing import List
 
 from backend.database import get_db, get_authorized_db
 from backend.models.gift import RawMaterial, FinishedGoods, GiftBOM
 from backend.schemas.gift import MaterialResponse, MaterialUpdate, Gift, ProduceRequest, GiftRecipeItem
+from backend.utils.idempotency import request_fingerprint, run_idempotent
+from backend.utils.transactions import run_optimistic
 
 router = APIRouter(prefix="/gift", tags=["Gift"])
 
@@ -23,37 +25,42 @@ def get_all_materials(db: Session = Depends(get_authorized_db)):
 # POST /gift/materials/mine
 @router.post("/materials/mine")
 def mine_material(data: MaterialUpdate, db: Session = Depends(get_authorized_db)):
-    material = db.query(RawMaterial).filter_by(material_id=data.material_id).first()
-
-    if not material:
-        raise HTTPException(status_code=404, detail="해당 재료가 존재하지 않습니다.")
-    
-    amount = 1
-    
-    # 최대 재고량 100 체크
-    if material.stock_quantity >= 100:
-        raise HTTPException(
-            status_code=400,
-            detail=f"최대 재고량(100)에 도달하여 더 이상 채굴할 수 없습니다. (현재 재고: {material.stock_quantity})"
-        )
+    """
+    - 재고 읽기/수정은 version_id 로 충돌 검사 (동시에 채굴하면 자동 재시도)
+    """
+    def attempt():
+        material = db.query(RawMaterial).filter_by(material_id=data.material_id).first()
 
-    # 재고 음수 방지
-    new_quantity = material.stock_quantity + amount
-    if new_quantity < 0:
-        raise HTTPException(
-            status_code=400,
-            detail=f"재고 부족으로 인해 재고가 음수가 될 수 없습니다. (현재 재고: {material.stock_quantity})"
-        )
+        if not material:
+            raise HTTPException(status_code=404, detail="해당 재료가 존재하지 않습니다.")
 
-    # 정상 업데이트
-    material.stock_quantity = new_quantity
-    db.commit()
+        amount = 1
 
-    return {
-        "message": "재료 재고 업데이트 완료",
-        "material_id": material.material_id,
-        "stock_quantity": material.stock_quantity
-    }
+        # 최대 재고량 100 체크
+        if material.stock_quantity >= 100:
+            raise HTTPException(
+                status_code=400,
+                detail=f"최대 재고량(100)에 도달하여 더 이상 채굴할 수 없습니다. (현재 재고: {material.stock_quantity})"
+            )
+
+        # 재고 음수 방지
+        new_quantity = material.stock_quantity + amount
+        if new_quantity < 0:
+            raise HTTPException(
+                status_code=400,
+                detail=f"재고 부족으로 인해 재고가 음수가 될 수 없습니다. (현재 재고: {material.stock_quantity})"
+            )
+
+        # 정상 업데이트
+        material.stock_quantity = new_quantity
+
+        return {
+            "message": "재료 재고 업데이트 완료",
+            "material_id": material.material_id,
+            "stock_quantity": material.stock_quantity
+        }
+
+    return run_optimistic(db, "mine_material", attempt)
 
 # 전체 선물 재고 조회
 # GET /gift/
@@ -69,7 +76,12 @@ def get_all_gifts(db: Session = Depends(get_authorized_db)):
 # 선물 생산하여 재고 증가시키기 (레시피 + 재료 재고 체크 + 부족한 재료 반환)
 # POST /gift/produce
 @router.post("/produce")
-def produce_item(data: ProduceRequest, db: Session = Depends(get_authorized_db)):
+def produce_item(
+    data: ProduceRequest,
+    request: Request,
+    db: Session = Depends(get_authorized_db),
+    idempotency_key: str | None = Header(default=None, alias="Idempotency-Key"),
+):
     """
     Gift_BOM 레시피를 사용해 선물 생산을 처리하는 간단 API
 
@@ -79,88 +91,94 @@ def produce_item(data: ProduceRequest, db: Session = Depends(get_authorized_db))
     - Finished_Goods 재고 증가
 
     Production_Log / Production_Usage 기록은 남기지 않음 -> 실제 요정 UI에서 사용할 API는 /production/create
-    """
-
 
-    # 선물 존재 여부 확인
-    good = db.query(FinishedGoods).filter_by(gift_id=data.gift_id).first()
-    if not good:
-        raise HTTPException(status_code=404, detail="해당 선물이 존재하지 않습니다.")
-
-    # 생산 수량 검증
-    if data.produced_quantity <= 0:
-        raise HTTPException(
-            status_code=400,
-            detail="생산 수량은 1 이상이어야 합니다."
-        )
-
-    # 레시피 조회 (GiftBOM)
-    boms = db.query(GiftBOM).filter_by(output_gift_id=data.gift_id).all()
-    if not boms:
-        raise HTTPException(
-            status_code=400,
-            detail="해당 선물에 대한 레시피가 등록되어 있지 않습니다."
-        )
-
-    # 재료 재고 충분한지 먼저 전부 검사
-    shortages = []  # 부족한 재료들
+    Idempotency-Key 헤더를 보내면 재전송 시 다시 생산하지 않고 첫 응답을 그대로 반환
+    """
 
-    for bom in boms:
-        material = (
-            db.query(RawMaterial)
-            .filter_by(material_id=bom.input_material_id)
-            .first()
-        )
+    # 재고 읽기 -> 검사 -> 차감/증가 를 한 번의 시도로 (version_id 충돌 시 자동 재시도)
+    def attempt():
+        # 선물 존재 여부 확인
+        good = db.query(FinishedGoods).filter_by(gift_id=data.gift_id).first()
+        if not good:
+            raise HTTPException(status_code=404, detail="해당 선물이 존재하지 않습니다.")
 
-        if not material:
+        # 생산 수량 검증
+        if data.produced_quantity <= 0:
             raise HTTPException(
                 status_code=400,
-                detail=f"레시피에 포함된 재료(ID: {bom.input_material_id})가 존재하지 않습니다."
+                detail="생산 수량은 1 이상이어야 합니다."
             )
 
-        required = bom.quantity_required * data.produced_quantity
-
-        if material.stock_quantity < required:
-            shortages.append({
-                "material_id": material.material_id,
-                "material_name": material.material_name,
-                "required": required,
-                "available": material.stock_quantity,
-            })
+        # 레시피 조회 (GiftBOM)
+        boms = db.query(GiftBOM).filter_by(output_gift_id=data.gift_id).all()
+        if not boms:
+            raise HTTPException(
+                status_code=400,
+                detail="해당 선물에 대한 레시피가 등록되어 있지 않습니다."
+            )
 
-    # 하나라도 부족하면 전체 생산 실패
-    if shortages:
-        names = ", ".join([s["material_name"] for s in shortages])
-        raise HTTPException(
-            status_code=400,
-            detail={
-                "message": f"다음 재료 재고 부족으로 생산할 수 없습니다: {names}",
-                "shortages": shortages,
-            },
-        )
+        # 재료 재고 충분한지 먼저 전부 검사
+        shortages = []  # 부족한 재료들
+        materials = {}
 
-    # 검증 통과 -> 실제로 재료 차감 + 선물 재고 증가
-    for bom in boms:
-        material = (
-            db.query(RawMaterial)
-            .filter_by(material_id=bom.input_material_id)
-            .first()
-        )
-        required = bom.quantity_required * data.produced_quantity
-        material.stock_quantity -= required
+        for bom in boms:
+            material = (
+                db.query(RawMaterial)
+                .filter_by(material_id=bom.input_material_id)
+                .first()
+            )
 
-    good.stock_quantity += data.produced_quantity
+            if not material:
+                raise HTTPException(
+                    status_code=400,
+                    detail=f"레시피에 포함된 재료(ID: {bom.input_material_id})가 존재하지 않습니다."
+                )
+
+            materials[bom.input_material_id] = material
+            required = bom.quantity_required * data.produced_quantity
+
+            if material.stock_quantity < required:
+                shortages.append({
+                    "material_id": material.material_id,
+                    "material_name": material.material_name,
+                    "required": required,
+                    "available": material.stock_quantity,
+                })
+
+        # 하나라도 부족하면 전체 생산 실패
+        if shortages:
+            names = ", ".join([s["material_name"] for s in shortages])
+            raise HTTPException(
+                status_code=400,
+                detail={
+                    "message": f"다음 재료 재고 부족으로 생산할 수 없습니다: {names}",
+                    "shortages": shortages,
+                },
+            )
 
-    db.commit()
-    db.refresh(good)
+        # 검증 통과 -> 실제로 재료 차감 + 선물 재고 증가
+        for bom in boms:
+            required = bom.quantity_required * data.produced_quantity
+            materials[bom.input_material_id].stock_quantity -= required
+
+        good.stock_quantity += data.produced_quantity
+
+        return {
+            "message": "생산 완료",
+            "gift_id": good.gift_id,
+            "produced_quantity": data.produced_quantity,
+            "new_gift_stock": good.stock_quantity,
+        }
+
+    return run_idempotent(
+        db,
+        idempotency_key,
+        request_fingerprint(request, data),
+        lambda before_commit: run_optimistic(
+            db, "produce_item", attempt, before_commit=before_commit
+        ),
+    )
 
-    return {
-        "message": "생산 완료",
-        "gift_id": good.gift_id,
-        "produced_quantity": data.produced_quantity,
-        "new_gift_stock": good.stock_quantity,
-    }
-    
 # 선물 레시피 반환
 # GET /gift/{gift_id}/recipe
 @router.get("/{gift_id}/recipe", response_model=List[GiftRecipeItem])
@@ -0,0 +1,42 @@
+from fastapi import APIRouter
+
+from backend.utils.conflict_metrics import conflict_metrics
+from backend.utils.staff_cache import staff_role_cache
+from backend.utils.pool_metrics import pool_metrics_snapshot
+
+router = APIRouter(prefix="/internal", tags=["Internal"])
+
+
+# Staff -> DB Role 캐시 통계
+# GET /internal/staff-cache
+@router.get("/staff-cache")
+def get_staff_cache_stats():
+    '''
+    get_authorized_db 에서 사용하는 StaffID -> DB Role 캐시 상태
+    - hits / misses / hit_ratio / evictions / invalidations
+    '''
+    return staff_role_cache.stats()
+
+
+# DB 커넥션 풀 통계
+# GET /internal/db-pool
+@router.get("/db-pool")
+def get_db_pool_stats():
+    '''
+    엔진별 커넥션 풀 상태 + 이벤트 통계
+    - checked_out / idle / overflow: 현재 풀 상태
+    - checkout_wait: 커넥션 대기 시간 (평균/최대/히스토그램)
+    '''
+    return pool_metrics_snapshot()
+
+
+# 낙관적 동시성 제어 충돌 통계
+# GET /internal/write-conflicts
+@router.get("/write-conflicts")
+def get_write_conflict_stats():
+    '''
+    version_id 충돌 통계 (작업 이름별: mine_material, produce_item, deliver_group 등)
+    - attempts / committed / conflicts / exhausted / conflict_rate
+    - conflict_rate 가 높으면 해당 작업은 재시도보다 잠금이 유리
+    '''
+    return conflict_metrics.stats()
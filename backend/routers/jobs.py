@@ -0,0 +1,90 @@
+from fastapi import APIRouter, Depends, HTTPException, status
+from sqlalchemy import and_, or_
+from sqlalchemy.orm import Session
+
+from backend.database import get_authorized_db
+from backend.models.background_job import BackgroundJob
+from backend.schemas.job import JobStatusResponse, JobResultResponse
+
+router = APIRouter(prefix="/jobs", tags=["Jobs"])
+
+
+def _get_job(db: Session, job_id: int) -> BackgroundJob:
+    '''
+    요청한 직원이 등록한 작업만 조회 (다른 사람 작업은 존재 여부도 알리지 않고 404)
+
+    - 등록자가 없는 작업(created_by_staff_id NULL)은 같은 DB Role 로 등록된 경우만
+    '''
+    job = (
+        db.query(BackgroundJob)
+        .filter(BackgroundJob.job_id == job_id)
+        .filter(
+            or_(
+                BackgroundJob.created_by_staff_id == db.info.get("staff_id"),
+                and_(
+                    BackgroundJob.created_by_staff_id.is_(None),
+                    BackgroundJob.db_role == db.info.get("db_role"),
+                ),
+            )
+        )
+        .first()
+    )
+    if not job:
+        raise HTTPException(status_code=404, detail="Job not found")
+    return job
+
+
+# 작업 진행 상황
+# GET /jobs/{job_id}
+@router.get("/{job_id}", response_model=JobStatusResponse)
+def get_job_status(job_id: int, db: Session = Depends(get_authorized_db)):
+    '''
+    백그라운드 작업 상태 / 진행률 조회 (폴링용)
+    '''
+    job = _get_job(db, job_id)
+
+    progress = None
+    if job.status == "SUCCEEDED":
+        progress = 1.0
+    elif job.progress_total:
+        progress = min(job.progress_done / job.progress_total, 1.0)
+
+    return JobStatusResponse(
+        job_id=job.job_id,
+        kind=job.kind,
+        status=job.status,
+        progress_done=job.progress_done,
+        progress_total=job.progress_total,
+        progress=progress,
+        error=job.error,
+        created_by_staff_id=job.created_by_staff_id,
+        created_at=job.created_at,
+        started_at=job.started_at,
+        finished_at=job.finished_at,
+    )
+
+
+# 작업 결과
+# GET /jobs/{job_id}/result
+@router.get("/{job_id}/result", response_model=JobResultResponse)
+def get_job_result(job_id: int, db: Session = Depends(get_authorized_db)):
+    '''
+    완료된 작업의 결과 조회
+
+    - 아직 QUEUED / RUNNING 이면 409
+    - FAILED 면 error 에 실패 사유
+    '''
+    job = _get_job(db, job_id)
+
+    if job.status in ("QUEUED", "RUNNING"):
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=f"Job is not finished yet ({job.status})",
+        )
+
+    return JobResultResponse(
+        job_id=job.job_id,
+        status=job.status,
+        result=job.result,
+        error=job.error,
+    )
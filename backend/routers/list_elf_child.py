@@ -1,16 +1,36 @@
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
+import csv
+import io
+import json
+import time
+from itertools import groupby
+from typing import Literal
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import StreamingResponse
+from pydantic import ValidationError
+from sqlalchemy import Integer, String, column, select, union, update, values
+from sqlalchemy.orm import Session, selectinload
 
 from backend.database import get_db, get_authorized_db
 from backend.models.child import Child, Wishlist
+from backend.models.child_status_code import ChildStatusCode
+from backend.models.delivery_status_code import DeliveryStatusCode
 from backend.models.gift import FinishedGoods
+from backend.models.region import Region
 from backend.schemas.child_schema import (
     ChildCreate, ChildUpdate,
     ChildOut, ChildDetailOut,
     ChildNoteOut, ChildFullOut,
     WishlistCreate, WishlistUpdate,
-    WishlistItemOut
+    WishlistItemOut,
+    ChildImportResult, ChildImportError,
+    ChildJudgementBatch, ChildJudgementResult,
+    ChildSearchOut
 )
+from backend.schemas.job import JobSubmitted
+from backend.services.jobs import JobContext, register_job, submit_job
+from backend.utils.bulk import DEFAULT_CHUNK_SIZE, bulk_insert, bulk_insert_returning
 from sqlalchemy import func
 
 
@@ -19,6 +39,21 @@ router = APIRouter(
     tags=["List Elf"]
 )
 
+# /all 한 페이지 최대 크기
+MAX_PAGE_SIZE = 1000
+
+# /search 에서 trigram 인덱스를 쓸 수 있는 최소 글자 수 (이보다 짧으면 접두어 검색)
+TRIGRAM_MIN_LENGTH = 3
+
+# limit 을 주지 않았을 때의 페이지 크기 (전체가 필요하면 X-Next-Cursor 로 이어서 조회하거나 /export 사용)
+DEFAULT_PAGE_SIZE = 100
+
+# /import 한 요청 최대 행 수
+MAX_IMPORT_ROWS = 50_000
+
+# /export 서버 측 커서에서 한 번에 가져오는 행 수 (= 한 번에 전송하는 단위)
+EXPORT_BATCH_SIZE = 2000
+
 @router.post("/create", response_model=ChildOut, status_code=status.HTTP_201_CREATED)
 def create_child_with_wishlist(payload: ChildCreate, db: Session = Depends(get_authorized_db)):
     '''
@@ -99,6 +134,270 @@ def create_child_with_wishlist(payload: ChildCreate, db: Session = Depends(get_a
         ]
     )
 
+# Child + Wishlist 대량 등록
+@router.post("/import", response_model=ChildImportResult | JobSubmitted)
+async def import_children(
+    request: Request,
+    response: Response,
+    background: bool = Query(False, description="true 면 백그라운드 작업으로 등록하고 job_id 반환"),
+    db: Session = Depends(get_authorized_db),
+):
+    '''
+    Child + Wishlist 대량 등록
+
+    - application/json: ChildCreate 형식의 배열
+    - text/csv: name,address,region_id,status_code,delivery_status_code,child_note,gift_ids
+      (gift_ids 는 ';' 로 구분, 순서대로 priority 1, 2, 3 ...)
+    - RegionID / GiftID / 상태 코드는 전체 행을 모아서 한 번씩만 조회해 검증
+    - 잘못된 행은 errors 에 담고 나머지 행만 INSERT (전체를 취소하지 않음)
+    - Child 는 INSERT ... RETURNING, Wishlist 는 multi-row INSERT 로 청크 단위 등록
+    - background=true: 본문만 검사하고 작업 등록 (202, 결과는 GET /jobs/{job_id}/result)
+    '''
+    started = time.perf_counter()
+
+    body = await request.body()
+    content_type = request.headers.get("content-type", "")
+
+    try:
+        if content_type.startswith("text/csv"):
+            raw_rows = _parse_import_csv(body.decode("utf-8-sig"))
+        else:
+            raw_rows = json.loads(body)
+    except (UnicodeDecodeError, ValueError) as e:
+        raise HTTPException(status_code=400, detail=f"본문을 읽을 수 없습니다: {e}")
+
+    if not isinstance(raw_rows, list):
+        raise HTTPException(status_code=400, detail="JSON 배열이어야 합니다.")
+    if len(raw_rows) > MAX_IMPORT_ROWS:
+        raise HTTPException(status_code=413, detail=f"한 번에 최대 {MAX_IMPORT_ROWS}건까지 등록할 수 있습니다.")
+
+    if background:
+        job_id = await run_in_threadpool(
+            submit_job,
+            "child_import",
+            {"rows": raw_rows},
+            db.info["db_role"],
+            db.info.get("staff_id"),
+        )
+        response.status_code = status.HTTP_202_ACCEPTED
+        return JobSubmitted(job_id=job_id, status="QUEUED")
+
+    # 동기 DB 작업은 스레드풀에서 실행 (이벤트 루프 블로킹 방지)
+    result = await run_in_threadpool(_import_rows, db, raw_rows)
+    return _finish_import(result, started)
+
+
+@register_job("child_import")
+def import_children_job(ctx: JobContext, db: Session, rows: list) -> dict:
+    '''
+    백그라운드 대량 등록 작업 (POST /list-elf/child/import?background=true)
+    '''
+    started = time.perf_counter()
+    ctx.progress(0, len(rows), force=True)
+
+    result = _finish_import(_import_rows(db, rows), started)
+
+    ctx.progress(len(rows), len(rows), force=True)
+    return result.model_dump()
+
+
+def _finish_import(result: ChildImportResult, started: float) -> ChildImportResult:
+    elapsed = time.perf_counter() - started
+    result.elapsed_ms = round(elapsed * 1000, 2)
+    result.rows_per_sec = round(result.inserted / elapsed, 1) if elapsed else 0.0
+
+    print(
+        f"child import: {result.inserted}/{result.received} rows "
+        f"({result.failed} failed) in {result.elapsed_ms}ms -> {result.rows_per_sec} rows/s"
+    )
+    return result
+
+
+def _parse_import_csv(text_body: str) -> list[dict]:
+    rows = []
+    for record in csv.DictReader(io.StringIO(text_body)):
+        gift_ids = [g.strip() for g in (record.get("gift_ids") or "").split(";") if g.strip()]
+        rows.append({
+            "name": record.get("name"),
+            "address": record.get("address"),
+            "region_id": record.get("region_id"),
+            "status_code": record.get("status_code") or "PENDING",
+            "delivery_status_code": record.get("delivery_status_code") or "PENDING",
+            "child_note": record.get("child_note") or None,
+            "wishlist": [
+                {"gift_id": gift_id, "priority": priority}
+                for priority, gift_id in enumerate(gift_ids, start=1)
+            ],
+        })
+    return rows
+
+
+def _import_rows(db: Session, raw_rows: list) -> ChildImportResult:
+    errors: list[ChildImportError] = []
+
+    # 1) 행 단위 형식 검증 (DB 조회 없음)
+    parsed: list[tuple[int, ChildCreate]] = []
+    for idx, raw in enumerate(raw_rows):
+        try:
+            parsed.append((idx, ChildCreate.model_validate(raw)))
+        except ValidationError as e:
+            errors.append(ChildImportError(
+                row=idx,
+                detail="; ".join(
+                    f"{'.'.join(str(p) for p in err['loc'])}: {err['msg']}" for err in e.errors()
+                ),
+            ))
+
+    # 2) 참조 값을 한 번씩만 조회
+    region_ids = {c.region_id for _, c in parsed}
+    gift_ids = {w.gift_id for _, c in parsed for w in c.wishlist}
+
+    valid_regions = {
+        rid for (rid,) in db.query(Region.RegionID).filter(Region.RegionID.in_(region_ids))
+    } if region_ids else set()
+    valid_gifts = {
+        gid for (gid,) in db.query(FinishedGoods.gift_id).filter(FinishedGoods.gift_id.in_(gift_ids))
+    } if gift_ids else set()
+    valid_status = {code for (code,) in db.query(ChildStatusCode.Code)}
+    valid_delivery = {code for (code,) in db.query(DeliveryStatusCode.Code)}
+
+    # 3) 참조 검증 (메모리에서)
+    valid: list[ChildCreate] = []
+    for idx, c in parsed:
+        status_code = (c.status_code or "PENDING").upper()
+        delivery_status_code = (c.delivery_status_code or "PENDING").upper()
+        problems = []
+
+        if c.region_id not in valid_regions:
+            problems.append(f"존재하지 않는 RegionID: {c.region_id}")
+        missing = sorted({w.gift_id for w in c.wishlist} - valid_gifts)
+        if missing:
+            problems.append(f"존재하지 않는 GiftID: {missing}")
+        if status_code not in valid_status:
+            problems.append(f"존재하지 않는 status_code: {status_code}")
+        if delivery_status_code not in valid_delivery:
+            problems.append(f"존재하지 않는 delivery_status_code: {delivery_status_code}")
+
+        if problems:
+            errors.append(ChildImportError(row=idx, detail="; ".join(problems)))
+            continue
+
+        c.status_code = status_code
+        c.delivery_status_code = delivery_status_code
+        valid.append(c)
+
+    # 4) 청크 단위 INSERT (Child -> RETURNING ChildID -> Wishlist)
+    wishlist_inserted = 0
+    try:
+        inserted = bulk_insert_returning(
+            db,
+            Child,
+            (
+                {
+                    "Name": c.name,
+                    "Address": c.address,
+                    "RegionID": c.region_id,
+                    "StatusCode": c.status_code,
+                    "DeliveryStatusCode": c.delivery_status_code,
+                    "ChildNote": c.child_note,
+                }
+                for c in valid
+            ),
+            returning=[Child.__table__.c.ChildID],
+        )
+
+        wishlist_rows = [
+            {"ChildID": row.ChildID, "GiftID": w.gift_id, "Priority": w.priority}
+            for row, c in zip(inserted, valid)
+            for w in c.wishlist
+        ]
+        bulk_insert(db, Wishlist, wishlist_rows)
+        wishlist_inserted = len(wishlist_rows)
+
+        db.commit()
+
+    except Exception as e:
+        db.rollback()
+        print("ERROR:", e)
+        raise HTTPException(status_code=500, detail=str(e))
+
+    errors.sort(key=lambda err: err.row)
+    return ChildImportResult(
+        received=len(raw_rows),
+        inserted=len(valid),
+        failed=len(errors),
+        wishlist_inserted=wishlist_inserted,
+        elapsed_ms=0.0,
+        rows_per_sec=0.0,
+        errors=errors,
+    )
+
+
+# 일괄 판정 (NICE / NAUGHTY / PENDING)
+@router.post("/judgements", response_model=ChildJudgementResult)
+def judge_children(payload: ChildJudgementBatch, db: Session = Depends(get_authorized_db)):
+    '''
+    여러 아이의 StatusCode(+ChildNote)를 한 번에 변경
+
+    - UPDATE child ... FROM (VALUES ...) 한 문장으로 처리 (청크당 1번)
+    - ORM 객체를 만들지 않고 RETURNING 으로 변경된 ChildID 만 받음
+    - 같은 child_id 가 여러 번 오면 마지막 값 사용
+    - 존재하지 않는 상태 코드가 있으면 400, 없는 child_id 는 not_found 로 반환
+    '''
+    # child_id 기준 중복 제거 (마지막 값 우선)
+    items = {
+        item.child_id: (item.child_id, item.status_code.upper(), item.child_note)
+        for item in payload.items
+    }
+
+    codes = {code for _, code, _ in items.values()}
+    valid_codes = {
+        code for (code,) in db.query(ChildStatusCode.Code).filter(ChildStatusCode.Code.in_(codes))
+    }
+    invalid = codes - valid_codes
+    if invalid:
+        raise HTTPException(status_code=400, detail=f"존재하지 않는 status_code: {sorted(invalid)}")
+
+    child = Child.__table__
+    rows = list(items.values())
+    updated_ids = set()
+
+    try:
+        for start in range(0, len(rows), DEFAULT_CHUNK_SIZE):
+            judged = (
+                values(
+                    column("child_id", Integer),
+                    column("status_code", String),
+                    column("child_note", String),
+                    name="judged",
+                )
+                .data(rows[start:start + DEFAULT_CHUNK_SIZE])
+            )
+            stmt = (
+                update(child)
+                .where(child.c.ChildID == judged.c.child_id)
+                .values(
+                    StatusCode=judged.c.status_code,
+                    ChildNote=func.coalesce(judged.c.child_note, child.c.ChildNote),
+                )
+                .returning(child.c.ChildID)
+            )
+            updated_ids.update(db.execute(stmt).scalars())
+
+        db.commit()
+
+    except Exception as e:
+        db.rollback()
+        print("ERROR:", e)
+        raise HTTPException(status_code=500, detail=str(e))
+
+    return ChildJudgementResult(
+        requested=len(rows),
+        updated=len(updated_ids),
+        not_found=sorted(set(items) - updated_ids),
+    )
+
+
 # Child 수정 (PATCH)
 @router.patch("/{child_id}", response_model=ChildOut)
 def update_child(child_id: int, payload: ChildUpdate, db: Session = Depends(get_authorized_db)):
@@ -287,14 +586,44 @@ def delete_wishlist(wishlist_id: int, db: Session = Depends(get_authorized_db)):
 
 # Child 전체 조회 API
 @router.get("/all", response_model=list[ChildFullOut])
-def get_all_children(db: Session = Depends(get_authorized_db)):
+def get_all_children(
+    response: Response,
+    cursor: int | None = Query(None, description="이전 페이지 마지막 ChildID (X-Next-Cursor 값)"),
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE, description="페이지 크기"),
+    region_id: int | None = None,
+    status_code: str | None = None,
+    delivery_status_code: str | None = None,
+    db: Session = Depends(get_authorized_db),
+):
+    '''
+    Child + Wishlist 목록 조회 (ChildID 기준 keyset 페이지네이션)
 
-    children = (
+    - cursor 보다 큰 ChildID 부터 limit 개 반환 (OFFSET 없음 -> 뒤 페이지도 일정한 속도)
+    - 다음 페이지가 있으면 응답 헤더 X-Next-Cursor 에 다음 cursor 값
+    - limit 기본값 DEFAULT_PAGE_SIZE (전체 목록은 cursor 로 이어서 조회하거나 /list-elf/child/export)
+    - wishlist 는 selectinload 로 한 번에 조회 (페이지 크기와 무관하게 쿼리 2번)
+    '''
+    query = (
         db.query(Child)
+        .options(selectinload(Child.wishlist_items))
         .order_by(Child.ChildID.asc())
-        .all()
     )
 
+    if cursor is not None:
+        query = query.filter(Child.ChildID > cursor)
+    if region_id is not None:
+        query = query.filter(Child.RegionID == region_id)
+    if status_code:
+        query = query.filter(Child.StatusCode == status_code.upper())
+    if delivery_status_code:
+        query = query.filter(Child.DeliveryStatusCode == delivery_status_code.upper())
+
+    # 한 개 더 읽어서 다음 페이지 존재 여부 판단
+    children = query.limit(limit + 1).all()
+    if len(children) > limit:
+        children = children[:limit]
+        response.headers["X-Next-Cursor"] = str(children[-1].ChildID)
+
     return [
         ChildFullOut(
             child_id=c.ChildID,
@@ -317,6 +646,181 @@ def get_all_children(db: Session = Depends(get_authorized_db)):
     ]
 
 
+# Child 이름/주소 검색
+@router.get("/search", response_model=list[ChildSearchOut])
+def search_children(
+    q: str = Query(..., min_length=2, description="이름 또는 주소 일부 (오타 허용)"),
+    region_id: int | None = None,
+    limit: int = Query(20, ge=1, le=200),
+    db: Session = Depends(get_authorized_db),
+):
+    '''
+    이름/주소 유사도 검색 (pg_trgm)
+
+    - 후보는 이름/주소별로 각각 limit 개까지만 인덱스에서 가져온 뒤 합쳐서 정렬 (전체 정렬 없음)
+    - 3자 이상: 부분 일치(ILIKE) / trigram 유사도(%) 조건을 GiST 인덱스
+      (ix_child_name_trgm_gist / ix_child_address_trgm_gist) 에서 거리(<->)순으로 조회
+    - 1~2자: trigram 이 만들어지지 않으므로 소문자 접두어 일치
+      (ix_child_name_lower_prefix / ix_child_address_lower_prefix btree 범위 스캔)
+    - 이름/주소 중 더 높은 similarity 로 정렬해서 limit 개 반환
+    '''
+    escaped = q.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+    def candidates(cond, order):
+        branch = select(Child.ChildID).where(cond)
+        if region_id is not None:
+            branch = branch.where(Child.RegionID == region_id)
+        # 인덱스 순서 그대로 읽다가 limit 에서 멈추도록 정렬 키는 인덱스 식 하나만
+        return branch.order_by(order).limit(limit)
+
+    if len(q) >= TRIGRAM_MIN_LENGTH:
+        pattern = f"%{escaped}%"
+        branches = [
+            candidates(cond, col.op("<->")(q))
+            for col in (Child.Name, Child.Address)
+            for cond in (col.ilike(pattern), col.op("%")(q))
+        ]
+    else:
+        prefix = f"{escaped.lower()}%"
+        branches = [
+            candidates(lower.like(prefix), lower)
+            for lower in (func.lower(col).collate("C") for col in (Child.Name, Child.Address))
+        ]
+
+    candidate_ids = union(*branches).subquery("candidates")
+    score = func.greatest(func.similarity(Child.Name, q), func.similarity(Child.Address, q))
+
+    query = (
+        select(
+            Child.ChildID,
+            Child.Name,
+            Child.Address,
+            Child.RegionID,
+            Child.StatusCode,
+            Child.DeliveryStatusCode,
+            score.label("score"),
+        )
+        .join(candidate_ids, candidate_ids.c.ChildID == Child.ChildID)
+        .order_by(score.desc(), Child.ChildID.asc())
+        .limit(limit)
+    )
+
+    return [
+        ChildSearchOut(
+            child_id=row.ChildID,
+            name=row.Name,
+            address=row.Address,
+            region_id=row.RegionID,
+            status_code=row.StatusCode,
+            delivery_status_code=row.DeliveryStatusCode,
+            score=row.score,
+        )
+        for row in db.execute(query)
+    ]
+
+
+# Child 전체 내보내기 (스트리밍)
+@router.get("/export")
+def export_children(
+    format: Literal["ndjson", "csv"] = "ndjson",
+    region_id: int | None = None,
+    status_code: str | None = None,
+    delivery_status_code: str | None = None,
+    db: Session = Depends(get_authorized_db),
+):
+    '''
+    Child + Wishlist 전체를 NDJSON / CSV 로 스트리밍
+
+    - 서버 측 커서(yield_per)로 EXPORT_BATCH_SIZE 행씩 읽어서 바로 전송
+      (ORM 객체/pydantic 모델을 만들지 않음 -> 수백만 행도 메모리 일정)
+    - ndjson: 아이 1명당 한 줄 ({"child_id": .., "wishlist": [..]})
+    - csv: 위시리스트 항목 1개당 한 줄 (위시리스트가 없으면 gift_id 등은 빈 값)
+    - 세션은 응답 전송이 끝난 뒤 닫힘 (yield 의존성 기본 동작)
+    '''
+    query = (
+        select(
+            Child.ChildID,
+            Child.Name,
+            Child.Address,
+            Child.RegionID,
+            Child.StatusCode,
+            Child.DeliveryStatusCode,
+            Child.ChildNote,
+            Wishlist.WishlistID,
+            Wishlist.GiftID,
+            Wishlist.Priority,
+        )
+        .outerjoin(Wishlist, Wishlist.ChildID == Child.ChildID)
+        .order_by(Child.ChildID.asc(), Wishlist.Priority.asc())
+    )
+
+    if region_id is not None:
+        query = query.where(Child.RegionID == region_id)
+    if status_code:
+        query = query.where(Child.StatusCode == status_code.upper())
+    if delivery_status_code:
+        query = query.where(Child.DeliveryStatusCode == delivery_status_code.upper())
+
+    rows = db.execute(query.execution_options(yield_per=EXPORT_BATCH_SIZE))
+
+    if format == "csv":
+        return StreamingResponse(
+            _export_csv(rows),
+            media_type="text/csv",
+            headers={"Content-Disposition": 'attachment; filename="children.csv"'},
+        )
+
+    return StreamingResponse(_export_ndjson(rows), media_type="application/x-ndjson")
+
+
+def _export_ndjson(rows):
+    # ChildID 순으로 정렬돼 있으므로 연속된 행을 아이 1명으로 묶음
+    buf = []
+    for child_id, items in groupby(rows, key=lambda r: r.ChildID):
+        items = list(items)
+        first = items[0]
+        buf.append(json.dumps({
+            "child_id": child_id,
+            "name": first.Name,
+            "address": first.Address,
+            "region_id": first.RegionID,
+            "status_code": first.StatusCode,
+            "delivery_status_code": first.DeliveryStatusCode,
+            "child_note": first.ChildNote,
+            "wishlist": [
+                {"wishlist_id": r.WishlistID, "gift_id": r.GiftID, "priority": r.Priority}
+                for r in items
+                if r.WishlistID is not None
+            ],
+        }, ensure_ascii=False))
+
+        if len(buf) >= EXPORT_BATCH_SIZE:
+            yield "\n".join(buf) + "\n"
+            buf = []
+
+    if buf:
+        yield "\n".join(buf) + "\n"
+
+
+def _export_csv(rows):
+    out = io.StringIO()
+    writer = csv.writer(out)
+    writer.writerow([
+        "child_id", "name", "address", "region_id", "status_code",
+        "delivery_status_code", "child_note", "wishlist_id", "gift_id", "priority",
+    ])
+
+    for count, row in enumerate(rows, start=1):
+        writer.writerow(row)
+
+        if count % EXPORT_BATCH_SIZE == 0:
+            yield out.getvalue()
+            out.seek(0)
+            out.truncate()
+
+    yield out.getvalue()
+
+
 #  ChildNote 단독 조회 API
 @router.get("/{child_id}/note", response_model=ChildNoteOut)
 def get_child_note(child_id: int, db: Session = Depends(get_authorized_db)):
@@ -36,8 +36,8 @@ def get_gift_demand_summary(db: Session = Depends(get_authorized_db)):
             func.sum(case((Wishlist.Priority == 3, 1), else_=0)).label("p3")
         )
         .join(Child, Wishlist.ChildID == Child.ChildID)
-        .filter(func.upper(Child.StatusCode) == "NICE")
-        .filter(func.upper(Child.DeliveryStatusCode) != "DELIVERED")
+        .filter(Child.StatusCode == "NICE")
+        .filter(Child.DeliveryStatusCode != "DELIVERED")
         .group_by(Wishlist.GiftID)
         .having(func.count(Wishlist.GiftID) > 0)  
         .order_by(func.count(Wishlist.GiftID).desc())
@@ -70,8 +70,8 @@ def get_top3_for_priority(db: Session, priority: int):
         .join(Child, Wishlist.ChildID == Child.ChildID)
         .join(FinishedGoods, Wishlist.GiftID == FinishedGoods.gift_id)
         .filter(Wishlist.Priority == priority)
-        .filter(func.upper(Child.StatusCode) == "NICE")
-        .filter(func.upper(Child.DeliveryStatusCode) != "DELIVERED")
+        .filter(Child.StatusCode == "NICE")
+        .filter(Child.DeliveryStatusCode != "DELIVERED")
         .group_by(Wishlist.GiftID, FinishedGoods.gift_name)
         .order_by(func.count(Wishlist.GiftID).desc())
         .limit(3)
@@ -1,110 +1,114 @@
 from typing import List
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, Header, HTTPException, Request
 from sqlalchemy.orm import Session
 
 from backend.database import get_db, get_authorized_db
 from backend.models.gift import RawMaterial, FinishedGoods, GiftBOM, ProductionLog, ProductionUsage
 from backend.schemas.gift import ProductionCreateRequest, ProductionLogResponse
-from backend.utils.transactions import transactional_session
+from backend.utils.idempotency import request_fingerprint, run_idempotent
+from backend.utils.transactions import run_optimistic
 
 router = APIRouter(prefix="/production", tags=["Production"])
 
 
 @router.post("/create")
-def create_production_job(data: ProductionCreateRequest, db: Session = Depends(get_authorized_db)):
+def create_production_job(
+    data: ProductionCreateRequest,
+    request: Request,
+    db: Session = Depends(get_authorized_db),
+    idempotency_key: str | None = Header(default=None, alias="Idempotency-Key"),
+):
     """
     생산 Job 1건을 생성하고
     - 재료 재고 검증
     - 재료 차감
     - Finished_Goods 재고 증가
     - Production_Log / Production_Usage 기록을 한 트랜잭션으로 처리
+    - 재고 행은 version_id 로 충돌 검사 -> 검증 이후 다른 요정이 재고를 바꿨으면 처음부터 재시도
+    - Idempotency-Key 헤더가 있으면 재전송 시 Job 을 다시 만들지 않고 첫 응답을 그대로 반환
     """
 
-    # 사전 검증: 트랜잭션을 시작하기 전에 요청이 유효한지 미리 확인
-    # 선물 존재 여부
-    gift = (
-        db.query(FinishedGoods)
-        .filter_by(gift_id=data.gift_id)
-        .first()
-    )
-    if not gift:
-        raise HTTPException(
-            status_code=404,
-            detail="해당 선물이 존재하지 않습니다.",
-        )
-
-    # 생산 수량 검증
-    if data.produced_quantity <= 0:
-        raise HTTPException(
-            status_code=400,
-            detail="생산 수량은 1 이상이어야 합니다.",
-        )
-
-    # 레시피 조회
-    boms = (
-        db.query(GiftBOM)
-        .filter_by(output_gift_id=data.gift_id)
-        .all()
-    )
-    if not boms:
-        raise HTTPException(
-            status_code=400,
-            detail="해당 선물에 대한 레시피가 등록되어 있지 않습니다.",
-        )
-
-    # 재료 부족 검사
-    shortages = []
-
-    for bom in boms:
-        material = (
-            db.query(RawMaterial)
-            .filter_by(material_id=bom.input_material_id)
+    def attempt():
+        # 선물 존재 여부
+        gift = (
+            db.query(FinishedGoods)
+            .filter_by(gift_id=data.gift_id)
             .first()
         )
+        if not gift:
+            raise HTTPException(
+                status_code=404,
+                detail="해당 선물이 존재하지 않습니다.",
+            )
 
-        if not material:
+        # 생산 수량 검증
+        if data.produced_quantity <= 0:
             raise HTTPException(
                 status_code=400,
-                detail=f"레시피에 포함된 재료(ID: {bom.input_material_id})가 존재하지 않습니다.",
+                detail="생산 수량은 1 이상이어야 합니다.",
             )
 
-        required = bom.quantity_required * data.produced_quantity
-
-        if material.stock_quantity < required:
-            shortages.append({
-                "material_id": material.material_id,
-                "material_name": material.material_name,
-                "required": required,
-                "available": material.stock_quantity,
-            })
-
-    # 재료 부족 시: 트랜잭션 들어가기 전에 바로 에러 반환 -> DB 변경 없음
-    if shortages:
-        names = ", ".join([s["material_name"] for s in shortages])
-        raise HTTPException(
-            status_code=400,
-            detail={
-                "message": f"다음 재료 재고 부족으로 생산 Job을 생성할 수 없습니다: {names}",
-                "shortages": shortages,
-            },
+        # 레시피 조회
+        boms = (
+            db.query(GiftBOM)
+            .filter_by(output_gift_id=data.gift_id)
+            .all()
         )
+        if not boms:
+            raise HTTPException(
+                status_code=400,
+                detail="해당 선물에 대한 레시피가 등록되어 있지 않습니다.",
+            )
+
+        # 재료 부족 검사
+        shortages = []
+        materials = {}
 
-    # 트랜잭션 구간
-    with transactional_session(db):
-        # Raw_Materials 재고 차감
         for bom in boms:
             material = (
                 db.query(RawMaterial)
                 .filter_by(material_id=bom.input_material_id)
                 .first()
             )
+
+            if not material:
+                raise HTTPException(
+                    status_code=400,
+                    detail=f"레시피에 포함된 재료(ID: {bom.input_material_id})가 존재하지 않습니다.",
+                )
+
+            materials[bom.input_material_id] = material
+            required = bom.quantity_required * data.produced_quantity
+
+            if material.stock_quantity < required:
+                shortages.append({
+                    "material_id": material.material_id,
+                    "material_name": material.material_name,
+                    "required": required,
+                    "available": material.stock_quantity,
+                })
+
+        # 재료 부족 시: 변경 전에 바로 에러 반환 -> DB 변경 없음
+        if shortages:
+            names = ", ".join([s["material_name"] for s in shortages])
+            raise HTTPException(
+                status_code=400,
+                detail={
+                    "message": f"다음 재료 재고 부족으로 생산 Job을 생성할 수 없습니다: {names}",
+                    "shortages": shortages,
+                },
+            )
+
+        # Raw_Materials 재고 차감
+        for bom in boms:
             used = bom.quantity_required * data.produced_quantity
-            material.stock_quantity -= used
+            materials[bom.input_material_id].stock_quantity -= used
 
         # Finished_Goods 재고 증가
         gift.stock_quantity += data.produced_quantity
 
         # Production_Log INSERT
+        # (flush 시 재고 UPDATE 도 함께 나가므로 버전 충돌은 여기서 감지될 수 있음)
         log = ProductionLog(
             gift_id=gift.gift_id,
             quantity_produced=data.produced_quantity,
@@ -123,14 +127,23 @@ def create_production_job(data: ProductionCreateRequest, db: Session = Depends(g
             )
             db.add(usage)
 
-    return {
-        "message": "생산 Job 생성 완료",
-        "job_id": log.job_id,
-        "gift_id": gift.gift_id,
-        "quantity_produced": log.quantity_produced,
-        "produced_by_staff_id": log.produced_by_staff_id,
-        "new_gift_stock": gift.stock_quantity,
-    }
+        return {
+            "message": "생산 Job 생성 완료",
+            "job_id": log.job_id,
+            "gift_id": gift.gift_id,
+            "quantity_produced": log.quantity_produced,
+            "produced_by_staff_id": log.produced_by_staff_id,
+            "new_gift_stock": gift.stock_quantity,
+        }
+
+    return run_idempotent(
+        db,
+        idempotency_key,
+        request_fingerprint(request, data),
+        lambda before_commit: run_optimistic(
+            db, "create_production_job", attempt, before_commit=before_commit
+        ),
+    )
 
 @router.get("/logs", response_model=List[ProductionLogResponse])
 def get_production_logs(db: Session = Depends(get_authorized_db)):
@@ -1,10 +1,13 @@
 from sqlalchemy import text
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, Header, HTTPException
 from sqlalchemy.orm import Session
+from sqlalchemy.orm.exc import StaleDataError
 
 from backend.database import get_db, get_authorized_db
 from backend.models.reindeer import Reindeer, ReindeerHealthLog
 from backend.schemas.reindeer import ReindeerResponse, ReindeerUpdateStatus, HealthLogCreate, HealthLogResponse
+from backend.utils.conflict_metrics import conflict_metrics
+from backend.utils.transactions import transactional_session
 
 router = APIRouter(prefix="/reindeer", tags=["reindeer"])
 
@@ -23,28 +26,62 @@ def list_reindeer(db: Session = Depends(get_authorized_db)):
 def update_reindeer_status(
     payload: ReindeerUpdateStatus,
     db: Session = Depends(get_authorized_db),
+    if_match: str | None = Header(default=None, alias="If-Match"),
 ):
-    # 존재 여부 확인
-    reindeer = (
-        db.query(Reindeer)
-        .filter(Reindeer.reindeer_id == payload.reindeer_id)
-        .first()
-    )
-    if not reindeer:
-        raise HTTPException(status_code=404, detail="Reindeer not found")
-
-    # 상태 변경
-    reindeer.status = payload.status
-    reindeer.current_stamina = payload.current_stamina
-    reindeer.current_magic = payload.current_magic
-    
-    # 자동 READY 변경 로직 추가
-    # 체력이나 마력이 30 미만이면 자동 RESTING
-    if reindeer.current_stamina < 30 or reindeer.current_magic < 30:
-        reindeer.status = "RESTING"
-
-    db.commit()
-
+    """
+    - 요청한 값(절대값)으로 덮어쓰므로 클라이언트가 조회했던 version_id 를 함께 보내야 함
+      (payload.version_id 또는 If-Match 헤더, 둘 다 없으면 428)
+    - 그 사이 배송 실행 등으로 루돌프가 바뀌었으면 409 (자동 재시도 없음 -> 다시 조회 후 수정)
+    """
+    expected_version = payload.version_id
+    if expected_version is None and if_match:
+        tag = if_match.strip().removeprefix("W/").strip('"')
+        if not tag.isdigit():
+            raise HTTPException(status_code=400, detail="If-Match 는 version_id 숫자여야 합니다.")
+        expected_version = int(tag)
+
+    if expected_version is None:
+        raise HTTPException(
+            status_code=428,
+            detail="version_id (또는 If-Match 헤더) 가 필요합니다. 루돌프를 다시 조회한 뒤 수정하세요.",
+        )
+
+    conflict_metrics.incr("update_reindeer_status", "attempts")
+    try:
+        with transactional_session(db):
+            # 존재 여부 확인
+            reindeer = (
+                db.query(Reindeer)
+                .filter(Reindeer.reindeer_id == payload.reindeer_id)
+                .first()
+            )
+            if not reindeer:
+                raise HTTPException(status_code=404, detail="Reindeer not found")
+
+            # 조회 이후 다른 요청이 먼저 수정함
+            if reindeer.version_id != expected_version:
+                raise StaleDataError(
+                    f"reindeer {reindeer.reindeer_id} version {reindeer.version_id} != {expected_version}"
+                )
+
+            # 상태 변경 (UPDATE ... WHERE version_id = 읽은 값 -> 그 사이 바뀌면 StaleDataError)
+            reindeer.status = payload.status
+            reindeer.current_stamina = payload.current_stamina
+            reindeer.current_magic = payload.current_magic
+
+            # 자동 READY 변경 로직 추가
+            # 체력이나 마력이 30 미만이면 자동 RESTING
+            if reindeer.current_stamina < 30 or reindeer.current_magic < 30:
+                reindeer.status = "RESTING"
+
+    except StaleDataError:
+        conflict_metrics.incr("update_reindeer_status", "conflicts")
+        raise HTTPException(
+            status_code=409,
+            detail="다른 요청이 루돌프 정보를 먼저 수정했습니다. 다시 조회한 뒤 수정하세요.",
+        )
+
+    conflict_metrics.incr("update_reindeer_status", "committed")
     return reindeer
 
 # 루돌프 건강 로그 기록
@@ -1,10 +1,13 @@
-from fastapi import APIRouter, Depends, HTTPException, status, Header
+from fastapi import APIRouter, Depends, HTTPException, status, Header, Request
 from sqlalchemy.orm import Session
-from sqlalchemy import func
+from sqlalchemy import Integer, column, func, select, values
 
 from backend.database import get_db, get_authorized_db
-from backend.utils.transactions import transactional_session
-from backend.models.delivery_log import DeliveryLog
+from backend.services import delivery
+from backend.services.group_planner import plan_groups
+from backend.services.jobs import submit_job
+from backend.utils.bulk import bulk_insert
+from backend.utils.idempotency import request_fingerprint, run_idempotent
 from backend.models.delivery_group import DeliveryGroup, DeliveryGroupItem
 from backend.models.reindeer import Reindeer
 from backend.models.child import Child
@@ -12,10 +15,16 @@ from backend.models.gift import FinishedGoods
 from backend.schemas.santa import (
     DeliveryGroupCreate,
     DeliveryGroupItemCreate,
+    DeliveryGroupItemBulkCreate,
+    DeliveryGroupItemBulkResult,
+    DeliveryGroupItemRejected,
     DeliveryGroupListItemResponse,
     DeliveryGroupDetailResponse,
     DeliveryGroupItemInGroup,
+    DeliveryGroupPlanRequest,
+    DeliveryGroupPlanResult,
 )
+from backend.schemas.job import JobSubmitted
 
 router = APIRouter(prefix="/santa", tags=["Santa"])
 
@@ -61,6 +70,39 @@ def create_delivery_group(
 
     return group.group_id
 
+# 배송 그룹 자동 편성
+# POST /santa/groups/plan
+@router.post("/groups/plan", response_model=DeliveryGroupPlanResult, status_code=201)
+def plan_delivery_groups(
+    payload: DeliveryGroupPlanRequest,
+    db: Session = Depends(get_authorized_db),
+    x_staff_id: str | None = Header(default=None, alias="x-staff-id")
+):
+    """
+    NICE/PENDING 대상 + ready_reindeer_view 루돌프로 그룹을 한 번에 편성
+
+    - 지역(RegionID) 단위로만 묶고, 루돌프 용량은 min(stamina, magic) * items_per_point
+    - 선물은 /santa/allocate-gifts 와 같은 솔버로 재고 안에서 배정
+    - 그룹/아이템은 multi-row INSERT 로 일괄 저장 (dry_run 이면 저장 안 함)
+    """
+    staff_id = int(x_staff_id) if x_staff_id and x_staff_id.isdigit() else None
+
+    result = plan_groups(
+        db,
+        region_id=payload.region_id,
+        items_per_point=payload.items_per_point,
+        max_group_size=payload.max_group_size,
+        staff_id=staff_id,
+        dry_run=payload.dry_run,
+    )
+
+    if payload.dry_run:
+        db.rollback()
+    else:
+        db.commit()
+
+    return result
+
 # 그룹에 아이/선물 추가
 # POST /santa/groups/{group_id}/items
 @router.post("/groups/{group_id}/items", status_code=201)
@@ -136,6 +178,124 @@ def add_item_to_group(
 
     return {"message": "Item added to group"}
 
+# 그룹에 아이/선물 여러 개 추가
+# POST /santa/groups/{group_id}/items/bulk
+@router.post("/groups/{group_id}/items/bulk", response_model=DeliveryGroupItemBulkResult, status_code=201)
+def add_items_to_group(
+    group_id: int,
+    payload: DeliveryGroupItemBulkCreate,
+    db: Session = Depends(get_authorized_db),
+):
+    """
+    그룹에 (child_id, gift_id) 목록을 한 번에 추가
+
+    - 그룹 행을 FOR UPDATE 로 잠근 뒤 PENDING 인지 확인 (추가 중 배송/삭제 방지)
+    - 아이/선물 존재, 이미 배송됨, 같은 그룹 중복, 다른 PENDING 그룹 소속 여부를
+      VALUES 목록과 JOIN 한 쿼리 1번으로 검사
+    - 통과한 항목은 multi-row INSERT 로 한 번에 추가, 나머지는 rejected 에 사유와 함께 반환
+    """
+    group = (
+        db.query(DeliveryGroup)
+        .filter(DeliveryGroup.group_id == group_id)
+        .with_for_update()
+        .first()
+    )
+    if not group:
+        raise HTTPException(status_code=404, detail="Delivery group not found")
+
+    if group.status != "PENDING":
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Only pending groups can be modified",
+        )
+
+    requested = [(idx, item.child_id, item.gift_id) for idx, item in enumerate(payload.items)]
+
+    req = (
+        values(
+            column("idx", Integer),
+            column("child_id", Integer),
+            column("gift_id", Integer),
+            name="req",
+        )
+        .data(requested)
+    )
+
+    same_group = (
+        select(DeliveryGroupItem.group_item_id)
+        .where(DeliveryGroupItem.group_id == group_id)
+        .where(DeliveryGroupItem.child_id == req.c.child_id)
+        .exists()
+    )
+    other_pending_group = (
+        select(DeliveryGroupItem.group_item_id)
+        .join(DeliveryGroup, DeliveryGroupItem.group_id == DeliveryGroup.group_id)
+        .where(DeliveryGroupItem.child_id == req.c.child_id)
+        .where(DeliveryGroup.status == "PENDING")
+        .where(DeliveryGroup.group_id != group_id)
+        .exists()
+    )
+
+    checks = db.execute(
+        select(
+            req.c.idx,
+            req.c.child_id,
+            req.c.gift_id,
+            Child.ChildID.label("found_child"),
+            Child.DeliveryStatusCode.label("delivery_status"),
+            FinishedGoods.gift_id.label("found_gift"),
+            same_group.label("in_same_group"),
+            other_pending_group.label("in_other_group"),
+        )
+        .select_from(req)
+        .outerjoin(Child, Child.ChildID == req.c.child_id)
+        .outerjoin(FinishedGoods, FinishedGoods.gift_id == req.c.gift_id)
+        .order_by(req.c.idx)
+    ).all()
+
+    accepted = []
+    rejected = []
+    seen_children = set()
+
+    for row in checks:
+        if row.found_child is None:
+            reason = "Child not found"
+        elif row.found_gift is None:
+            reason = "Gift not found"
+        elif row.delivery_status == "DELIVERED":
+            reason = "Child already delivered"
+        elif row.in_same_group or row.child_id in seen_children:
+            reason = "Child is already in this group"
+        elif row.in_other_group:
+            reason = "Child already belongs to another pending group"
+        else:
+            reason = None
+
+        if reason:
+            rejected.append(DeliveryGroupItemRejected(
+                child_id=row.child_id, gift_id=row.gift_id, reason=reason,
+            ))
+            continue
+
+        seen_children.add(row.child_id)
+        accepted.append({"group_id": group_id, "child_id": row.child_id, "gift_id": row.gift_id})
+
+    try:
+        bulk_insert(db, DeliveryGroupItem, accepted)
+        db.commit()
+
+    except Exception as e:
+        db.rollback()
+        print("ERROR:", e)
+        raise HTTPException(status_code=500, detail=str(e))
+
+    return DeliveryGroupItemBulkResult(
+        group_id=group_id,
+        requested=len(requested),
+        added=len(accepted),
+        rejected=rejected,
+    )
+
 # 배송 그룹 목록 조회
 # GET /santa/groups
 @router.get("/groups", response_model=list[DeliveryGroupListItemResponse])
@@ -243,8 +403,10 @@ def delete_delivery_group(
 @router.post("/groups/{group_id}/deliver")
 def deliver_group(
     group_id: int,
+    request: Request,
     db: Session = Depends(get_authorized_db),
-    x_staff_id: str | None = Header(default=None, alias="x-staff-id")
+    x_staff_id: str | None = Header(default=None, alias="x-staff-id"),
+    idempotency_key: str | None = Header(default=None, alias="Idempotency-Key"),
 ):
     """
     배송 그룹 단위로 실제 배송 실행
@@ -260,13 +422,37 @@ def deliver_group(
     - 그룹:
         * 성공 시 status = 'DONE'
         * 트랜잭션 내에서 예외 나면 ROLLBACK 후 status = 'FAILED'
+    - 실제 처리는 services/delivery.py (잠금 + 집합 단위 UPDATE/INSERT, 아이템 수와 무관한 문장 수)
+    - Idempotency-Key 헤더가 있으면 재전송 시 다시 배송하지 않고 첫 성공 응답을 그대로 반환
     """
     
     staff_id = int(x_staff_id) if x_staff_id and x_staff_id.isdigit() else None
 
-    # 그룹 기본 체크 (존재 여부 + 상태)
+    return run_idempotent(
+        db,
+        idempotency_key,
+        request_fingerprint(request),
+        lambda before_commit: delivery.deliver_group(
+            db, group_id, staff_id, before_commit=before_commit
+        ),
+    )
+
+
+# 배송 그룹 백그라운드 실행
+# POST /santa/groups/{group_id}/deliver-async
+@router.post("/groups/{group_id}/deliver-async", response_model=JobSubmitted, status_code=202)
+def deliver_group_async(
+    group_id: int,
+    db: Session = Depends(get_authorized_db),
+):
+    """
+    배송을 백그라운드 작업으로 등록하고 바로 job_id 반환
+
+    - 진행률: GET /jobs/{job_id}, 결과: GET /jobs/{job_id}/result
+    - 요청 시점에는 그룹 존재 / PENDING 여부만 확인 (나머지는 작업 안에서 검사)
+    """
     group = (
-        db.query(DeliveryGroup)
+        db.query(DeliveryGroup.status)
         .filter(DeliveryGroup.group_id == group_id)
         .first()
     )
@@ -279,151 +465,10 @@ def deliver_group(
             detail="Only PENDING groups can be delivered",
         )
 
-    try:
-        # 트랜잭션 시작
-        with transactional_session(db) as tx:
-            # 그룹과 연관된 아이/선물 목록
-            items = (
-                tx.query(DeliveryGroupItem)
-                .filter(DeliveryGroupItem.group_id == group_id)
-                .all()
-            )
-            if not items:
-                raise HTTPException(
-                    status_code=status.HTTP_400_BAD_REQUEST,
-                    detail="Delivery group has no items",
-                )
-
-            # 루돌프 조회
-            reindeer = (
-                tx.query(Reindeer)
-                .filter(Reindeer.reindeer_id == group.reindeer_id)
-                .first()
-            )
-            if not reindeer:
-                raise HTTPException(
-                    status_code=404,
-                    detail="Reindeer not found for this group",
-                )
-
-            # READY + stamina / magic 조건 확인
-            if reindeer.status != "READY":
-                raise HTTPException(
-                    status_code=status.HTTP_400_BAD_REQUEST,
-                    detail="Reindeer is not READY",
-                )
-
-            if reindeer.current_stamina < 30 or reindeer.current_magic < 10:
-                raise HTTPException(
-                    status_code=status.HTTP_400_BAD_REQUEST,
-                    detail="Reindeer stamina/magic is not enough for delivery",
-                )
-            
-            from collections import defaultdict
-
-            needed_counts = defaultdict(int)
-            for item in items:
-                needed_counts[item.gift_id] += 1
-
-            shortages = []
-            
-            for gift_id, count_needed in needed_counts.items():
-                gift = tx.query(FinishedGoods).filter(FinishedGoods.gift_id == gift_id).first()
-            
-                if not gift:
-                    shortages.append(f"상품#{gift_id}(존재하지 않음)")
-                elif gift.stock_quantity < count_needed:
-                    shortages.append(f"{gift.gift_name} (부족: {count_needed - gift.stock_quantity}개)")
-
-            if shortages:
-                raise HTTPException(
-                    status_code=status.HTTP_400_BAD_REQUEST,
-                    detail=f"재고 부족 품목이 있습니다: {', '.join(shortages)}"
-                )
-
-            delivered_count = 0
-
-            # 각 아이/선물에 대해 배송 처리
-            for item in items:
-                # Child / Gift 조회
-                child = (
-                    tx.query(Child)
-                    .filter(Child.ChildID == item.child_id)
-                    .first()
-                )
-                if not child:
-                    raise HTTPException(
-                        status_code=404,
-                        detail=f"Child {item.child_id} not found",
-                    )
-
-                gift = (
-                    tx.query(FinishedGoods)
-                    .filter(FinishedGoods.gift_id == item.gift_id)
-                    .first()
-                )
-                if not gift:
-                    raise HTTPException(
-                        status_code=404,
-                        detail=f"Gift {item.gift_id} not found",
-                    )
-
-                # 이미 배송된 아이면 에러
-                if getattr(child, "DeliveryStatusCode", None) == "DELIVERED":
-                    raise HTTPException(
-                        status_code=status.HTTP_400_BAD_REQUEST,
-                        detail=f"Child {child.ChildID} already delivered",
-                    )
-
-                # 재고 부족 방지
-                if gift.stock_quantity <= 0:
-                    raise HTTPException(
-                        status_code=status.HTTP_400_BAD_REQUEST,
-                        detail=f"Not enough stock for gift {gift.gift_id}",
-                    )
-
-                # 상태 변경
-                child.DeliveryStatusCode = "DELIVERED"
-                gift.stock_quantity -= 1
-
-                # 배송 로그 기록
-                log = DeliveryLog(
-                    child_id=child.ChildID,
-                    gift_id=gift.gift_id,
-                    delivered_by_staff_id=staff_id
-                )
-                tx.add(log)
-
-                delivered_count += 1
-
-            # 루돌프 상태/스탯 변경
-            reindeer.current_stamina -= 10
-            reindeer.current_magic -= 10
-            reindeer.status = "ONDELIVERY"
-
-            # 그룹 상태 DONE 으로
-            group.status = "DONE"
-
-        # with 블록을 예외 없이 빠져나오면 COMMIT 완료
-
-        return {
-            "message": "Delivery completed",
-            "group_id": group_id,
-            "delivered_count": delivered_count,
-            "reindeer_id": group.reindeer_id,
-        }
-
-    except HTTPException as e:
-        # 비즈니스 에러 -> 그룹을 FAILED 로 표시
-        group.status = "FAILED"
-        db.commit()
-        raise e
-
-    except Exception as e:
-        # 예기치 못한 에러 -> 그룹 FAILED 처리 후 500
-        group.status = "FAILED"
-        db.commit()
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Delivery failed due to unexpected error",
-        )
+    job_id = submit_job(
+        "deliver_group",
+        {"group_id": group_id},
+        db_role=db.info["db_role"],
+        staff_id=db.info.get("staff_id"),
+    )
+    return JobSubmitted(job_id=job_id, status="QUEUED")
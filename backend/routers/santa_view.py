@@ -1,14 +1,20 @@
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
+from fastapi.responses import JSONResponse
 from sqlalchemy.orm import Session
-from sqlalchemy import func
+from sqlalchemy import func, select
 
 from backend.database import get_db, get_authorized_db
 from backend.models.child import Child, Wishlist
-from backend.models.gift import FinishedGoods
+from backend.models.region import Region
+from backend.models.santa_target import SantaTargetSummary
 from backend.schemas.santa_schema import (
     SantaTargetOut,
     SantaTargetDetailOut,
+    GiftAllocationOut,
+    SantaTargetRegionCount,
+    SantaTargetSummaryOut,
 )
+from backend.services.allocation import allocate_gifts
 from backend.schemas.child_schema import WishlistItemOut
 
 router = APIRouter(
@@ -17,9 +23,72 @@ router = APIRouter(
 )
 
 
+# /santa/targets 에서 선택 가능한 필드 -> 컬럼
+TARGET_FIELDS = {
+    "child_id": Child.ChildID,
+    "name": Child.Name,
+    "address": Child.Address,
+    "region_id": Child.RegionID,
+    "region_name": Region.RegionName,
+    "status_code": Child.StatusCode,
+    "delivery_status_code": Child.DeliveryStatusCode,
+}
+
+# /santa/targets 한 페이지 최대 크기
+MAX_TARGET_PAGE_SIZE = 5000
+
+
+def santa_targets_query(fields: list[str], region_id: int | None = None, cursor: int | None = None):
+    '''
+    배송 대상(NICE + 미배송) 컬럼 조회 쿼리 (동기/비동기 공용)
+
+    - 필요한 컬럼만 SELECT, 지역명은 regions 와 JOIN (아이별 lazy load 없음)
+    - ChildID 는 keyset 페이지네이션용으로 항상 포함
+    - ChildID 순 정렬 (ix_child_santa_targets 부분 인덱스 사용)
+    '''
+    columns = [TARGET_FIELDS[f].label(f) for f in fields if f != "child_id"]
+
+    query = (
+        select(Child.ChildID.label("child_id"), *columns)
+        .where(Child.StatusCode == "NICE")
+        .where(Child.DeliveryStatusCode != "DELIVERED")
+        .order_by(Child.ChildID.asc())
+    )
+
+    if "region_name" in fields:
+        query = query.outerjoin(Region, Child.RegionID == Region.RegionID)
+    if region_id is not None:
+        query = query.where(Child.RegionID == region_id)
+    if cursor is not None:
+        query = query.where(Child.ChildID > cursor)
+
+    return query
+
+
+def parse_target_fields(fields: str | None) -> list[str]:
+    '''
+    "name,address" -> ["name", "address"] (없으면 전체 필드)
+    '''
+    if not fields:
+        return list(TARGET_FIELDS)
+
+    selected = [f.strip() for f in fields.split(",") if f.strip()]
+    unknown = [f for f in selected if f not in TARGET_FIELDS]
+    if unknown:
+        raise HTTPException(
+            status_code=400,
+            detail=f"알 수 없는 필드: {unknown} (가능: {list(TARGET_FIELDS)})",
+        )
+    return selected
+
+
 @router.get("/targets", response_model=list[SantaTargetOut])
 def get_santa_targets(
+    response: Response,
     region_id: int | None = None,
+    cursor: int | None = Query(None, description="이전 페이지 마지막 ChildID (X-Next-Cursor 값)"),
+    limit: int | None = Query(None, ge=1, le=MAX_TARGET_PAGE_SIZE, description="페이지 크기 (없으면 전체)"),
+    fields: str | None = Query(None, description="쉼표로 구분한 반환 필드 (예: child_id,name,region_name)"),
     db: Session = Depends(get_authorized_db),
 ):
     '''
@@ -29,32 +98,81 @@ def get_santa_targets(
     - NICE 상태
     - 아직 DELIVERED 아님
     - (선택) region_id로 지역 필터링
+
+    - ChildID 기준 keyset 페이지네이션 (다음 페이지가 있으면 X-Next-Cursor 헤더)
+    - fields 를 주면 해당 필드만 SELECT 해서 그대로 반환
+    - ORM 객체 없이 컬럼 행으로 바로 응답 생성
     '''
+    selected = parse_target_fields(fields)
+    query = santa_targets_query(selected, region_id, cursor)
 
-    query = (
-        db.query(Child)
-        .filter(func.upper(Child.StatusCode) == "NICE")
-        .filter(func.upper(Child.DeliveryStatusCode) != "DELIVERED")
-    )
+    if limit is not None:
+        query = query.limit(limit + 1)
 
-    if region_id is not None:
-        query = query.filter(Child.RegionID == region_id)
+    rows = db.execute(query).mappings().all()
+
+    next_cursor = None
+    if limit is not None and len(rows) > limit:
+        rows = rows[:limit]
+        next_cursor = str(rows[-1]["child_id"])
 
-    children = query.all()
+    headers = {"X-Next-Cursor": next_cursor} if next_cursor else {}
+
+    # 필드 선택 시 response_model 검증 없이 선택한 필드만 반환
+    if fields:
+        return JSONResponse(
+            content=[{f: row[f] for f in selected} for row in rows],
+            headers=headers,
+        )
 
+    response.headers.update(headers)
     return [
         SantaTargetOut(
-            child_id=c.ChildID,
-            name=c.Name,
-            address=c.Address,
-            region_id=c.RegionID,
-            region_name=c.region.RegionName if getattr(c, "region", None) else None,
-            status_code=c.StatusCode,
-            delivery_status_code=c.DeliveryStatusCode,
+            child_id=row["child_id"],
+            name=row["name"],
+            address=row["address"],
+            region_id=row["region_id"],
+            region_name=row["region_name"],
+            status_code=row["status_code"],
+            delivery_status_code=row["delivery_status_code"],
+        )
+        for row in rows
+    ]
+
+
+# /targets/{child_id} 보다 먼저 등록해야 "summary" 가 child_id 로 해석되지 않음
+@router.get("/targets/summary", response_model=SantaTargetSummaryOut)
+def get_santa_target_summary(db: Session = Depends(get_authorized_db)):
+    '''
+    지역별 배송 대상(NICE + 미배송) 아이 수
+
+    - child 를 집계하지 않고 santa_target_summary 읽기 모델에서 조회 (지역 수만큼의 행)
+    - 대상이 없는 지역도 0 으로 포함
+    '''
+    rows = db.execute(
+        select(
+            Region.RegionID,
+            Region.RegionName,
+            func.coalesce(SantaTargetSummary.target_count, 0).label("target_count"),
         )
-        for c in children
+        .outerjoin(SantaTargetSummary, SantaTargetSummary.region_id == Region.RegionID)
+        .order_by(Region.RegionID.asc())
+    ).all()
+
+    regions = [
+        SantaTargetRegionCount(
+            region_id=row.RegionID,
+            region_name=row.RegionName,
+            target_count=row.target_count,
+        )
+        for row in rows
     ]
 
+    return SantaTargetSummaryOut(
+        total=sum(r.target_count for r in regions),
+        regions=regions,
+    )
+
 
 @router.get("/targets/{child_id}", response_model=SantaTargetDetailOut)
 def get_santa_target_detail(
@@ -66,25 +184,41 @@ def get_santa_target_detail(
 
     - NICE + !DELIVERED 조건을 만족하는 아이만 조회 가능
     - 그렇지 않으면 404
+    - 아이+지역명 1번, wishlist 1번 (컬럼 조회)
     '''
 
-    child = (
-        db.query(Child)
-        .filter(Child.ChildID == child_id)
-        .filter(func.upper(Child.StatusCode) == "NICE")
-        .filter(func.upper(Child.DeliveryStatusCode) != "DELIVERED")
-        .first()
-    )
+    child = db.execute(
+        select(
+            Child.ChildID,
+            Child.Name,
+            Child.Address,
+            Child.RegionID,
+            Region.RegionName,
+            Child.StatusCode,
+            Child.DeliveryStatusCode,
+            Child.ChildNote,
+        )
+        .outerjoin(Region, Child.RegionID == Region.RegionID)
+        .where(Child.ChildID == child_id)
+        .where(Child.StatusCode == "NICE")
+        .where(Child.DeliveryStatusCode != "DELIVERED")
+    ).first()
 
     if not child:
         raise HTTPException(status_code=404, detail="Santa target not found")
 
+    wishlist = db.execute(
+        select(Wishlist.WishlistID, Wishlist.GiftID, Wishlist.Priority)
+        .where(Wishlist.ChildID == child_id)
+        .order_by(Wishlist.Priority.asc())
+    ).all()
+
     return SantaTargetDetailOut(
         child_id=child.ChildID,
         name=child.Name,
         address=child.Address,
         region_id=child.RegionID,
-        region_name=child.region.RegionName if getattr(child, "region", None) else None,
+        region_name=child.RegionName,
         status_code=child.StatusCode,
         delivery_status_code=child.DeliveryStatusCode,
         child_note=child.ChildNote,
@@ -94,10 +228,11 @@ def get_santa_target_detail(
                 gift_id=w.GiftID,
                 priority=w.Priority,
             )
-            for w in child.wishlist_items
+            for w in wishlist
         ],
     )
 
+
 @router.get("/assign-gifts")
 def assign_gifts(
     region_id: int | None = None,
@@ -110,54 +245,29 @@ def assign_gifts(
     - Status = NICE
     - DeliveryStatus = PENDING
     - (optional) region_id 필터링
-    - wishlist를 priority ASC로 정렬
-    - 첫 번째로 재고가 있는 선물 선택
-    - 재고 없으면 child 제외
+    - wishlist를 priority ASC로 보면서 남은 재고 안에서 선택
+      (재고보다 많은 아이에게 같은 선물을 배정하지 않음)
+    - 재고 있는 선물이 없으면 child 제외
+    - 배정 방식은 backend/services/allocation.py 참고
     """
+    allocation = allocate_gifts(db, region_id)
 
-    # 배송 대상 Child 조회
-    query = (
-        db.query(Child)
-        .filter(func.upper(Child.StatusCode) == "NICE")
-        .filter(func.upper(Child.DeliveryStatusCode) == "PENDING")
-    )
-
-    if region_id is not None:
-        query = query.filter(Child.RegionID == region_id)
-
-    children = query.all()
-
-    result = []
-
-    # 각 Child의 wishlist에서 선물 선택
-    for child in children:
-        wishlist_items = (
-            db.query(Wishlist)
-            .filter(Wishlist.ChildID == child.ChildID)
-            .order_by(Wishlist.Priority.asc())   # priority ASC 정렬
-            .all()
-        )
-
-        selected_gift_id = None
-
-        # wishlist에서 첫 번째 재고 있는 gift 찾기
-        for w in wishlist_items:
-            stock = (
-                db.query(FinishedGoods.stock_quantity)
-                .filter(FinishedGoods.gift_id == w.GiftID)
-                .scalar()
-            )
+    return [
+        {"child_id": a["child_id"], "gift_id": a["gift_id"]}
+        for a in allocation["assignments"]
+    ]
 
-            # 재고 있는 gift 발견 -> 바로 선택
-            if stock and stock > 0:
-                selected_gift_id = w.GiftID
-                break
 
-        # 재고가 있는 선물이 있는 경우만 결과에 추가
-        if selected_gift_id is not None:
-            result.append({
-                "child_id": child.ChildID,
-                "gift_id": selected_gift_id
-            })
+@router.get("/allocate-gifts", response_model=GiftAllocationOut)
+def allocate_gifts_report(
+    region_id: int | None = None,
+    db: Session = Depends(get_authorized_db),
+):
+    """
+    재고를 고려한 선물 배정 결과 + 선물별 부족 수량
 
-    return result
\ No newline at end of file
+    - assignments: 아이별 배정 선물 (priority 는 배정된 wishlist 항목의 Priority 값)
+    - unassigned_child_ids: 배정받지 못한 아이
+    - gifts: 선물별 재고 / 배정 수 / 남은 재고 / 충족 못 한 수요
+    """
+    return allocate_gifts(db, region_id)
@@ -4,6 +4,7 @@ from sqlalchemy.orm import Session
 from backend.database import get_db, get_authorized_db
 from backend.models.staff import Staff
 from backend.schemas.staff_schema import StaffCreate, StaffOut
+from backend.utils.staff_cache import staff_role_cache
 
 router = APIRouter(
     prefix="/staff",
@@ -36,6 +37,9 @@ def create_staff(payload: StaffCreate, db: Session = Depends(get_authorized_db))
     db.commit()
     db.refresh(staff)
 
+    # 계정 생성/변경 시 StaffID -> Role 캐시 무효화
+    staff_role_cache.invalidate(staff.StaffID)
+
     return StaffOut(
         staff_id=staff.StaffID,
         username=staff.Username,
@@ -10,3 +10,7 @@ class LoginResponse(BaseModel):
     username: str
     name: str
     role: str
+
+    # 이후 요청의 Authorization: Bearer <token> 헤더에 사용
+    token: str
+    token_expires_at: int
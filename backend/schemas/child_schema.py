@@ -145,4 +145,67 @@ class ChildNoteOut(BaseModel):
     child_id: int
     child_note: Optional[str]
 
-    model_config = ConfigDict(from_attributes=True)
\ No newline at end of file
+    model_config = ConfigDict(from_attributes=True)
+
+# 대량 등록 결과
+class ChildImportError(BaseModel):
+    '''
+    대량 등록 시 실패한 행 정보 (row 는 0부터 시작, CSV 는 헤더 제외)
+    '''
+    row: int
+    detail: str
+
+
+class ChildImportResult(BaseModel):
+    '''
+    POST /list-elf/child/import 응답
+    '''
+    received: int
+    inserted: int
+    failed: int
+    wishlist_inserted: int
+    elapsed_ms: float
+    rows_per_sec: float
+    errors: List[ChildImportError]
+
+
+# 일괄 판정 (NICE / NAUGHTY ...)
+class ChildJudgementItem(BaseModel):
+    '''
+    아이 1명에 대한 판정
+    - child_note 가 None 이면 기존 메모 유지
+    '''
+    child_id: int
+    status_code: str
+    child_note: Optional[str] = None
+
+
+class ChildJudgementBatch(BaseModel):
+    '''
+    POST /list-elf/child/judgements 입력
+    '''
+    items: List[ChildJudgementItem] = Field(..., min_length=1)
+
+
+class ChildJudgementResult(BaseModel):
+    '''
+    일괄 판정 결과
+    - not_found: 존재하지 않는 child_id 목록
+    '''
+    requested: int
+    updated: int
+    not_found: List[int]
+
+
+# 이름/주소 검색 결과
+class ChildSearchOut(BaseModel):
+    '''
+    GET /list-elf/child/search 결과 (score 가 높을수록 유사)
+    '''
+    child_id: int
+    name: str
+    address: str
+    region_id: int
+    status_code: str
+    delivery_status_code: str
+    score: float
@@ -0,0 +1,42 @@
+from datetime import datetime
+from typing import Any, Optional
+
+from pydantic import BaseModel, ConfigDict
+
+
+class JobSubmitted(BaseModel):
+    """
+    백그라운드 작업 등록 응답
+    """
+    job_id: int
+    status: str
+
+
+class JobStatusResponse(BaseModel):
+    """
+    GET /jobs/{job_id} 응답 (진행률)
+    - progress: progress_done / progress_total (total 을 모르면 None)
+    """
+    model_config = ConfigDict(from_attributes=True)
+
+    job_id: int
+    kind: str
+    status: str
+    progress_done: int
+    progress_total: Optional[int] = None
+    progress: Optional[float] = None
+    error: Optional[str] = None
+    created_by_staff_id: Optional[int] = None
+    created_at: datetime
+    started_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
+
+
+class JobResultResponse(BaseModel):
+    """
+    GET /jobs/{job_id}/result 응답
+    """
+    job_id: int
+    status: str
+    result: Optional[Any] = None
+    error: Optional[str] = None
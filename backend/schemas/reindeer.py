@@ -21,6 +21,7 @@ class ReindeerBase(BaseModel):
 # 조회 응답용 스키마
 class ReindeerResponse(ReindeerBase):
     reindeer_id: int
+    version_id: int | None = None  # 수정 요청 시 그대로 보내야 함 (update-status)
 
     class Config:
         from_attributes = True
@@ -32,6 +33,7 @@ class ReindeerUpdateStatus(BaseModel):
     status: str  # READY / RESTING / ONDELIVERY
     current_stamina: int
     current_magic: int
+    version_id: int | None = None  # 조회했을 때의 version_id (또는 If-Match 헤더)
 
     @field_validator("status")
     @classmethod
@@ -1,7 +1,7 @@
 from datetime import datetime
 from typing import List
 
-from pydantic import BaseModel, ConfigDict
+from pydantic import BaseModel, ConfigDict, Field
 
 # 생성용 스키마
 class DeliveryGroupCreate(BaseModel):
@@ -14,6 +14,70 @@ class DeliveryGroupItemCreate(BaseModel):
     gift_id: int
 
 
+class DeliveryGroupItemBulkCreate(BaseModel):
+    """
+    그룹에 여러 아이/선물을 한 번에 추가
+    """
+    items: List[DeliveryGroupItemCreate] = Field(..., min_length=1)
+
+
+class DeliveryGroupItemRejected(BaseModel):
+    """
+    일괄 추가에서 제외된 항목과 사유
+    """
+    child_id: int
+    gift_id: int
+    reason: str
+
+
+class DeliveryGroupItemBulkResult(BaseModel):
+    """
+    일괄 추가 결과
+    """
+    group_id: int
+    requested: int
+    added: int
+    rejected: List[DeliveryGroupItemRejected]
+
+
+class DeliveryGroupPlanRequest(BaseModel):
+    """
+    배송 그룹 자동 편성 옵션
+    - items_per_point: 루돌프 min(stamina, magic) 1 당 실을 수 있는 아이 수
+    - max_group_size: 그룹 1개 최대 아이 수 (없으면 용량만 적용)
+    - dry_run: True 면 INSERT 없이 편성 결과만 반환
+    """
+    region_id: int | None = None
+    items_per_point: int = Field(10, ge=1)
+    max_group_size: int | None = Field(None, ge=1)
+    dry_run: bool = False
+
+
+class DeliveryGroupPlanned(BaseModel):
+    """
+    편성된 그룹 1개 (dry_run 이면 group_id 없음)
+    """
+    group_id: int | None = None
+    group_name: str
+    region_id: int
+    reindeer_id: int
+    capacity: int
+    item_count: int
+
+
+class DeliveryGroupPlanResult(BaseModel):
+    """
+    자동 편성 결과
+    - unplanned_no_capacity: 선물은 배정됐지만 루돌프 용량이 모자라 남은 아이 수
+    - unassigned_no_stock: 재고가 없어 선물을 배정하지 못한 아이 수
+    """
+    groups: List[DeliveryGroupPlanned]
+    planned: int
+    unplanned_no_capacity: int
+    unassigned_no_stock: int
+    dry_run: bool
+
+
 # 응답용 스키마
 class DeliveryGroupListItemResponse(BaseModel):
     """
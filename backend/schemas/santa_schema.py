@@ -39,3 +39,55 @@ class SantaTargetDetailOut(BaseModel):
     wishlist: List[WishlistItemOut]
 
     model_config = ConfigDict(from_attributes=True)
+
+
+class GiftAssignmentOut(BaseModel):
+    '''
+    아이 1명에게 배정된 선물 (priority: 배정된 wishlist 항목의 Priority 값)
+    '''
+
+    child_id: int
+    gift_id: int
+    priority: int
+
+
+class GiftStockUsageOut(BaseModel):
+    '''
+    선물별 배정 결과
+    - unmet_demand: 이 선물을 더 원했지만 재고 부족으로 받지 못한 아이 수
+    '''
+
+    gift_id: int
+    stock: int
+    assigned: int
+    remaining: int
+    unmet_demand: int
+
+
+class GiftAllocationOut(BaseModel):
+    '''
+    GET /santa/allocate-gifts 응답용
+    '''
+
+    assignments: List[GiftAssignmentOut]
+    unassigned_child_ids: List[int]
+    gifts: List[GiftStockUsageOut]
+
+
+class SantaTargetRegionCount(BaseModel):
+    '''
+    지역별 배송 대상 수
+    '''
+
+    region_id: int
+    region_name: Optional[str] = None
+    target_count: int
+
+
+class SantaTargetSummaryOut(BaseModel):
+    '''
+    GET /santa/targets/summary 응답용
+    '''
+
+    total: int
+    regions: List[SantaTargetRegionCount]
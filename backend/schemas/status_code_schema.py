@@ -9,7 +9,7 @@ class StatusCodeBase(BaseModel):
 class StatusCodeCreate(StatusCodeBase):
     """
     상태 코드 생성 요청 바디
-    - code: "Nice", "Naughty", "Pending", "Delivered", "SPECIAL" 등
+    - code: "NICE", "NAUGHTY", "PENDING", "DELIVERED", "SPECIAL" 등 (대문자로 저장)
     - description: 한국어/설명용 텍스트
     """
     pass
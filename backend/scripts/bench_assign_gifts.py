@@ -0,0 +1,177 @@
+'''
+/santa/assign-gifts 선물 선정 벤치마크
+
+사용법 (먼저 generate_season 으로 10만 명 이상 데이터 생성):
+    python -m backend.scripts.generate_season --children 100000
+    python -m backend.scripts.bench_assign_gifts --repeat 5
+    python -m backend.scripts.bench_assign_gifts --legacy-limit 2000
+
+- 현재 방식: allocate_gifts (쿼리 2번 + NumPy 배정, 재고 소모 반영)
+    total = 조회 + 배정 전체, load = load_allocation_input (COPY + 파싱), solve = 배열 계산만
+- --legacy-limit N: 이전 방식(아이 -> wishlist -> 재고 행 단위 조회)을 N 명에 대해 실행해 비교
+- 실행 시간, 실행된 SQL 문 수 (raw cursor 로 실행되는 COPY 포함), 재고를 넘겨 배정된 선물 수 출력
+'''
+import argparse
+import statistics
+import time
+from collections import Counter
+
+from sqlalchemy import event
+
+from backend.database import SessionLocal, engine
+from backend.models.child import Child, Wishlist
+from backend.models.gift import FinishedGoods
+from backend.services import allocation
+from backend.services.allocation import (
+    allocate_gifts,
+    fair_order,
+    load_allocation_input,
+    solve_allocation,
+)
+
+
+class QueryCounter:
+    '''
+    engine 에서 실행된 SQL 문 수 세기
+
+    - before_cursor_execute 이벤트로 SQLAlchemy 를 거치는 문장
+    - allocation 의 COPY 는 DBAPI cursor 로 직접 실행돼 이벤트가 발생하지 않으므로 따로 셈
+    '''
+
+    def __init__(self):
+        self.count = 0
+        self._copy_int_rows = None
+
+    def __enter__(self):
+        event.listen(engine, "before_cursor_execute", self._on_execute)
+
+        self._copy_int_rows = allocation._copy_int_rows
+
+        def counted_copy(*args, **kwargs):
+            self.count += 1
+            return self._copy_int_rows(*args, **kwargs)
+
+        allocation._copy_int_rows = counted_copy
+        return self
+
+    def __exit__(self, *exc):
+        event.remove(engine, "before_cursor_execute", self._on_execute)
+        allocation._copy_int_rows = self._copy_int_rows
+
+    def _on_execute(self, *args):
+        self.count += 1
+
+
+def legacy_assign_gifts(db, region_id=None, limit=None):
+    '''
+    이전 구현 (아이별 wishlist 조회 + wishlist 항목별 재고 조회)
+    '''
+    query = (
+        db.query(Child)
+        .filter(Child.StatusCode == "NICE")
+        .filter(Child.DeliveryStatusCode == "PENDING")
+        .order_by(Child.ChildID.asc())
+    )
+    if region_id is not None:
+        query = query.filter(Child.RegionID == region_id)
+    if limit is not None:
+        query = query.limit(limit)
+
+    result = []
+    for child in query.all():
+        wishlist_items = (
+            db.query(Wishlist)
+            .filter(Wishlist.ChildID == child.ChildID)
+            .order_by(Wishlist.Priority.asc())
+            .all()
+        )
+        for w in wishlist_items:
+            stock = (
+                db.query(FinishedGoods.stock_quantity)
+                .filter(FinishedGoods.gift_id == w.GiftID)
+                .scalar()
+            )
+            if stock and stock > 0:
+                result.append((child.ChildID, w.GiftID))
+                break
+    return result
+
+
+def _measure(fn, repeat):
+    timings = []
+    for _ in range(repeat):
+        with QueryCounter() as counter:
+            started = time.perf_counter()
+            rows = fn()
+            timings.append(time.perf_counter() - started)
+    return rows, timings, counter.count
+
+
+def _report(label, rows, timings, queries):
+    print(
+        f"{label:8} rows={len(rows):>9,}  queries={queries:>7,}  "
+        f"median={statistics.median(timings) * 1000:9.1f}ms  min={min(timings) * 1000:9.1f}ms"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="assign-gifts benchmark")
+    parser.add_argument("--region-id", type=int, default=None)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--legacy-limit", type=int, default=None,
+                        help="이전 구현도 N 명에 대해 실행해서 비교")
+    args = parser.parse_args()
+
+    db = SessionLocal()
+    try:
+        targets = (
+            db.query(Child)
+            .filter(Child.StatusCode == "NICE")
+            .filter(Child.DeliveryStatusCode == "PENDING")
+            .count()
+        )
+        print(f"배송 대상 아이 수: {targets:,}")
+
+        allocation, timings, queries = _measure(
+            lambda: allocate_gifts(db, args.region_id), args.repeat
+        )
+        rows = allocation["assignments"]
+        _report("total", rows, timings, queries)
+
+        # 조회와 배정 계산 시간을 나눠서 출력 (대규모에서는 조회가 대부분)
+        data, timings, queries = _measure(
+            lambda: load_allocation_input(db, args.region_id), args.repeat
+        )
+        _report("load", data["child_ids"], timings, queries)
+
+        order = fair_order(data["region_ids"])
+        assigned, timings, queries = _measure(
+            lambda: solve_allocation(data["wishes"], data["stock"], order)[0], args.repeat
+        )
+        _report("solve", assigned, timings, queries)
+
+        unmet = sorted(allocation["gifts"], key=lambda g: g["unmet_demand"], reverse=True)[:5]
+        print("미배정 아이:", f"{len(allocation['unassigned_child_ids']):,}")
+        print("부족 상위 선물:", [(g["gift_id"], g["unmet_demand"]) for g in unmet])
+
+        if args.legacy_limit:
+            legacy, timings, queries = _measure(
+                lambda: legacy_assign_gifts(db, args.region_id, args.legacy_limit), 1
+            )
+            _report("legacy", legacy, timings, queries)
+
+            # 이전 방식은 재고를 소모하지 않으므로 재고보다 많이 배정될 수 있음
+            stock = {g["gift_id"]: g["stock"] for g in allocation["gifts"]}
+            over = {
+                gift_id: count - stock.get(gift_id, 0)
+                for gift_id, count in Counter(gift_id for _, gift_id in legacy).items()
+                if count > stock.get(gift_id, 0)
+            }
+            print("legacy 재고 초과 배정:", over or "없음")
+
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
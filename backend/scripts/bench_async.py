@@ -0,0 +1,76 @@
+'''
+동기 / 비동기 조회 API 처리량 비교 벤치마크
+
+사용법 (서버를 ASYNC_DB=1 로 띄운 뒤):
+    python -m backend.scripts.bench_async --staff-id 7 --requests 500 --concurrency 32
+
+- 같은 경로를 동기 버전(/...)과 비동기 버전(/async/...)으로 번갈아 호출
+- 경로별 requests/sec, p50/p95 지연시간(ms) 출력
+'''
+import argparse
+import statistics
+import time
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+
+DEFAULT_PATHS = [
+    "/list-elf/child/all",
+    "/santa/targets",
+    "/delivery-log/",
+    "/list-elf/stats/gift-demand/summary",
+    "/list-elf/stats/gift-demand/by-priority",
+]
+
+
+def _call(url: str, headers: dict) -> float:
+    started = time.perf_counter()
+    req = urllib.request.Request(url, headers=headers)
+    with urllib.request.urlopen(req) as res:
+        res.read()
+    return time.perf_counter() - started
+
+
+def run(url: str, headers: dict, total: int, concurrency: int) -> dict:
+    # 워밍업 (커넥션 풀 / 캐시 채우기)
+    for _ in range(min(concurrency, total)):
+        _call(url, headers)
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        latencies = list(pool.map(lambda _: _call(url, headers), range(total)))
+    elapsed = time.perf_counter() - started
+
+    latencies.sort()
+    return {
+        "rps": total / elapsed,
+        "p50_ms": statistics.median(latencies) * 1000,
+        "p95_ms": latencies[int(len(latencies) * 0.95) - 1] * 1000,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="sync vs async endpoint benchmark")
+    parser.add_argument("--base-url", default="http://127.0.0.1:8000")
+    parser.add_argument("--staff-id", required=True, help="X-Staff-ID (Santa/ListElf 계정)")
+    parser.add_argument("--token", default=None, help="로그인 토큰 (있으면 Authorization 헤더 사용)")
+    parser.add_argument("--requests", type=int, default=500)
+    parser.add_argument("--concurrency", type=int, default=32)
+    parser.add_argument("--path", action="append", dest="paths", help="측정할 경로 (여러 번 지정 가능)")
+    args = parser.parse_args()
+
+    headers = {"x-staff-id": str(args.staff_id)}
+    if args.token:
+        headers["Authorization"] = f"Bearer {args.token}"
+
+    print(f"{'path':45} {'mode':6} {'req/s':>9} {'p50(ms)':>9} {'p95(ms)':>9}")
+    for path in args.paths or DEFAULT_PATHS:
+        for mode, prefix in (("sync", ""), ("async", "/async")):
+            result = run(args.base_url + prefix + path, headers, args.requests, args.concurrency)
+            print(
+                f"{path:45} {mode:6} {result['rps']:9.1f} "
+                f"{result['p50_ms']:9.1f} {result['p95_ms']:9.1f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,28 @@
+'''
+DB bootstrap 수동 실행
+
+사용법:
+    python -m backend.scripts.bootstrap              # 항상 전체 bootstrap (fingerprint 무시)
+    python -m backend.scripts.bootstrap --if-changed # 서버 시작과 동일 (변경 시에만)
+'''
+import argparse
+
+from backend.utils.bootstrap import compute_fingerprint, run_bootstrap
+
+
+def main():
+    parser = argparse.ArgumentParser(description="SCDMS schema/seed/permission bootstrap")
+    parser.add_argument(
+        "--if-changed",
+        action="store_true",
+        help="fingerprint 가 바뀐 경우에만 실행",
+    )
+    args = parser.parse_args()
+
+    ran = run_bootstrap(force=not args.if_changed)
+    print(f"fingerprint: {compute_fingerprint()}")
+    print("bootstrap 실행 완료" if ran else "변경 없음 -> bootstrap 생략")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,278 @@
+'''
+시즌 규모 합성 데이터 생성기 (부하 테스트용)
+
+사용법:
+    python -m backend.scripts.generate_season --children 100000 --seed 42
+    python -m backend.scripts.generate_season --children 10000000 --production-logs 500000
+
+- child / wishlist / Production_Log / delivery_log 를 PostgreSQL COPY 로 스트리밍
+  (행을 메모리에 모아두지 않음 -> 1천만 명도 메모리 일정)
+- 같은 --seed 면 항상 같은 데이터 생성 (벤치마크 재현용)
+- regions / Finished_Goods / staff 는 기존 시드 데이터를 사용 (먼저 bootstrap 필요)
+'''
+import argparse
+import random
+import time
+from datetime import datetime, timedelta
+
+from backend.database import engine
+
+# 판정 상태 분포
+STATUS_WEIGHTS = {"NICE": 70, "PENDING": 20, "NAUGHTY": 10}
+
+# 지역별 아이 수 가중치 (RegionID 기준, 없는 지역은 1)
+REGION_WEIGHTS = {1: 3, 2: 12, 3: 14, 4: 40, 5: 10, 6: 16, 7: 5}
+
+# wishlist 개수 분포 (1~3개)
+WISHLIST_SIZE_WEIGHTS = {1: 20, 2: 30, 3: 50}
+
+NAME_SYLLABLES = [
+    "al", "ba", "ce", "da", "el", "fi", "ga", "ha", "io", "ja",
+    "ka", "li", "ma", "no", "ol", "pa", "ri", "sa", "ta", "ul",
+    "va", "wi", "xe", "ya", "zo", "ren", "mir", "tan", "sol", "bel",
+]
+LAST_NAMES = [
+    "Kim", "Lee", "Park", "Choi", "Smith", "Garcia", "Muller", "Rossi",
+    "Silva", "Tanaka", "Nguyen", "Okafor", "Brown", "Novak", "Singh", "Cohen",
+]
+STREETS = [
+    "Snow Road", "Reindeer Ave", "Polar Bear St", "Candy Lane", "Frozen River",
+    "Pine Hill", "Aurora Blvd", "Cocoa Street", "Mistletoe Way", "Sleigh Park",
+]
+
+
+def _weighted(weights: dict) -> tuple[list, list]:
+    keys = list(weights)
+    return keys, [weights[k] for k in keys]
+
+
+class CopyStream:
+    '''
+    문자열 제너레이터를 COPY FROM STDIN 용 file 객체로 감싸기
+    - psycopg2 가 read(size) 로 필요한 만큼만 가져감
+    '''
+
+    def __init__(self, lines):
+        self._lines = iter(lines)
+        self._buf = ""
+        self.rows = 0
+
+    def read(self, size: int = -1) -> str:
+        parts = [self._buf]
+        length = len(self._buf)
+        while size < 0 or length < size:
+            try:
+                line = next(self._lines)
+            except StopIteration:
+                break
+            parts.append(line)
+            length += len(line)
+            self.rows += 1
+
+        data = "".join(parts)
+        if size < 0:
+            self._buf = ""
+            return data
+        self._buf = data[size:]
+        return data[:size]
+
+    readline = read
+
+
+class SeasonGenerator:
+    '''
+    아이 1명 단위로 결정적(deterministic)인 데이터 생성
+
+    - 테이블마다 같은 seed 로 처음부터 다시 돌려서 필요한 컬럼만 출력
+      (child -> wishlist -> delivery_log 순서로 여러 번 순회해도 결과 동일)
+    '''
+
+    def __init__(self, seed, first_child_id, children, region_ids, gift_ids,
+                 delivered_ratio, season_year):
+        self.seed = seed
+        self.first_child_id = first_child_id
+        self.children = children
+        self.delivered_ratio = delivered_ratio
+        self.season_year = season_year
+
+        self.region_ids = region_ids
+        self.region_weights = [REGION_WEIGHTS.get(r, 1) for r in region_ids]
+
+        # 선물 인기도: Zipf 분포 (앞쪽 gift_id 일수록 인기)
+        self.gift_ids = gift_ids
+        self.gift_weights = [1 / (rank + 1) ** 1.1 for rank in range(len(gift_ids))]
+
+        self.status_keys, self.status_weights = _weighted(STATUS_WEIGHTS)
+        self.size_keys, self.size_weights = _weighted(WISHLIST_SIZE_WEIGHTS)
+
+    def iter_children(self):
+        '''
+        (child_id, name, address, region_id, status, delivery_status, wishlist) 순회
+        '''
+        rng = random.Random(self.seed)
+        max_wishes = min(max(self.size_keys), len(self.gift_ids))
+
+        for offset in range(self.children):
+            child_id = self.first_child_id + offset
+
+            name = (
+                "".join(rng.choice(NAME_SYLLABLES) for _ in range(rng.randint(2, 3))).capitalize()
+                + " " + rng.choice(LAST_NAMES)
+            )
+            address = f"{rng.randint(1, 9999)} {rng.choice(STREETS)}"
+            region_id = rng.choices(self.region_ids, self.region_weights)[0]
+            status = rng.choices(self.status_keys, self.status_weights)[0]
+
+            delivery_status = "PENDING"
+            if status == "NICE" and rng.random() < self.delivered_ratio:
+                delivery_status = "DELIVERED"
+
+            # 우선순위 순서대로 중복 없이 선물 선택 (인기 선물이 1순위에 몰림)
+            size = min(rng.choices(self.size_keys, self.size_weights)[0], max_wishes)
+            wishlist = []
+            while len(wishlist) < size:
+                gift_id = rng.choices(self.gift_ids, self.gift_weights)[0]
+                if gift_id not in wishlist:
+                    wishlist.append(gift_id)
+
+            yield child_id, name, address, region_id, status, delivery_status, wishlist
+
+    def child_lines(self):
+        for child_id, name, address, region_id, status, delivery_status, _ in self.iter_children():
+            yield f"{child_id}\t{name}\t{address}\t{region_id}\t{status}\t{delivery_status}\t\\N\n"
+
+    def wishlist_lines(self):
+        for child_id, *_, wishlist in self.iter_children():
+            for priority, gift_id in enumerate(wishlist, start=1):
+                yield f"{child_id}\t{gift_id}\t{priority}\n"
+
+    def delivery_log_lines(self, santa_ids):
+        rng = random.Random(self.seed + 1)
+        start = datetime(self.season_year, 12, 24, 18, 0, 0)
+        for child_id, *_, delivery_status, wishlist in self.iter_children():
+            if delivery_status != "DELIVERED":
+                continue
+            ts = start + timedelta(seconds=rng.randint(0, 12 * 3600))
+            yield f"{child_id}\t{wishlist[0]}\t{rng.choice(santa_ids)}\t{ts.isoformat(sep=' ')}\n"
+
+    def production_log_lines(self, count, elf_ids):
+        rng = random.Random(self.seed + 2)
+        start = datetime(self.season_year, 11, 1)
+        season_seconds = int((datetime(self.season_year, 12, 24) - start).total_seconds())
+        for _ in range(count):
+            gift_id = rng.choices(self.gift_ids, self.gift_weights)[0]
+            ts = start + timedelta(seconds=rng.randint(0, season_seconds))
+            yield f"{gift_id}\t{rng.randint(1, 20)}\t{rng.choice(elf_ids)}\t{ts.isoformat(sep=' ')}+00\n"
+
+
+def _copy(cursor, table_sql: str, lines) -> tuple[int, float]:
+    stream = CopyStream(lines)
+    started = time.perf_counter()
+    cursor.copy_expert(f"COPY {table_sql} FROM STDIN", stream)
+    return stream.rows, time.perf_counter() - started
+
+
+def _report(table: str, rows: int, elapsed: float) -> None:
+    rate = rows / elapsed if elapsed else 0.0
+    print(f"{table:16} {rows:>12,} rows  {elapsed:8.2f}s  {rate:12,.0f} rows/s")
+
+
+def generate(children: int, seed: int, production_logs: int,
+             delivered_ratio: float, season_year: int) -> None:
+    raw = engine.raw_connection()
+    try:
+        cursor = raw.cursor()
+
+        cursor.execute('SELECT "RegionID" FROM regions ORDER BY "RegionID"')
+        region_ids = [r[0] for r in cursor.fetchall()]
+        cursor.execute('SELECT gift_id FROM "Finished_Goods" ORDER BY gift_id')
+        gift_ids = [r[0] for r in cursor.fetchall()]
+        cursor.execute('SELECT "StaffID", "Role" FROM staff ORDER BY "StaffID"')
+        staff = cursor.fetchall()
+
+        if not region_ids or not gift_ids or not staff:
+            raise SystemExit("regions / Finished_Goods / staff 시드가 없습니다. 먼저 bootstrap 을 실행하세요.")
+
+        santa_ids = [sid for sid, role in staff if role == "Santa"] or [staff[0][0]]
+        elf_ids = [sid for sid, role in staff if role == "GiftElf"] or [staff[0][0]]
+
+        # ChildID 구간 예약 (COPY 중 다른 INSERT 와 겹치지 않도록 테이블 잠금)
+        cursor.execute("LOCK TABLE child IN SHARE ROW EXCLUSIVE MODE")
+        cursor.execute('''SELECT pg_get_serial_sequence('child', 'ChildID')''')
+        child_seq = cursor.fetchone()[0]
+        cursor.execute('SELECT COALESCE(MAX("ChildID"), 0) + 1 FROM child')
+        first_child_id = cursor.fetchone()[0]
+        if children:
+            cursor.execute("SELECT setval(%s, %s)", (child_seq, first_child_id + children - 1))
+
+        gen = SeasonGenerator(
+            seed=seed,
+            first_child_id=first_child_id,
+            children=children,
+            region_ids=region_ids,
+            gift_ids=gift_ids,
+            delivered_ratio=delivered_ratio,
+            season_year=season_year,
+        )
+
+        _report("child", *_copy(
+            cursor,
+            'child ("ChildID", "Name", "Address", "RegionID", "StatusCode", "DeliveryStatusCode", "ChildNote")',
+            gen.child_lines(),
+        ))
+        _report("wishlist", *_copy(
+            cursor,
+            'wishlist ("ChildID", "GiftID", "Priority")',
+            gen.wishlist_lines(),
+        ))
+        _report("delivery_log", *_copy(
+            cursor,
+            "delivery_log (child_id, gift_id, delivered_by_staff_id, delivery_timestamp)",
+            gen.delivery_log_lines(santa_ids),
+        ))
+        _report("Production_Log", *_copy(
+            cursor,
+            '"Production_Log" (gift_id, quantity_produced, produced_by_staff_id, timestamp)',
+            gen.production_log_lines(production_logs, elf_ids),
+        ))
+
+        raw.commit()
+
+        # 대량 적재 후 통계 갱신 (플래너가 실제 규모 기준으로 계획하도록)
+        cursor.execute('ANALYZE child, wishlist, delivery_log, "Production_Log"')
+        raw.commit()
+
+    except Exception:
+        raw.rollback()
+        raise
+
+    finally:
+        raw.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="season-scale synthetic data generator")
+    parser.add_argument("--children", type=int, default=10_000, help="생성할 아이 수 (10k ~ 10M)")
+    parser.add_argument("--seed", type=int, default=42, help="난수 seed (같으면 같은 데이터)")
+    parser.add_argument("--production-logs", type=int, default=None,
+                        help="생산 로그 수 (기본: 아이 수 / 50)")
+    parser.add_argument("--delivered-ratio", type=float, default=0.1,
+                        help="NICE 아이 중 DELIVERED 비율")
+    parser.add_argument("--season-year", type=int, default=datetime.now().year)
+    args = parser.parse_args()
+
+    production_logs = args.production_logs
+    if production_logs is None:
+        production_logs = args.children // 50
+
+    generate(
+        children=args.children,
+        seed=args.seed,
+        production_logs=production_logs,
+        delivered_ratio=args.delivered_ratio,
+        season_year=args.season_year,
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,28 @@
+'''
+santa_target_summary 읽기 모델 전체 재계산 (복구용)
+
+사용법:
+    python -m backend.scripts.rebuild_target_summary
+
+- 트리거가 빠졌던 기간이 있거나 값이 의심될 때 실행
+- 재계산 중에는 child 쓰기가 잠시 대기함 (SHARE 잠금)
+'''
+import time
+
+from sqlalchemy import text
+
+from backend.database import engine
+
+
+def main():
+    started = time.perf_counter()
+    with engine.begin() as conn:
+        total = conn.execute(text("SELECT santa_target_summary_rebuild()")).scalar()
+        regions = conn.execute(text("SELECT count(*) FROM santa_target_summary")).scalar()
+
+    elapsed = time.perf_counter() - started
+    print(f"santa_target_summary 재계산 완료: {regions}개 지역, 대상 {total:,}명 ({elapsed:.2f}s)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,233 @@
+'''
+재고를 고려한 선물 배정 (NumPy 벡터 연산)
+
+- 아이마다 wishlist 를 priority 순으로 보고, 남은 재고 안에서만 배정
+- 1순위를 모든 아이에게 먼저 배정한 뒤 남은 아이에게 2순위, 3순위 ... 순서로 진행
+  (한 아이의 2순위가 다른 아이의 1순위보다 먼저 재고를 가져가지 않음)
+- 같은 선물을 두고 경쟁할 때는 지역별 비례 순서로 처리
+  (각 지역 안에서는 ChildID 순, 지역 간에는 "지역 내 순위 / 지역 아이 수" 가 작은 쪽 먼저
+   -> 재고가 부족하면 지역별 수요에 비례해서 나눠 가짐)
+- 아이 수 N, wishlist 최대 길이 P 일 때 루프는 P 번뿐 (나머지는 배열 연산)
+- 입력 조회는 COPY (SELECT ...) TO STDOUT 로 받아서 바로 NumPy 배열로 변환
+  (100만 명 규모에서는 ORM 행 객체를 만드는 시간이 배정 계산보다 훨씬 큼)
+'''
+import io
+
+import numpy as np
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from backend.models.gift import FinishedGoods
+
+NO_GIFT = -1
+
+
+def _copy_int_rows(db: Session, sql: str, params: dict, columns: int) -> np.ndarray:
+    '''
+    정수 컬럼만 있는 SELECT 결과를 COPY TO STDOUT 으로 받아 (행 수, columns) int64 배열로 변환
+
+    - 세션의 현재 트랜잭션/연결에서 실행 (SET LOCAL ROLE, advisory lock 그대로 적용)
+    - 행마다 Python 객체를 만들지 않고 텍스트 한 덩어리를 np.loadtxt 로 파싱
+    '''
+    cursor = db.connection().connection.cursor()
+    try:
+        query = cursor.mogrify(sql, params).decode("utf-8")
+        buffer = io.StringIO()
+        cursor.copy_expert(f"COPY ({query}) TO STDOUT", buffer)
+    finally:
+        cursor.close()
+
+    if buffer.tell() == 0:
+        return np.empty((0, columns), dtype=np.int64)
+
+    buffer.seek(0)
+    return np.loadtxt(buffer, dtype=np.int64, delimiter="\t", ndmin=2).reshape(-1, columns)
+
+
+def load_allocation_input(db: Session, region_id: int | None = None) -> dict:
+    '''
+    배정에 필요한 데이터를 쿼리 2번으로 조회해서 NumPy 배열로 변환
+
+    - child_ids (N,), region_ids (N,): 배송 대상 아이 (NICE + PENDING, wishlist 있는 아이만)
+    - wishes (N, P): 아이별 선물 인덱스 (priority 순, 없으면 NO_GIFT)
+    - priorities (N, P): wishes 와 같은 위치의 Wishlist.Priority 값 (없으면 0)
+    - gift_ids (G,), stock (G,): 선물 ID / 현재 재고
+    '''
+    gift_rows = db.execute(
+        select(FinishedGoods.gift_id, FinishedGoods.stock_quantity)
+        .order_by(FinishedGoods.gift_id.asc())
+    ).all()
+    gift_ids = np.array([g for g, _ in gift_rows], dtype=np.int64)
+    stock = np.array([max(s or 0, 0) for _, s in gift_rows], dtype=np.int64)
+
+    # 아이/wishlist 는 행 수가 많으므로 COPY 로 한 번에 받음
+    region_filter = 'AND c."RegionID" = %(region_id)s' if region_id is not None else ""
+    rows = _copy_int_rows(
+        db,
+        f'''
+            SELECT c."ChildID", c."RegionID", w."GiftID", w."Priority"
+            FROM child c
+            JOIN wishlist w ON w."ChildID" = c."ChildID"
+            WHERE c."StatusCode" = 'NICE'
+              AND c."DeliveryStatusCode" = 'PENDING'
+              {region_filter}
+            ORDER BY c."ChildID", w."Priority"
+        ''',
+        {"region_id": region_id},
+        columns=4,
+    )
+    if len(rows) == 0:
+        return {
+            "child_ids": np.array([], dtype=np.int64),
+            "region_ids": np.array([], dtype=np.int64),
+            "wishes": np.full((0, 0), NO_GIFT, dtype=np.int64),
+            "priorities": np.zeros((0, 0), dtype=np.int64),
+            "gift_ids": gift_ids,
+            "stock": stock,
+        }
+
+    row_child, row_region, row_gift, row_priority = rows[:, 0], rows[:, 1], rows[:, 2], rows[:, 3]
+
+    # (ChildID, Priority) 순으로 정렬돼 있으므로 ChildID 가 바뀌는 지점이 아이 경계
+    new_child = np.r_[True, row_child[1:] != row_child[:-1]]
+    starts = np.flatnonzero(new_child)
+    child_index = np.cumsum(new_child) - 1
+    rank = np.arange(len(rows)) - starts[child_index]
+
+    # 선물 ID -> 인덱스 (Finished_Goods 에 없는 선물은 NO_GIFT)
+    gift_index = np.full(len(rows), NO_GIFT, dtype=np.int64)
+    if len(gift_ids):
+        pos = np.minimum(np.searchsorted(gift_ids, row_gift), len(gift_ids) - 1)
+        known = gift_ids[pos] == row_gift
+        gift_index[known] = pos[known]
+
+    wishes = np.full((len(starts), int(rank.max()) + 1), NO_GIFT, dtype=np.int64)
+    wishes[child_index, rank] = gift_index
+
+    # 순위(rank)는 배열 위치, 응답에는 실제 Priority 값 (중간이 비거나 같은 값이 있어도 그대로)
+    priorities = np.zeros(wishes.shape, dtype=np.int64)
+    priorities[child_index, rank] = row_priority
+
+    return {
+        "child_ids": row_child[starts],
+        "region_ids": row_region[starts],
+        "wishes": wishes,
+        "priorities": priorities,
+        "gift_ids": gift_ids,
+        "stock": stock,
+    }
+
+
+def fair_order(region_ids: np.ndarray) -> np.ndarray:
+    '''
+    지역별 비례 처리 순서 (아이 인덱스 배열)
+
+    - 지역 안에서는 입력 순서(ChildID 순) 유지
+    - 지역 간에는 (지역 내 순위 + 0.5) / 지역 아이 수 가 작은 아이 먼저
+    '''
+    n = len(region_ids)
+    if n == 0:
+        return np.array([], dtype=np.int64)
+
+    by_region = np.argsort(region_ids, kind="stable")
+    sorted_regions = region_ids[by_region]
+    boundaries = np.r_[True, sorted_regions[1:] != sorted_regions[:-1]]
+    group_start = np.maximum.accumulate(np.where(boundaries, np.arange(n), 0))
+    group_id = np.cumsum(boundaries) - 1
+    group_size = np.bincount(group_id)
+
+    rank_in_region = np.empty(n, dtype=np.float64)
+    rank_in_region[by_region] = (np.arange(n) - group_start + 0.5) / group_size[group_id]
+
+    # 같은 비율이면 지역 ID, 그다음 입력 순서
+    return np.lexsort((np.arange(n), region_ids, rank_in_region))
+
+
+def solve_allocation(wishes: np.ndarray, stock: np.ndarray, order: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    '''
+    재고를 소모하면서 priority 라운드별로 배정
+
+    - wishes (N, P): 선물 인덱스 / NO_GIFT
+    - stock (G,): 재고 (변경하지 않음)
+    - order (N,): 경쟁 시 처리 순서
+    - 반환: (assigned (N,) 선물 인덱스 또는 NO_GIFT, assigned_rank (N,) 0부터, 미배정이면 P)
+    '''
+    n, p = wishes.shape
+    remaining = stock.astype(np.int64).copy()
+    assigned = np.full(n, NO_GIFT, dtype=np.int64)
+    assigned_rank = np.full(n, p, dtype=np.int64)
+
+    for rank in range(p):
+        # 아직 배정 안 된 아이 중 이번 순위 wish 가 있는 아이 (처리 순서대로)
+        candidates = order[(assigned[order] == NO_GIFT) & (wishes[order, rank] != NO_GIFT)]
+        if len(candidates) == 0:
+            continue
+
+        gifts = wishes[candidates, rank]
+
+        # 선물별로 묶되 처리 순서 유지 -> 선물마다 앞에서부터 남은 재고만큼 배정
+        by_gift = np.argsort(gifts, kind="stable")
+        sorted_gifts = gifts[by_gift]
+        first = np.r_[True, sorted_gifts[1:] != sorted_gifts[:-1]]
+        group_start = np.maximum.accumulate(np.where(first, np.arange(len(sorted_gifts)), 0))
+        position = np.arange(len(sorted_gifts)) - group_start
+
+        accepted = position < remaining[sorted_gifts]
+        winners = candidates[by_gift[accepted]]
+        won_gifts = sorted_gifts[accepted]
+
+        assigned[winners] = won_gifts
+        assigned_rank[winners] = rank
+        remaining -= np.bincount(won_gifts, minlength=len(remaining))
+
+    return assigned, assigned_rank
+
+
+def allocate_gifts(db: Session, region_id: int | None = None) -> dict:
+    '''
+    배송 대상 아이들에게 재고 안에서 선물 배정
+
+    반환:
+    - assignments: [{child_id, gift_id, priority}] (priority 는 배정된 wishlist 항목의 Priority 값)
+    - unassigned_child_ids: 어떤 선물도 배정받지 못한 아이
+    - gifts: 선물별 {gift_id, stock, assigned, remaining, unmet_demand}
+      (unmet_demand: 이 선물을 배정받은 선물보다 더 원했지만 받지 못한 아이 수)
+    '''
+    data = load_allocation_input(db, region_id)
+    wishes, stock = data["wishes"], data["stock"]
+
+    order = fair_order(data["region_ids"])
+    assigned, assigned_rank = solve_allocation(wishes, stock, order)
+
+    n_gifts = len(stock)
+    assigned_counts = np.bincount(assigned[assigned != NO_GIFT], minlength=n_gifts)
+
+    # 배정된 순위보다 앞선 wish 는 모두 충족되지 못한 수요
+    if wishes.size:
+        unmet_mask = (np.arange(wishes.shape[1])[None, :] < assigned_rank[:, None]) & (wishes != NO_GIFT)
+        unmet = np.bincount(wishes[unmet_mask], minlength=n_gifts)
+    else:
+        unmet = np.zeros(n_gifts, dtype=np.int64)
+
+    got = assigned != NO_GIFT
+    child_ids = data["child_ids"]
+    gift_ids = data["gift_ids"]
+    priorities = data["priorities"][np.flatnonzero(got), assigned_rank[got]]
+
+    return {
+        "assignments": [
+            {"child_id": int(c), "gift_id": int(g), "priority": int(p)}
+            for c, g, p in zip(child_ids[got], gift_ids[assigned[got]], priorities)
+        ],
+        "unassigned_child_ids": child_ids[~got].tolist(),
+        "gifts": [
+            {
+                "gift_id": int(gift_ids[i]),
+                "stock": int(stock[i]),
+                "assigned": int(assigned_counts[i]),
+                "remaining": int(stock[i] - assigned_counts[i]),
+                "unmet_demand": int(unmet[i]),
+            }
+            for i in range(n_gifts)
+        ],
+    }
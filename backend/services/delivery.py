@@ -0,0 +1,292 @@
+'''
+배송 그룹 실행 (집합 단위 SQL)
+
+- 그룹 아이템 수와 관계없이 문장 수가 일정 (행 단위 조회/수정 없음)
+- 잠금 순서: delivery_group -> child(ChildID 순)
+  (동시에 여러 그룹을 배송해도 같은 순서로 잠가서 교착 방지)
+- reindeer / Finished_Goods 는 잠그지 않고 version_id 로 충돌 검사 (낙관적 동시성 제어)
+  -> 다른 트랜잭션이 먼저 바꿨으면 StaleDataError, deliver_group 에서 자동 재시도
+'''
+from typing import Callable
+
+from fastapi import HTTPException, status
+from sqlalchemy import Integer, column, func, insert, literal, select, update, values
+from sqlalchemy.orm import Session
+from sqlalchemy.orm.exc import StaleDataError
+
+from backend.models.child import Child
+from backend.models.delivery_group import DeliveryGroup, DeliveryGroupItem
+from backend.models.delivery_log import DeliveryLog
+from backend.models.gift import FinishedGoods
+from backend.models.reindeer import Reindeer
+from backend.services.jobs import JobContext, register_job
+from backend.utils.transactions import run_optimistic
+
+# execute_group_delivery 진행 단계 수 (progress 콜백의 total)
+DELIVERY_STEPS = 5
+
+
+def execute_group_delivery(
+    tx: Session,
+    group_id: int,
+    staff_id: int | None,
+    progress: Callable[[int, int], None] | None = None,
+) -> int:
+    '''
+    그룹 안 모든 (child, gift) 배송 처리 후 배송 건수 반환
+
+    - 호출한 쪽 트랜잭션 안에서 실행 (commit/rollback 은 호출한 쪽에서)
+    - 읽은 뒤 루돌프/선물 재고가 바뀌었으면 StaleDataError (루돌프는 commit 시점에 감지)
+    - 조건을 만족하지 않으면 HTTPException (기존 deliver_group 과 같은 메시지)
+    - progress(완료 단계, DELIVERY_STEPS): 단계가 끝날 때마다 호출 (백그라운드 작업 진행률)
+    '''
+    def step(done: int) -> None:
+        if progress is not None:
+            progress(done, DELIVERY_STEPS)
+
+    # populate_existing: deliver_group 에서 이미 읽어 둔 그룹 객체(identity map)를
+    # 잠금 후 DB 값으로 다시 채움 (없으면 잠금 전 상태를 그대로 검사하게 됨)
+    group = (
+        tx.query(DeliveryGroup)
+        .filter(DeliveryGroup.group_id == group_id)
+        .with_for_update()
+        .populate_existing()
+        .one()
+    )
+
+    # 잠금을 기다리는 동안 다른 요청이 먼저 배송했을 수 있음
+    if group.status != "PENDING":
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Only PENDING groups can be delivered",
+        )
+
+    group_items = select(DeliveryGroupItem.child_id, DeliveryGroupItem.gift_id).where(
+        DeliveryGroupItem.group_id == group_id
+    )
+    group_child_ids = select(DeliveryGroupItem.child_id).where(
+        DeliveryGroupItem.group_id == group_id
+    )
+
+    # 선물별 필요 수량 (그룹당 1번)
+    needed = (
+        select(
+            DeliveryGroupItem.gift_id.label("gift_id"),
+            func.count().label("needed"),
+        )
+        .where(DeliveryGroupItem.group_id == group_id)
+        .group_by(DeliveryGroupItem.gift_id)
+        .subquery("needed")
+    )
+    needed_counts = dict(tx.execute(select(needed.c.gift_id, needed.c.needed)).all())
+    if not needed_counts:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Delivery group has no items",
+        )
+    step(1)
+
+    # 루돌프 조회 (잠금 없음, 변경 시 version_id 검사)
+    reindeer = (
+        tx.query(Reindeer)
+        .filter(Reindeer.reindeer_id == group.reindeer_id)
+        .populate_existing()
+        .first()
+    )
+    if not reindeer:
+        raise HTTPException(
+            status_code=404,
+            detail="Reindeer not found for this group",
+        )
+
+    # READY + stamina / magic 조건 확인
+    if reindeer.status != "READY":
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Reindeer is not READY",
+        )
+
+    if reindeer.current_stamina < 30 or reindeer.current_magic < 10:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Reindeer stamina/magic is not enough for delivery",
+        )
+    step(2)
+
+    # 선물 재고 + 버전 조회 (잠금 없음) + 부족 확인
+    gifts = {
+        row.gift_id: row
+        for row in tx.execute(
+            select(
+                FinishedGoods.gift_id,
+                FinishedGoods.gift_name,
+                FinishedGoods.stock_quantity,
+                FinishedGoods.version_id,
+            )
+            .where(FinishedGoods.gift_id.in_(needed_counts))
+            .order_by(FinishedGoods.gift_id)
+        )
+    }
+
+    shortages = []
+    for gift_id, count_needed in sorted(needed_counts.items()):
+        gift = gifts.get(gift_id)
+        if not gift:
+            shortages.append(f"상품#{gift_id}(존재하지 않음)")
+        elif (gift.stock_quantity or 0) < count_needed:
+            shortages.append(f"{gift.gift_name} (부족: {count_needed - (gift.stock_quantity or 0)}개)")
+
+    if shortages:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"재고 부족 품목이 있습니다: {', '.join(shortages)}"
+        )
+    step(3)
+
+    # 아이 잠금 (ChildID 순) + 이미 배송된 아이 확인
+    delivered_already = [
+        child_id
+        for child_id, delivery_status in tx.execute(
+            select(Child.ChildID, Child.DeliveryStatusCode)
+            .where(Child.ChildID.in_(group_child_ids))
+            .order_by(Child.ChildID)
+            .with_for_update()
+        )
+        if delivery_status == "DELIVERED"
+    ]
+    if delivered_already:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Child {delivered_already[0]} already delivered",
+        )
+    step(4)
+
+    # 재고 차감 (선물별 필요 수량만큼 UPDATE 1번)
+    # - 읽었을 때의 version_id 인 행만 수정, 하나라도 빠지면 다른 트랜잭션이 먼저 바꾼 것
+    expected = values(
+        column("gift_id", Integer),
+        column("needed", Integer),
+        column("version_id", Integer),
+        name="expected",
+    ).data([
+        (gift_id, count_needed, gifts[gift_id].version_id)
+        for gift_id, count_needed in sorted(needed_counts.items())
+    ])
+    updated = tx.execute(
+        update(FinishedGoods)
+        .where(FinishedGoods.gift_id == expected.c.gift_id)
+        .where(FinishedGoods.version_id == expected.c.version_id)
+        .values(
+            stock_quantity=FinishedGoods.stock_quantity - expected.c.needed,
+            version_id=FinishedGoods.version_id + 1,
+        ),
+        execution_options={"synchronize_session": False},
+    ).rowcount
+    if updated != len(needed_counts):
+        raise StaleDataError(
+            f"Finished_Goods 재고가 동시에 변경됨 (예상 {len(needed_counts)}행, 실제 {updated}행)"
+        )
+
+    # 아이 배송 상태 변경 (UPDATE 1번)
+    tx.execute(
+        update(Child)
+        .where(Child.ChildID.in_(group_child_ids))
+        .values(DeliveryStatusCode="DELIVERED"),
+        execution_options={"synchronize_session": False},
+    )
+
+    # 배송 로그 (INSERT ... SELECT 1번)
+    delivered_count = tx.execute(
+        insert(DeliveryLog).from_select(
+            ["child_id", "gift_id", "delivered_by_staff_id"],
+            group_items.add_columns(literal(staff_id, DeliveryLog.delivered_by_staff_id.type)),
+        )
+    ).rowcount
+
+    # 루돌프 상태/스탯 변경
+    reindeer.current_stamina -= 10
+    reindeer.current_magic -= 10
+    reindeer.status = "ONDELIVERY"
+
+    # 그룹 상태 DONE 으로
+    group.status = "DONE"
+    step(5)
+
+    return delivered_count
+
+
+def deliver_group(
+    db: Session,
+    group_id: int,
+    staff_id: int | None,
+    progress: Callable[[int, int], None] | None = None,
+    before_commit: Callable[[dict], None] | None = None,
+) -> dict:
+    '''
+    배송 그룹 실행 (POST /santa/groups/{id}/deliver 와 백그라운드 작업 공용)
+
+    - PENDING 그룹만 실행, 성공 시 COMMIT
+    - before_commit(응답): 있으면 배송과 같은 트랜잭션에서 COMMIT 직전에 호출 (Idempotency-Key 결과 저장)
+    - 루돌프/재고 버전 충돌은 run_optimistic 으로 자동 재시도 (다 실패하면 409, 그룹은 PENDING 유지)
+    - 실패하면 ROLLBACK 후 그룹을 FAILED 로 표시하고 HTTPException
+      (잠금 대기 중 다른 요청이 먼저 배송을 끝냈으면 DONE 그대로 둠)
+    '''
+    # 그룹 기본 체크 (존재 여부 + 상태)
+    group = (
+        db.query(DeliveryGroup)
+        .filter(DeliveryGroup.group_id == group_id)
+        .first()
+    )
+    if not group:
+        raise HTTPException(status_code=404, detail="Delivery group not found")
+
+    if group.status != "PENDING":
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Only PENDING groups can be delivered",
+        )
+
+    try:
+        def attempt() -> dict:
+            delivered_count = execute_group_delivery(db, group_id, staff_id, progress)
+            return {
+                "message": "Delivery completed",
+                "group_id": group_id,
+                "delivered_count": delivered_count,
+                "reindeer_id": group.reindeer_id,
+            }
+
+        # 예외 없이 반환되면 COMMIT 완료
+        return run_optimistic(db, "deliver_group", attempt, before_commit=before_commit)
+
+    except HTTPException as e:
+        # 비즈니스 에러 -> 그룹을 FAILED 로 표시
+        # (동시 수정 충돌로 재시도를 다 쓴 409 는 다시 시도할 수 있도록 그대로 둠)
+        if e.status_code != 409 and group.status == "PENDING":
+            group.status = "FAILED"
+            db.commit()
+        raise e
+
+    except Exception as e:
+        # 예기치 못한 에러 -> 그룹 FAILED 처리 후 500
+        print("ERROR:", e)
+        if group.status == "PENDING":
+            group.status = "FAILED"
+            db.commit()
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Delivery failed due to unexpected error",
+        )
+
+
+@register_job("deliver_group")
+def deliver_group_job(ctx: JobContext, db: Session, group_id: int) -> dict:
+    '''
+    백그라운드 배송 작업 (POST /santa/groups/{id}/deliver-async)
+    '''
+    return deliver_group(
+        db,
+        group_id,
+        ctx.staff_id,
+        progress=lambda done, total: ctx.progress(done, total, force=True),
+    )
@@ -0,0 +1,243 @@
+'''
+배송 그룹 자동 편성
+
+- 대상: NICE + PENDING 이고 아직 PENDING 그룹에 들어 있지 않은 아이
+- 선물: allocation 솔버로 재고 안에서 배정 (PENDING 그룹이 이미 잡아둔 수량은 재고에서 제외)
+- 루돌프: ready_reindeer_view 후보 중 magic >= 10 이고 PENDING 그룹이 없는 루돌프
+  (배송 1회에 stamina/magic 10 씩 소모 -> 루돌프 1마리당 그룹 1개)
+- 용량: min(stamina, magic) * items_per_point (max_group_size 로 상한)
+- 편성:
+    1) 남은 수요가 가장 많은 지역에 용량이 큰 루돌프부터 배치 (힙, 지역 단위로만 묶음)
+    2) 한 지역에 루돌프가 여러 마리면 용량 비율대로 아이를 나눠서 그룹 크기 균형
+- 아이 정렬/분할은 NumPy 로 처리 -> 수십만 명도 수 초 안에 편성
+'''
+import heapq
+
+import numpy as np
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+from backend.models.delivery_group import DeliveryGroup, DeliveryGroupItem
+from backend.models.region import Region
+from backend.services.allocation import NO_GIFT, fair_order, load_allocation_input, solve_allocation
+from backend.utils.bulk import bulk_insert, bulk_insert_returning
+
+# 동시에 두 번 편성해서 같은 아이가 두 그룹에 들어가지 않도록 하는 advisory lock 키
+PLANNER_LOCK_KEY = 72_012_253
+
+# 배송 실행 조건 (services/delivery.py 와 동일)
+MIN_STAMINA = 30
+MIN_MAGIC = 10
+
+
+def _load_reindeer(db: Session) -> list[tuple[int, int, int]]:
+    '''
+    편성 가능한 루돌프 (reindeer_id, stamina, magic)
+    '''
+    return [
+        tuple(row)
+        for row in db.execute(text('''
+            SELECT v.reindeer_id, v.current_stamina, v.current_magic
+            FROM ready_reindeer_view v
+            WHERE v.current_stamina >= :min_stamina
+              AND v.current_magic >= :min_magic
+              AND NOT EXISTS (
+                  SELECT 1 FROM delivery_group g
+                  WHERE g.reindeer_id = v.reindeer_id AND g.status = 'PENDING'
+              )
+            ORDER BY v.reindeer_id
+        '''), {"min_stamina": MIN_STAMINA, "min_magic": MIN_MAGIC})
+    ]
+
+
+def _pending_group_usage(db: Session) -> tuple[np.ndarray, dict[int, int]]:
+    '''
+    PENDING 그룹에 이미 들어 있는 아이 ID 배열 + 선물별 예약 수량
+    '''
+    pending = (
+        db.query(DeliveryGroupItem.child_id, DeliveryGroupItem.gift_id)
+        .join(DeliveryGroup, DeliveryGroupItem.group_id == DeliveryGroup.group_id)
+        .filter(DeliveryGroup.status == "PENDING")
+        .all()
+    )
+    child_ids = np.array([c for c, _ in pending], dtype=np.int64)
+
+    reserved: dict[int, int] = {}
+    for _, gift_id in pending:
+        reserved[gift_id] = reserved.get(gift_id, 0) + 1
+    return child_ids, reserved
+
+
+def split_by_capacity(count: int, capacities: list[int]) -> list[int]:
+    '''
+    count 명을 용량 비율대로 나눔 (각 몫은 용량 이하, 합계 = min(count, 용량 합))
+    '''
+    total_capacity = sum(capacities)
+    count = min(count, total_capacity)
+    if count == 0:
+        return [0] * len(capacities)
+
+    shares = [count * c // total_capacity for c in capacities]
+
+    # 내림으로 남은 인원은 여유 용량이 큰 순서로 1명씩
+    left = count - sum(shares)
+    order = sorted(range(len(capacities)), key=lambda i: capacities[i] - shares[i], reverse=True)
+    for i in order:
+        if left == 0:
+            break
+        if shares[i] < capacities[i]:
+            shares[i] += 1
+            left -= 1
+
+    return shares
+
+
+def plan_groups(
+    db: Session,
+    region_id: int | None = None,
+    items_per_point: int = 10,
+    max_group_size: int | None = None,
+    staff_id: int | None = None,
+    dry_run: bool = False,
+) -> dict:
+    '''
+    배송 그룹 편성 후 (dry_run 이 아니면) 그룹/아이템을 일괄 INSERT
+
+    - commit 은 호출한 쪽에서
+    - 반환: groups [{group_id, group_name, region_id, reindeer_id, capacity, item_count}],
+            planned / unplanned_no_capacity / unassigned_no_stock 아이 수
+    '''
+    # 편성 중에는 다른 편성 요청 대기 (트랜잭션 끝나면 자동 해제)
+    db.execute(text("SELECT pg_advisory_xact_lock(:key)"), {"key": PLANNER_LOCK_KEY})
+
+    # 1) 대상 아이 + 재고 안에서 선물 배정
+    data = load_allocation_input(db, region_id)
+    pending_child_ids, reserved = _pending_group_usage(db)
+
+    keep = ~np.isin(data["child_ids"], pending_child_ids)
+    child_ids = data["child_ids"][keep]
+    region_ids = data["region_ids"][keep]
+    wishes = data["wishes"][keep]
+
+    stock = data["stock"].copy()
+    for i, gift_id in enumerate(data["gift_ids"]):
+        stock[i] = max(stock[i] - reserved.get(int(gift_id), 0), 0)
+
+    assigned, _ = solve_allocation(wishes, stock, fair_order(region_ids))
+    got = assigned != NO_GIFT
+
+    child_ids = child_ids[got]
+    region_ids = region_ids[got]
+    gift_ids = data["gift_ids"][assigned[got]]
+    unassigned_no_stock = int((~got).sum())
+
+    # 지역 -> ChildID 순 정렬 후 지역별 구간
+    order = np.lexsort((child_ids, region_ids))
+    child_ids, region_ids, gift_ids = child_ids[order], region_ids[order], gift_ids[order]
+    regions, region_start, region_count = np.unique(region_ids, return_index=True, return_counts=True)
+
+    # 2) 루돌프 용량 -> 지역 배치 (남은 수요가 큰 지역에 큰 루돌프부터)
+    reindeer = [
+        (reindeer_id, min(stamina, magic) * items_per_point)
+        for reindeer_id, stamina, magic in _load_reindeer(db)
+    ]
+    if max_group_size is not None:
+        reindeer = [(rid, min(cap, max_group_size)) for rid, cap in reindeer]
+    reindeer = sorted((r for r in reindeer if r[1] > 0), key=lambda r: (-r[1], r[0]))
+
+    heap = [(-int(n), int(r)) for r, n in zip(regions, region_count)]
+    heapq.heapify(heap)
+    region_reindeer: dict[int, list[tuple[int, int]]] = {}
+
+    for reindeer_id, capacity in reindeer:
+        if not heap:
+            break
+        remaining, rid = heapq.heappop(heap)
+        region_reindeer.setdefault(rid, []).append((reindeer_id, capacity))
+        remaining += capacity
+        if remaining < 0:
+            heapq.heappush(heap, (remaining, rid))
+
+    # 3) 지역 안에서 용량 비율대로 분할
+    region_names = dict(
+        db.query(Region.RegionID, Region.RegionName)
+        .filter(Region.RegionID.in_([int(r) for r in region_reindeer]))
+        .all()
+    ) if region_reindeer else {}
+
+    plans = []
+    planned = 0
+    for rid, start, count in zip(regions, region_start, region_count):
+        assigned_reindeer = region_reindeer.get(int(rid))
+        if not assigned_reindeer:
+            continue
+
+        shares = split_by_capacity(int(count), [cap for _, cap in assigned_reindeer])
+        offset = int(start)
+        for n, ((reindeer_id, capacity), share) in enumerate(zip(assigned_reindeer, shares), start=1):
+            if share == 0:
+                continue
+            plans.append({
+                "group_name": f"{region_names.get(int(rid), f'Region {rid}')} #{n}",
+                "region_id": int(rid),
+                "reindeer_id": reindeer_id,
+                "capacity": capacity,
+                "slice": (offset, offset + share),
+            })
+            offset += share
+            planned += share
+
+    result = {
+        "groups": [],
+        "planned": planned,
+        "unplanned_no_capacity": int(len(child_ids) - planned),
+        "unassigned_no_stock": unassigned_no_stock,
+        "dry_run": dry_run,
+    }
+
+    # 4) 그룹 INSERT ... RETURNING -> 아이템 multi-row INSERT
+    group_ids = [None] * len(plans)
+    if not dry_run and plans:
+        group_ids = [
+            row.group_id
+            for row in bulk_insert_returning(
+                db,
+                DeliveryGroup,
+                (
+                    {
+                        "group_name": p["group_name"],
+                        "reindeer_id": p["reindeer_id"],
+                        "created_by_staff_id": staff_id,
+                        "status": "PENDING",
+                    }
+                    for p in plans
+                ),
+                returning=[DeliveryGroup.__table__.c.group_id],
+            )
+        ]
+
+        bulk_insert(
+            db,
+            DeliveryGroupItem,
+            (
+                {"group_id": group_id, "child_id": c, "gift_id": g}
+                for group_id, p in zip(group_ids, plans)
+                for c, g in zip(
+                    child_ids[slice(*p["slice"])].tolist(),
+                    gift_ids[slice(*p["slice"])].tolist(),
+                )
+            ),
+        )
+
+    for group_id, p in zip(group_ids, plans):
+        begin, end = p["slice"]
+        result["groups"].append({
+            "group_id": group_id,
+            "group_name": p["group_name"],
+            "region_id": p["region_id"],
+            "reindeer_id": p["reindeer_id"],
+            "capacity": p["capacity"],
+            "item_count": end - begin,
+        })
+
+    return result
@@ -0,0 +1,241 @@
+'''
+프로세스 내 백그라운드 작업 실행기
+
+- 작업은 background_job 테이블에 기록하고 ThreadPoolExecutor 워커가 실행
+- 작업 종류는 @register_job("이름") 으로 등록 (배송 실행, 대량 등록 등)
+    handler(ctx: JobContext, db: Session, **params) -> dict (결과, JSON 직렬화 가능)
+- 작업은 요청한 사람의 DB Role 세션(open_role_session)에서 실행
+- 여러 워커 프로세스가 떠 있어도 QUEUED -> RUNNING 전환을 조건부 UPDATE 로 해서 한 번만 실행
+- 실행 중에는 타이머 스레드가 JOB_HEARTBEAT_SECONDS 마다 heartbeat_at 갱신
+  (진행 보고가 없는 긴 단계 중에도 다른 프로세스의 recover_jobs 가 FAILED 로 바꾸지 않도록)
+- 진행률/heartbeat/종료 기록은 status = 'RUNNING' 인 경우에만 UPDATE
+  (이미 FAILED 처리된 작업을 SUCCEEDED 로 덮어쓰지 않음)
+'''
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable
+
+from fastapi import HTTPException
+from sqlalchemy import func, update
+
+from backend.database import SessionLocal, open_role_session
+from backend.models.background_job import BackgroundJob
+
+# 동시에 실행할 작업 수
+JOB_WORKERS = int(os.getenv("JOB_WORKERS", "2"))
+
+# 진행률 저장 최소 간격 (초) - 진행 보고마다 UPDATE 하지 않도록
+PROGRESS_INTERVAL = float(os.getenv("JOB_PROGRESS_INTERVAL", "0.5"))
+
+# 이 시간(초) 동안 heartbeat 가 없는 RUNNING 작업은 서버 재시작 시 FAILED 처리
+JOB_STALE_SECONDS = int(os.getenv("JOB_STALE_SECONDS", "600"))
+
+# 실행 중인 작업의 heartbeat 간격 (초, JOB_STALE_SECONDS 보다 충분히 짧게)
+JOB_HEARTBEAT_SECONDS = float(os.getenv("JOB_HEARTBEAT_SECONDS", "30"))
+
+_handlers: dict[str, Callable] = {}
+_executor: ThreadPoolExecutor | None = None
+
+
+def register_job(kind: str):
+    '''
+    작업 종류 등록 데코레이터
+    '''
+    def decorator(fn: Callable) -> Callable:
+        _handlers[kind] = fn
+        return fn
+    return decorator
+
+
+class JobContext:
+    '''
+    실행 중인 작업 정보 + 진행률 보고
+    '''
+
+    def __init__(self, job_id: int, staff_id: int | None, db_role: str):
+        self.job_id = job_id
+        self.staff_id = staff_id
+        self.db_role = db_role
+        self._last_saved = 0.0
+        self._stop = threading.Event()
+        self._heartbeat_thread: threading.Thread | None = None
+
+    def progress(self, done: int, total: int | None = None, force: bool = False) -> None:
+        '''
+        진행률 저장 (PROGRESS_INTERVAL 안에 여러 번 호출되면 마지막 것만 저장)
+        '''
+        now = time.monotonic()
+        if not force and now - self._last_saved < PROGRESS_INTERVAL:
+            return
+        self._last_saved = now
+
+        values = {"progress_done": done, "heartbeat_at": func.now()}
+        if total is not None:
+            values["progress_total"] = total
+        _update_job(self.job_id, **values)
+
+    def start_heartbeat(self) -> None:
+        '''
+        heartbeat 타이머 스레드 시작 (작업이 끝나면 stop_heartbeat)
+        '''
+        self._heartbeat_thread = threading.Thread(
+            target=self._heartbeat_loop,
+            name=f"job-{self.job_id}-heartbeat",
+            daemon=True,
+        )
+        self._heartbeat_thread.start()
+
+    def stop_heartbeat(self) -> None:
+        self._stop.set()
+        if self._heartbeat_thread is not None:
+            self._heartbeat_thread.join(timeout=5)
+            self._heartbeat_thread = None
+
+    def _heartbeat_loop(self) -> None:
+        while not self._stop.wait(JOB_HEARTBEAT_SECONDS):
+            try:
+                # RUNNING 이 아니면 (다른 프로세스가 FAILED 처리 등) 더 갱신하지 않음
+                if not _update_job(self.job_id, heartbeat_at=func.now()):
+                    return
+            except Exception as e:
+                # 일시적인 DB 오류는 다음 주기에 다시 시도
+                print(f"job {self.job_id} heartbeat 실패:", e)
+
+
+def _update_job(job_id: int, **values) -> int:
+    # 작업 기록은 작업 본문 트랜잭션과 별개로 바로 commit
+    # RUNNING 인 작업만 갱신 -> 이미 끝났거나 FAILED 처리된 작업이면 0 반환
+    with SessionLocal() as db:
+        updated = db.execute(
+            update(BackgroundJob)
+            .where(BackgroundJob.job_id == job_id, BackgroundJob.status == "RUNNING")
+            .values(**values)
+        ).rowcount
+        db.commit()
+    return updated
+
+
+def _finish_job(job_id: int, kind: str, **values) -> None:
+    if not _update_job(job_id, finished_at=func.now(), **values):
+        print(f"job {job_id} ({kind}): 이미 RUNNING 상태가 아니어서 {values['status']} 기록 안 함")
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    global _executor
+    if _executor is None:
+        _executor = ThreadPoolExecutor(max_workers=JOB_WORKERS, thread_name_prefix="job")
+    return _executor
+
+
+def submit_job(kind: str, params: dict, db_role: str, staff_id: int | None = None) -> int:
+    '''
+    작업 등록 후 job_id 반환 (실행은 워커 풀에서)
+    '''
+    if kind not in _handlers:
+        raise ValueError(f"등록되지 않은 작업 종류: {kind}")
+
+    with SessionLocal() as db:
+        job = BackgroundJob(
+            kind=kind,
+            status="QUEUED",
+            params=params,
+            db_role=db_role,
+            created_by_staff_id=staff_id,
+        )
+        db.add(job)
+        db.commit()
+        job_id = job.job_id
+
+    _get_executor().submit(_run_job, job_id)
+    return job_id
+
+
+def _run_job(job_id: int) -> None:
+    # QUEUED 인 경우에만 RUNNING 으로 전환 (다른 프로세스가 이미 가져갔으면 종료)
+    with SessionLocal() as db:
+        job = db.execute(
+            update(BackgroundJob)
+            .where(BackgroundJob.job_id == job_id, BackgroundJob.status == "QUEUED")
+            .values(status="RUNNING", started_at=func.now(), heartbeat_at=func.now())
+            .returning(
+                BackgroundJob.kind,
+                BackgroundJob.params,
+                BackgroundJob.db_role,
+                BackgroundJob.created_by_staff_id,
+            )
+        ).first()
+        db.commit()
+
+    if job is None:
+        return
+
+    ctx = JobContext(job_id, job.created_by_staff_id, job.db_role)
+    handler = _handlers.get(job.kind)
+
+    ctx.start_heartbeat()
+    try:
+        if handler is None:
+            raise ValueError(f"등록되지 않은 작업 종류: {job.kind}")
+
+        with open_role_session(job.db_role) as db:
+            db.info["staff_id"] = job.created_by_staff_id
+            result = handler(ctx, db, **job.params)
+
+        _finish_job(job_id, job.kind, status="SUCCEEDED", result=result, heartbeat_at=func.now())
+
+    except HTTPException as e:
+        # 업무 규칙 위반 (재고 부족 등) -> 메시지 그대로 기록
+        _finish_job(job_id, job.kind, status="FAILED", error=str(e.detail))
+
+    except Exception as e:
+        print(f"job {job_id} ({job.kind}) 실패:", e)
+        _finish_job(job_id, job.kind, status="FAILED", error=str(e))
+
+    finally:
+        ctx.stop_heartbeat()
+
+
+def recover_jobs() -> None:
+    '''
+    서버 시작 시 호출
+
+    - JOB_STALE_SECONDS 동안 heartbeat 가 없는 RUNNING 작업 -> FAILED (이전 프로세스 종료로 중단)
+      (살아 있는 프로세스의 작업은 heartbeat 타이머가 계속 갱신하므로 해당 없음)
+    - QUEUED 작업 -> 다시 워커 풀에 등록
+    '''
+    with SessionLocal() as db:
+        stale = db.execute(
+            update(BackgroundJob)
+            .where(
+                BackgroundJob.status == "RUNNING",
+                BackgroundJob.heartbeat_at
+                < func.now() - func.make_interval(0, 0, 0, 0, 0, 0, JOB_STALE_SECONDS),
+            )
+            .values(status="FAILED", error="interrupted (server restarted)", finished_at=func.now())
+        ).rowcount
+
+        queued = [
+            job_id
+            for (job_id,) in db.query(BackgroundJob.job_id)
+            .filter(BackgroundJob.status == "QUEUED")
+            .order_by(BackgroundJob.job_id)
+        ]
+        db.commit()
+
+    if stale:
+        print(f"중단된 작업 {stale}건 FAILED 처리")
+
+    for job_id in queued:
+        _get_executor().submit(_run_job, job_id)
+
+
+def shutdown_jobs() -> None:
+    '''
+    서버 종료 시 호출 (대기 중인 작업은 QUEUED 로 남아서 다음 시작 때 다시 실행)
+    '''
+    global _executor
+    if _executor is not None:
+        _executor.shutdown(wait=False, cancel_futures=True)
+        _executor = None
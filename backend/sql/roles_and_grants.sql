@@ -230,6 +230,37 @@ GRANT INSERT, SELECT ON TABLE delivery_log
 GRANT SELECT ON TABLE delivery_log
   TO role_listelf, role_giftelf, role_keeper;
 
+-- ------------------------
+-- 4-6. 읽기 모델 (santa_target_summary)
+--      child 트리거가 갱신 (SECURITY DEFINER) -> 역할에는 SELECT 만 부여
+-- ------------------------
+
+-- santa_target_summary
+-- Santa, ListElf : R
+GRANT SELECT ON TABLE santa_target_summary
+  TO role_santa, role_listelf;
+
+-- ------------------------
+-- 4-7. 백그라운드 작업 (background_job)
+--      작업 등록/진행 갱신은 서버(소유자 계정)가 하고, 역할에는 조회만 부여
+-- ------------------------
+
+-- background_job
+-- 4개 역할 : R
+GRANT SELECT ON TABLE background_job
+  TO role_santa, role_listelf, role_giftelf, role_keeper;
+
+-- ------------------------
+-- 4-8. Idempotency-Key 결과 (idempotency_key)
+--      결과는 변경과 같은 트랜잭션(요청 Role 세션)에서 저장
+--      만료 행 삭제는 서버(소유자 계정)가 하므로 DELETE 는 부여하지 않음
+-- ------------------------
+
+-- idempotency_key
+-- Santa (배송 실행), GiftElf (생산) : C, R, U
+GRANT SELECT, INSERT, UPDATE ON TABLE idempotency_key
+  TO role_santa, role_giftelf;
+
 GRANT role_giftelf TO postgres;
 GRANT role_listelf TO postgres;
 GRANT role_santa TO postgres;
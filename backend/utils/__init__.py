@@ -1 +1 @@
-from backend.utils.transactions import transactional_session
\ No newline at end of file
+from backend.utils.transactions import run_optimistic, transactional_session
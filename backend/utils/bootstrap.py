@@ -0,0 +1,142 @@
+import hashlib
+import inspect
+import os
+
+from sqlalchemy import text
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.schema import CreateIndex, CreateTable
+
+from backend.database import Base, engine
+from backend.models import (gift, child, reindeer, staff, rules, region,
+                            delivery_log, delivery_group,
+                            child_status_code, delivery_status_code,
+                            santa_target, background_job, idempotency)
+from backend.migrations import discover_migrations, run_migrations
+from backend.utils import seed
+from backend.utils.permissions import apply_permissions, get_permissions_sql_path
+
+# 빠른 시작 모드 (기본 ON): 스키마/시드/권한 SQL 이 바뀌지 않았으면 bootstrap 생략
+FAST_START_ENABLED = os.getenv("FAST_START", "1") == "1"
+
+# 여러 워커가 동시에 뜰 때 bootstrap 을 한 번에 하나만 실행하기 위한 advisory lock 키
+BOOTSTRAP_LOCK_KEY = 72_012_251
+
+
+def compute_fingerprint() -> str:
+    '''
+    스키마/시드/권한 SQL 전체에 대한 해시
+
+    - 모델: 모든 테이블/인덱스의 CREATE DDL (PostgreSQL 기준)
+    - 시드: backend/utils/seed.py 소스
+    - 권한: sql/roles_and_grants.sql 내용
+    - 마이그레이션: backend/migrations/versions 의 각 모듈 소스
+    '''
+    h = hashlib.sha256()
+    dialect = postgresql.dialect()
+
+    for table in Base.metadata.sorted_tables:
+        h.update(str(CreateTable(table).compile(dialect=dialect)).encode("utf-8"))
+        for index in sorted(table.indexes, key=lambda i: i.name or ""):
+            h.update(str(CreateIndex(index).compile(dialect=dialect)).encode("utf-8"))
+
+    h.update(inspect.getsource(seed).encode("utf-8"))
+
+    for migration in discover_migrations():
+        h.update(inspect.getsource(migration).encode("utf-8"))
+
+    sql_file_path = get_permissions_sql_path()
+    if os.path.exists(sql_file_path):
+        with open(sql_file_path, "rb") as f:
+            h.update(f.read())
+
+    return h.hexdigest()
+
+
+def _ensure_fingerprint_table(conn) -> None:
+    conn.execute(text('''
+        CREATE TABLE IF NOT EXISTS bootstrap_fingerprint (
+            id          INTEGER PRIMARY KEY,
+            fingerprint VARCHAR(64) NOT NULL,
+            applied_at  TIMESTAMPTZ NOT NULL DEFAULT now()
+        )
+    '''))
+
+
+def _stored_fingerprint(conn) -> str | None:
+    return conn.execute(
+        text("SELECT fingerprint FROM bootstrap_fingerprint WHERE id = 1")
+    ).scalar()
+
+
+def _store_fingerprint(conn, fingerprint: str) -> None:
+    conn.execute(
+        text('''
+            INSERT INTO bootstrap_fingerprint (id, fingerprint)
+            VALUES (1, :fingerprint)
+            ON CONFLICT (id) DO UPDATE
+               SET fingerprint = EXCLUDED.fingerprint,
+                   applied_at  = now()
+        '''),
+        {"fingerprint": fingerprint},
+    )
+
+
+def _run_full_bootstrap() -> bool:
+    '''
+    테이블 생성 + 마이그레이션 + 시드 + VIEW + 권한 적용
+    '''
+    Base.metadata.create_all(bind=engine)
+
+    # 기존 DB 에 인덱스 등 추가 (새 테이블 권한은 아래 apply_permissions 에서 부여)
+    run_migrations(engine)
+
+    seed.seed_regions()
+    seed.seed_finished_goods()
+    seed.seed_raw_materials()
+    seed.seed_gift_bom()
+    seed.seed_reindeer()
+    seed.create_ready_reindeer_view()
+    seed.seed_child_status_codes()
+    seed.seed_delivery_status_codes()
+    seed.seed_staff()
+    seed.seed_child()
+
+    return apply_permissions(engine)
+
+
+def run_bootstrap(force: bool = False) -> bool:
+    '''
+    서버 시작 시 DB 초기화
+
+    - 저장된 fingerprint 와 현재 fingerprint 가 같으면 아무것도 하지 않음
+    - force=True 또는 FAST_START=0 이면 항상 전체 bootstrap 실행
+    - 전체 bootstrap 을 실행했으면 True 반환
+    '''
+    fingerprint = compute_fingerprint()
+
+    with engine.connect() as lock_conn:
+        # 동시에 뜬 다른 워커가 bootstrap 중이면 끝날 때까지 대기
+        lock_conn.execute(text("SELECT pg_advisory_lock(:key)"), {"key": BOOTSTRAP_LOCK_KEY})
+        lock_conn.commit()
+
+        try:
+            with engine.begin() as conn:
+                _ensure_fingerprint_table(conn)
+                stored = _stored_fingerprint(conn)
+
+            if not force and FAST_START_ENABLED and stored == fingerprint:
+                print("스키마/시드 변경 없음 -> bootstrap 생략 (fast start)")
+                return False
+
+            ok = _run_full_bootstrap()
+
+            # 권한 적용까지 성공했을 때만 fingerprint 저장 (실패 시 다음 시작에 재시도)
+            if ok:
+                with engine.begin() as conn:
+                    _store_fingerprint(conn, fingerprint)
+
+            return True
+
+        finally:
+            lock_conn.execute(text("SELECT pg_advisory_unlock(:key)"), {"key": BOOTSTRAP_LOCK_KEY})
+            lock_conn.commit()
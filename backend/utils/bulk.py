@@ -0,0 +1,90 @@
+from typing import Iterable, Iterator, Sequence
+
+from sqlalchemy import insert
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.orm import Session
+
+# 한 번의 execute 로 보내는 최대 행 수
+# (SQLAlchemy insertmanyvalues 가 이 안에서 다시 multi-row VALUES 로 묶음)
+DEFAULT_CHUNK_SIZE = 5000
+
+
+def _table_of(model):
+    # ORM 모델 / Table 모두 허용
+    return getattr(model, "__table__", model)
+
+
+def chunked(rows: Iterable[dict], size: int = DEFAULT_CHUNK_SIZE) -> Iterator[list[dict]]:
+    '''
+    rows 를 size 개씩 나눠서 반환 (제너레이터도 가능 -> 전체를 메모리에 올리지 않음)
+    '''
+    chunk = []
+    for row in rows:
+        chunk.append(row)
+        if len(chunk) >= size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def bulk_insert(
+    db: Session,
+    model,
+    rows: Iterable[dict],
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> None:
+    '''
+    일반 multi-row INSERT 를 청크 단위로 실행 (반환값 불필요할 때)
+    '''
+    stmt = insert(_table_of(model))
+    for chunk in chunked(rows, chunk_size):
+        db.execute(stmt, chunk)
+
+
+def bulk_insert_ignore(
+    db: Session,
+    model,
+    rows: Iterable[dict],
+    index_elements: Sequence[str] | None = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> int:
+    '''
+    INSERT ... ON CONFLICT DO NOTHING 을 청크 단위로 실행
+
+    - rows: 컬럼명 -> 값 dict
+    - index_elements: 충돌 판단 컬럼 (None 이면 모든 unique/PK 충돌 무시)
+    - 실제로 INSERT 된 행 수 반환 (이미 있던 행은 제외)
+    '''
+    table = _table_of(model)
+    stmt = (
+        pg_insert(table)
+        .on_conflict_do_nothing(index_elements=index_elements)
+        .returning(*table.primary_key.columns)
+    )
+
+    inserted = 0
+    for chunk in chunked(rows, chunk_size):
+        inserted += len(db.execute(stmt, chunk).all())
+    return inserted
+
+
+def bulk_insert_returning(
+    db: Session,
+    model,
+    rows: Iterable[dict],
+    returning: Sequence,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> list:
+    '''
+    multi-row INSERT ... RETURNING 을 청크 단위로 실행
+
+    - 반환 행 순서는 입력 rows 순서와 같음 (자동 증가 PK 를 돌려받을 때 사용)
+    '''
+    table = _table_of(model)
+    stmt = insert(table).returning(*returning, sort_by_parameter_order=True)
+
+    results = []
+    for chunk in chunked(rows, chunk_size):
+        results.extend(db.execute(stmt, chunk).all())
+    return results
@@ -0,0 +1,45 @@
+import threading
+
+
+class ConflictMetrics:
+    '''
+    낙관적 동시성 제어(version_id) 충돌 통계 (작업 이름별)
+
+    - attempts: 트랜잭션 시도 횟수 (재시도 포함)
+    - committed: 성공한 작업 수
+    - conflicts: 버전 충돌(StaleDataError)로 롤백된 시도 수
+    - exhausted: 재시도 횟수를 다 써서 409 로 끝난 작업 수
+    - conflict_rate = conflicts / attempts
+    '''
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._counters: dict[str, dict[str, int]] = {}
+
+    def incr(self, operation: str, counter: str) -> None:
+        with self._lock:
+            counters = self._counters.setdefault(
+                operation,
+                {"attempts": 0, "committed": 0, "conflicts": 0, "exhausted": 0},
+            )
+            counters[counter] += 1
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                operation: {
+                    **counters,
+                    "conflict_rate": (
+                        counters["conflicts"] / counters["attempts"] if counters["attempts"] else 0.0
+                    ),
+                }
+                for operation, counters in sorted(self._counters.items())
+            }
+
+    def reset(self) -> None:
+        with self._lock:
+            self._counters.clear()
+
+
+# 앱 전체에서 공유하는 통계 인스턴스
+conflict_metrics = ConflictMetrics()
@@ -0,0 +1,225 @@
+'''
+Idempotency-Key 처리 (프록시/클라이언트 재전송으로 같은 변경이 두 번 실행되지 않도록)
+
+- 같은 직원이 같은 키로 다시 보내면 저장된 응답을 그대로 반환 (트랜잭션 재실행 없음)
+    응답 헤더 Idempotent-Replayed: true
+- 같은 키인데 요청 내용(fingerprint)이 다르면 422
+- 첫 요청이 아직 처리 중이면 409
+    (키별 advisory xact lock -> 처리 중 표시의 수명 = 변경 트랜잭션, 서버가 죽으면 바로 풀림)
+- 결과 행은 변경과 같은 트랜잭션에서 COMMIT 직전에 INSERT
+    -> 변경이 커밋되면 결과도 반드시 저장됨, 실패/롤백이면 둘 다 없음 (같은 키로 다시 시도 가능)
+- 결과는 IDEMPOTENCY_TTL_SECONDS 동안 보관, 만료된 행은 주기적으로 삭제
+'''
+import hashlib
+import json
+import os
+import threading
+import time
+from typing import Any, Callable
+
+from fastapi import HTTPException, Request
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+from sqlalchemy import delete, func, select, tuple_
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.orm import Session
+
+from backend.database import SessionLocal
+from backend.models.idempotency import IdempotencyKey
+
+# 응답 보관 기간 (초)
+IDEMPOTENCY_TTL_SECONDS = int(os.getenv("IDEMPOTENCY_TTL_SECONDS", "86400"))
+
+# 만료 행 삭제 주기 (초, 프로세스 단위) / 한 번에 삭제할 최대 행 수
+IDEMPOTENCY_PURGE_INTERVAL = float(os.getenv("IDEMPOTENCY_PURGE_INTERVAL", "300"))
+IDEMPOTENCY_PURGE_BATCH = 5000
+
+MAX_KEY_LENGTH = 255
+
+_purge_lock = threading.Lock()
+_last_purge = 0.0
+
+
+def _seconds(value: int):
+    return func.make_interval(0, 0, 0, 0, 0, 0, value)
+
+
+def request_fingerprint(request: Request, body: Any = None) -> str:
+    '''
+    메서드 + 경로 + 본문(JSON, 키 정렬) 의 sha256
+    '''
+    h = hashlib.sha256(f"{request.method} {request.url.path}\n".encode("utf-8"))
+    if body is not None:
+        h.update(
+            json.dumps(jsonable_encoder(body), sort_keys=True, separators=(",", ":")).encode("utf-8")
+        )
+    return h.hexdigest()
+
+
+def purge_expired_keys(limit: int = IDEMPOTENCY_PURGE_BATCH) -> int:
+    '''
+    만료된 행 삭제 (expires_at 인덱스 사용, 한 번에 limit 행까지)
+    '''
+    with SessionLocal() as idb:
+        expired = (
+            select(IdempotencyKey.staff_id, IdempotencyKey.idem_key)
+            .where(IdempotencyKey.expires_at <= func.now())
+            .limit(limit)
+        )
+        deleted = idb.execute(
+            delete(IdempotencyKey).where(
+                tuple_(IdempotencyKey.staff_id, IdempotencyKey.idem_key).in_(expired)
+            )
+        ).rowcount
+        idb.commit()
+    return deleted
+
+
+def _maybe_purge() -> None:
+    global _last_purge
+    now = time.monotonic()
+    with _purge_lock:
+        if now - _last_purge < IDEMPOTENCY_PURGE_INTERVAL:
+            return
+        _last_purge = now
+    try:
+        purge_expired_keys()
+    except Exception as e:
+        # 정리 실패는 요청 처리에 영향 주지 않음 (다음 주기에 재시도)
+        print("idempotency key 정리 실패:", e)
+
+
+class _AlreadyStored(Exception):
+    '''
+    COMMIT 직전에 보니 같은 키 결과가 이미 저장돼 있음 -> 이번 변경은 롤백하고 저장된 응답 반환
+    '''
+
+
+def _replay(row) -> JSONResponse:
+    return JSONResponse(
+        content=row.response,
+        status_code=row.status_code,
+        headers={"Idempotent-Replayed": "true"},
+    )
+
+
+def _check_existing(row, fingerprint: str) -> JSONResponse:
+    if row.request_hash != fingerprint:
+        raise HTTPException(
+            status_code=422,
+            detail="같은 Idempotency-Key 로 다른 요청을 보낼 수 없습니다.",
+        )
+    return _replay(row)
+
+
+def _lock(db: Session, staff_id: int, key: str, wait: bool) -> bool:
+    '''
+    (staff_id, key) advisory xact lock - 트랜잭션이 끝나면(COMMIT/ROLLBACK/연결 끊김) 자동 해제
+
+    - wait=False: 다른 트랜잭션이 잡고 있으면 False
+    - 같은 트랜잭션에서 다시 잡아도 됨 (중첩)
+    '''
+    if wait:
+        db.execute(select(func.pg_advisory_xact_lock(staff_id, func.hashtext(key))))
+        return True
+    return bool(
+        db.execute(select(func.pg_try_advisory_xact_lock(staff_id, func.hashtext(key)))).scalar()
+    )
+
+
+def _find(db: Session, pk: tuple):
+    return db.execute(
+        select(IdempotencyKey.request_hash, IdempotencyKey.status_code, IdempotencyKey.response)
+        .where(*pk, IdempotencyKey.expires_at > func.now())
+    ).first()
+
+
+def run_idempotent(
+    db: Session,
+    key: str | None,
+    fingerprint: str,
+    run: Callable[[Callable[[Any], None] | None], Any],
+    status_code: int = 200,
+) -> Any:
+    '''
+    Idempotency-Key 가 있으면 한 번만 실행하고 결과를 저장
+
+    - key 가 없으면 run(None) 결과를 그대로 반환 (기존 동작)
+    - run(before_commit): 변경 + COMMIT 까지 하는 함수 (반환값은 JSON 직렬화 가능해야 함)
+        COMMIT 직전에 같은 트랜잭션 안에서 before_commit(결과) 를 호출해야 함
+        (run_optimistic(..., before_commit=before_commit) 로 넘기면 됨)
+    - 조회/저장은 요청 세션(db)의 DB Role 로 실행 (idempotency_key 권한 필요, roles_and_grants.sql 4-8)
+    - 키 범위는 요청한 직원 (db.info["staff_id"])
+    '''
+    if key is None:
+        return run(None)
+
+    if not key or len(key) > MAX_KEY_LENGTH:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Idempotency-Key 는 1~{MAX_KEY_LENGTH}자여야 합니다.",
+        )
+
+    # (인증 없이 호출되는 경우는 없지만 PK 가 NULL 이 되지 않도록 0 으로)
+    staff_id = db.info.get("staff_id") or 0
+    pk = (IdempotencyKey.staff_id == staff_id, IdempotencyKey.idem_key == key)
+
+    _maybe_purge()
+
+    # 1) 재전송이면 PK 조회 1번으로 끝
+    existing = _find(db, pk)
+    if existing is not None:
+        return _check_existing(existing, fingerprint)
+
+    # 2) 같은 키 요청이 처리 중이면 409 (잠금은 변경 트랜잭션이 끝날 때 풀림)
+    if not _lock(db, staff_id, key, wait=False):
+        raise HTTPException(
+            status_code=409,
+            detail="같은 Idempotency-Key 요청이 아직 처리 중입니다.",
+        )
+
+    # 조회와 잠금 사이에 같은 키 요청이 끝났을 수 있음
+    existing = _find(db, pk)
+    if existing is not None:
+        return _check_existing(existing, fingerprint)
+
+    def before_commit(result: Any) -> None:
+        # 버전 충돌 재시도(ROLLBACK) 로 잠금이 풀렸을 수 있으므로 다시 잡고 확인
+        _lock(db, staff_id, key, wait=True)
+        if _find(db, pk) is not None:
+            raise _AlreadyStored(f"Idempotency-Key {key!r} 결과가 이미 저장됨")
+
+        # 3) 결과 저장 (만료된 같은 키가 남아 있으면 덮어씀)
+        stmt = pg_insert(IdempotencyKey).values(
+            staff_id=staff_id,
+            idem_key=key,
+            request_hash=fingerprint,
+            status_code=status_code,
+            response=jsonable_encoder(result),
+            expires_at=func.now() + _seconds(IDEMPOTENCY_TTL_SECONDS),
+        )
+        db.execute(
+            stmt.on_conflict_do_update(
+                index_elements=[IdempotencyKey.staff_id, IdempotencyKey.idem_key],
+                set_={
+                    "request_hash": stmt.excluded.request_hash,
+                    "status_code": stmt.excluded.status_code,
+                    "response": stmt.excluded.response,
+                    "created_at": func.now(),
+                    "expires_at": stmt.excluded.expires_at,
+                },
+                where=IdempotencyKey.expires_at <= func.now(),
+            )
+        )
+
+    # 4) 실제 처리 (변경 + 결과 저장이 한 번에 COMMIT)
+    try:
+        return run(before_commit)
+    except Exception:
+        # 실패한 변경은 롤백됨. 그 사이 같은 키 요청이 먼저 성공했다면 그 응답을 반환
+        # (예: 재시도 중 다른 요청이 같은 그룹을 먼저 배송 -> 이번 시도는 400 대신 첫 응답)
+        db.rollback()
+        existing = _find(db, pk)
+        if existing is not None and existing.request_hash == fingerprint:
+            return _replay(existing)
+        raise
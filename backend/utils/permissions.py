@@ -2,17 +2,25 @@ import os
 from sqlalchemy import text
 from sqlalchemy.engine import Engine
 
-def apply_permissions(engine: Engine):
+def get_permissions_sql_path() -> str:
+    '''
+    권한 SQL 파일 경로 (실행 위치 기준)
+    '''
+    base_dir = os.getcwd() 
+    return os.path.join(base_dir, "backend", "sql", "roles_and_grants.sql")
+
+
+def apply_permissions(engine: Engine) -> bool:
     '''
     sql/roles_and_grants.sql 파일을 읽어서 DB 권한을 적용
+    - 성공하면 True, 파일이 없거나 실행 중 오류가 나면 False
     '''
 
-    base_dir = os.getcwd() 
-    sql_file_path = os.path.join(base_dir, "backend", "sql", "roles_and_grants.sql")
+    sql_file_path = get_permissions_sql_path()
     
     if not os.path.exists(sql_file_path):
         print(f"파일을 찾을 수 없습니다: {sql_file_path}")
-        return
+        return False
 
     try:
         #  SQL 파일 읽기
@@ -25,4 +33,7 @@ def apply_permissions(engine: Engine):
                 conn.execute(text(sql_script))
 
     except Exception as e:
-        print(f"문제가 발tod: {e}")
\ No newline at end of file
+        print(f"문제가 발tod: {e}")
+        return False
+
+    return True
\ No newline at end of file
@@ -0,0 +1,149 @@
+import bisect
+import threading
+import time
+
+from sqlalchemy import event, exc
+from sqlalchemy.engine import Engine
+from sqlalchemy.pool import QueuePool
+
+# 커넥션 대기(checkout) 시간 히스토그램 버킷 (ms, 누적 아님)
+CHECKOUT_BUCKETS_MS = (1, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000)
+
+
+class PoolMetrics:
+    '''
+    엔진 1개(커넥션 풀 1개)에 대한 통계
+
+    - connects / checkouts / checkins / invalidations / timeouts: 풀 이벤트 카운터
+    - 대기 시간: 풀에서 커넥션을 얻기까지 걸린 시간 (합계/최대/히스토그램)
+    '''
+
+    def __init__(self, name: str):
+        self.name = name
+        self._lock = threading.Lock()
+
+        self.connects = 0
+        self.checkouts = 0
+        self.checkins = 0
+        self.invalidations = 0
+        self.timeouts = 0
+
+        self.wait_count = 0
+        self.wait_total_ms = 0.0
+        self.wait_max_ms = 0.0
+        self.wait_buckets = [0] * (len(CHECKOUT_BUCKETS_MS) + 1)
+
+    def incr(self, counter: str) -> None:
+        with self._lock:
+            setattr(self, counter, getattr(self, counter) + 1)
+
+    def observe_wait(self, seconds: float) -> None:
+        ms = seconds * 1000
+        with self._lock:
+            self.wait_count += 1
+            self.wait_total_ms += ms
+            self.wait_max_ms = max(self.wait_max_ms, ms)
+            self.wait_buckets[bisect.bisect_left(CHECKOUT_BUCKETS_MS, ms)] += 1
+
+    def snapshot(self, pool) -> dict:
+        with self._lock:
+            histogram = {
+                f"le_{bound}ms": count
+                for bound, count in zip(CHECKOUT_BUCKETS_MS, self.wait_buckets)
+            }
+            histogram["le_inf"] = self.wait_buckets[-1]
+
+            data = {
+                "connects": self.connects,
+                "checkouts": self.checkouts,
+                "checkins": self.checkins,
+                "invalidations": self.invalidations,
+                "timeouts": self.timeouts,
+                "checkout_wait": {
+                    "count": self.wait_count,
+                    "avg_ms": (self.wait_total_ms / self.wait_count) if self.wait_count else 0.0,
+                    "max_ms": self.wait_max_ms,
+                    "histogram": histogram,
+                },
+            }
+
+        # 현재 풀 상태 (QueuePool 계열만 제공)
+        if isinstance(pool, QueuePool):
+            data.update({
+                "pool_size": pool.size(),
+                "checked_out": pool.checkedout(),
+                "idle": pool.checkedin(),
+                "overflow": pool.overflow(),
+            })
+
+        return data
+
+
+# 풀 이름 -> (통계, 엔진)
+_registry: dict[str, tuple[PoolMetrics, Engine]] = {}
+
+# _do_get 재귀 호출 시 중복 측정 방지용
+_local = threading.local()
+
+
+class InstrumentedQueuePool(QueuePool):
+    '''
+    커넥션 대기 시간을 측정하는 QueuePool
+
+    - create_engine(..., poolclass=InstrumentedQueuePool, pool_logging_name=이름)
+    - pool_logging_name 은 풀 재생성(dispose) 후에도 유지되므로 통계 키로 사용
+    '''
+
+    def _do_get(self):
+        if getattr(_local, "timing", False):
+            return super()._do_get()
+
+        metrics = _registry.get(self._orig_logging_name, (None, None))[0]
+        _local.timing = True
+        started = time.perf_counter()
+        try:
+            return super()._do_get()
+        except exc.TimeoutError:
+            if metrics is not None:
+                metrics.incr("timeouts")
+            raise
+        finally:
+            _local.timing = False
+            if metrics is not None:
+                metrics.observe_wait(time.perf_counter() - started)
+
+
+def instrument_engine(engine: Engine, name: str) -> PoolMetrics:
+    '''
+    엔진의 풀 이벤트(connect/checkout/checkin/invalidate)에 통계 수집 리스너 등록
+    '''
+    metrics = PoolMetrics(name)
+    _registry[name] = (metrics, engine)
+
+    @event.listens_for(engine, "connect")
+    def _on_connect(dbapi_connection, connection_record):
+        metrics.incr("connects")
+
+    @event.listens_for(engine, "checkout")
+    def _on_checkout(dbapi_connection, connection_record, connection_proxy):
+        metrics.incr("checkouts")
+
+    @event.listens_for(engine, "checkin")
+    def _on_checkin(dbapi_connection, connection_record):
+        metrics.incr("checkins")
+
+    @event.listens_for(engine, "invalidate")
+    def _on_invalidate(dbapi_connection, connection_record, exception):
+        metrics.incr("invalidations")
+
+    return metrics
+
+
+def pool_metrics_snapshot() -> dict:
+    '''
+    등록된 모든 풀의 통계 + 현재 상태
+    '''
+    return {
+        name: metrics.snapshot(engine.pool)
+        for name, (metrics, engine) in _registry.items()
+    }
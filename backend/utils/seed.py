@@ -8,6 +8,8 @@ from backend.models.delivery_status_code import DeliveryStatusCode
 from backend.models.staff import Staff 
 from backend.models.child import Child, Wishlist
 from backend.models.region import Region
+from backend.utils.bulk import (bulk_insert, bulk_insert_ignore,
+                                bulk_insert_returning, DEFAULT_CHUNK_SIZE)
 
 def seed_raw_materials():
     db = SessionLocal()
@@ -20,14 +22,14 @@ def seed_raw_materials():
         (5, "태양조각"),
     ]
 
-    for mid, name in default_materials:
-        exists = db.query(RawMaterial).filter_by(material_id=mid).first()
-        if not exists:
-            db.add(RawMaterial(
-                material_id=mid,
-                material_name=name,
-                stock_quantity=0
-            ))
+    bulk_insert_ignore(
+        db,
+        RawMaterial,
+        [
+            {"material_id": mid, "material_name": name, "stock_quantity": 0}
+            for mid, name in default_materials
+        ],
+    )
 
     db.commit()
     db.close()
@@ -43,15 +45,14 @@ def seed_finished_goods():
         (5, "책"),
     ]
 
-    for gid, name in default_gifts:
-        exists = db.query(FinishedGoods).filter_by(gift_id=gid).first()
-
-        if not exists:
-            db.add(FinishedGoods(
-                gift_id=gid,
-                gift_name=name,
-                stock_quantity=0
-            ))
+    bulk_insert_ignore(
+        db,
+        FinishedGoods,
+        [
+            {"gift_id": gid, "gift_name": name, "stock_quantity": 0}
+            for gid, name in default_gifts
+        ],
+    )
             
     db.commit()
     db.close()
@@ -75,22 +76,20 @@ def seed_gift_bom():
         (13,5, 5, 2),  #    + 태양조각 2
     ]
 
-    for bom_id, out_id, in_mat, qty in default_boms:
-        exists = (
-            db.query(GiftBOM)
-              .filter_by(output_gift_id=out_id,
-                         input_material_id=in_mat)
-              .first()
-        )
-        if not exists:
-            db.add(
-                GiftBOM(
-                    bom_id=bom_id,
-                    output_gift_id=out_id,
-                    input_material_id=in_mat,
-                    quantity_required=qty,
-                )
-            )
+    # (output_gift_id, input_material_id) UNIQUE 또는 bom_id 충돌 시 skip
+    bulk_insert_ignore(
+        db,
+        GiftBOM,
+        [
+            {
+                "bom_id": bom_id,
+                "output_gift_id": out_id,
+                "input_material_id": in_mat,
+                "quantity_required": qty,
+            }
+            for bom_id, out_id, in_mat, qty in default_boms
+        ],
+    )
 
     db.commit()
     db.close()
@@ -109,18 +108,20 @@ def seed_reindeer():
         (8, "루돌프"),
     ]
 
-    for rid, name in default_reindeers:
-        exists = db.query(Reindeer).filter_by(reindeer_id=rid).first()
-        if not exists:
-            db.add(
-                Reindeer(
-                    reindeer_id=rid,
-                    name=name,
-                    current_stamina=100,
-                    current_magic=100,
-                    status="READY",
-                )
-            )
+    bulk_insert_ignore(
+        db,
+        Reindeer,
+        [
+            {
+                "reindeer_id": rid,
+                "name": name,
+                "current_stamina": 100,
+                "current_magic": 100,
+                "status": "READY",
+            }
+            for rid, name in default_reindeers
+        ],
+    )
 
     db.commit()
     db.close()
@@ -156,9 +157,11 @@ def seed_child_status_codes():
         ("NICE", "착한 아이"),
         ("NAUGHTY", "나쁜 아이"),
     ]
-    for code, desc in codes:
-        if not db.query(ChildStatusCode).filter_by(Code=code).first():
-            db.add(ChildStatusCode(Code=code, Description=desc))
+    bulk_insert_ignore(
+        db,
+        ChildStatusCode,
+        [{"Code": code, "Description": desc} for code, desc in codes],
+    )
     db.commit()
     db.close()
 
@@ -170,9 +173,11 @@ def seed_delivery_status_codes():
         ("PENDING", "배송 대기"),
         ("DELIVERED", "배송 완료"),
     ]
-    for code, desc in codes:
-        if not db.query(DeliveryStatusCode).filter_by(Code=code).first():
-            db.add(DeliveryStatusCode(Code=code, Description=desc))
+    bulk_insert_ignore(
+        db,
+        DeliveryStatusCode,
+        [{"Code": code, "Description": desc} for code, desc in codes],
+    )
     db.commit()
     db.close()
 
@@ -194,23 +199,31 @@ def seed_staff():
         ("santa2", "1234", "산타 2", "Santa")
     ]
 
+    # 이미 있는 Username 은 한 번에 조회 (bcrypt 해시는 새 계정만 계산)
+    existing = {
+        username
+        for (username,) in db.query(Staff.Username)
+        .filter(Staff.Username.in_([s[0] for s in default_staff]))
+        .all()
+    }
+
+    rows = []
     for username, password, name, role in default_staff:
-        exists = db.query(Staff).filter_by(Username=username).first()
-        if exists:
+        if username in existing:
             continue
 
         # 비밀번호: bcrypt로 해시
         hashed_pw = bcrypt.hashpw(password.encode("utf-8"), bcrypt.gensalt())
         hashed_pw = hashed_pw.decode("utf-8")
 
-        db.add(
-            Staff(
-                Username=username,
-                Password=hashed_pw,
-                Name=name,
-                Role=role,
-            )
-        )
+        rows.append({
+            "Username": username,
+            "Password": hashed_pw,
+            "Name": name,
+            "Role": role,
+        })
+
+    bulk_insert_ignore(db, Staff, rows, index_elements=["Username"])
 
     db.commit()
     db.close()
@@ -310,43 +323,82 @@ def seed_child():
         },
     ]
 
-    for child_data in dummy_children:
-        # 이미 같은 name의 Child가 있으면 Skip
-        exists = db.query(Child).filter(Child.Name == child_data["name"]).first()
-        if exists:
-            continue
-
-        # Child 생성
-        child = Child(
-            Name=child_data["name"],
-            Address=child_data["address"],
-            RegionID=child_data["region_id"],
-            StatusCode=child_data["status_code"],
-            DeliveryStatusCode=child_data["delivery_status_code"],
-            ChildNote=child_data["child_note"],
-        )
-        db.add(child)
-        db.flush()
-
-        # Wishlist 생성
-        for w in child_data["wishlist"]:
-            # 존재하는 gift_id인지 확인
-            gift_exists = db.query(FinishedGoods).filter(
-                FinishedGoods.gift_id == w["gift_id"]
-            ).first()
-            if not gift_exists:
-                continue  # Finished_Goods seed에서 gift 없으면 skip
-
-            wishlist_item = Wishlist(
-                ChildID=child.ChildID,
-                GiftID=w["gift_id"],
-                Priority=w["priority"],
-            )
-            db.add(wishlist_item)
+    bulk_seed_children(db, dummy_children)
 
     db.commit()
     db.close()
 
+def bulk_seed_children(db, children: list[dict]) -> int:
+    '''
+    Child + Wishlist 대량 시드 (대용량 fixture 에도 재사용)
+
+    - children: seed_child 의 dummy_children 과 같은 형식의 dict 목록
+    - 이미 같은 Name 의 Child 가 있으면 skip
+    - 존재하지 않는 gift_id 의 wishlist 는 skip
+    - 행 수와 관계없이 청크당 몇 개의 문장만 실행 (행 단위 조회 없음)
+    - 새로 추가한 Child 수 반환 (commit 은 호출한 쪽에서)
+    '''
+    # 이미 있는 Name 을 청크 단위로 한 번에 조회
+    names = list({c["name"] for c in children})
+    existing_names = set()
+    for start in range(0, len(names), DEFAULT_CHUNK_SIZE):
+        existing_names.update(
+            name
+            for (name,) in db.query(Child.Name)
+            .filter(Child.Name.in_(names[start:start + DEFAULT_CHUNK_SIZE]))
+            .all()
+        )
+
+    # 같은 요청 안에서 이름이 중복되면 첫 번째만 사용
+    new_children = []
+    seen = set(existing_names)
+    for c in children:
+        if c["name"] in seen:
+            continue
+        seen.add(c["name"])
+        new_children.append(c)
+
+    if not new_children:
+        return 0
+
+    # Child INSERT ... RETURNING ChildID (입력 순서 유지)
+    inserted = bulk_insert_returning(
+        db,
+        Child,
+        (
+            {
+                "Name": c["name"],
+                "Address": c["address"],
+                "RegionID": c["region_id"],
+                "StatusCode": c["status_code"],
+                "DeliveryStatusCode": c["delivery_status_code"],
+                "ChildNote": c["child_note"],
+            }
+            for c in new_children
+        ),
+        returning=[Child.__table__.c.ChildID],
+    )
+
+    # Finished_Goods 에 존재하는 gift_id 만 한 번에 조회
+    valid_gift_ids = {gid for (gid,) in db.query(FinishedGoods.gift_id).all()}
+
+    bulk_insert(
+        db,
+        Wishlist,
+        (
+            {
+                "ChildID": row.ChildID,
+                "GiftID": w["gift_id"],
+                "Priority": w["priority"],
+            }
+            for row, c in zip(inserted, new_children)
+            for w in c["wishlist"]
+            if w["gift_id"] in valid_gift_ids
+        ),
+    )
+
+    return len(inserted)
+
 # 지역(Region) 기본값 Seed
 def seed_regions():
     '''
@@ -371,10 +423,7 @@ def seed_regions():
         {"RegionID": 7, "RegionName": "Oceania"},
     ]
 
-    for r in default_regions:
-        exists = db.query(Region).filter(Region.RegionID == r["RegionID"]).first()
-        if not exists:
-            db.add(Region(**r))
+    bulk_insert_ignore(db, Region, default_regions)
 
     db.commit()
     db.close()
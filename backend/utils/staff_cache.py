@@ -0,0 +1,87 @@
+import os
+import threading
+import time
+from collections import OrderedDict
+
+
+class StaffRoleCache:
+    '''
+    StaffID -> DB Role 인-프로세스 캐시
+
+    - get_authorized_db 가 매 요청마다 staff 테이블을 조회하지 않도록 사용
+    - 최대 크기(max_size)를 넘으면 가장 오래 사용되지 않은 항목부터 제거 (LRU)
+    - TTL(ttl_seconds)이 지난 항목은 miss 로 처리
+    - /staff 에서 계정이 생성/변경되면 invalidate() 로 명시적으로 제거
+    '''
+
+    def __init__(self, max_size: int = 1024, ttl_seconds: float = 300.0):
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        self._entries: "OrderedDict[int, tuple[str, float]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    def get(self, staff_id: int) -> str | None:
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(staff_id)
+            if entry is None:
+                self.misses += 1
+                return None
+
+            db_role, expires_at = entry
+            if expires_at <= now:
+                # TTL 만료 -> 제거 후 miss
+                del self._entries[staff_id]
+                self.misses += 1
+                return None
+
+            self._entries.move_to_end(staff_id)
+            self.hits += 1
+            return db_role
+
+    def set(self, staff_id: int, db_role: str) -> None:
+        expires_at = time.monotonic() + self.ttl_seconds
+        with self._lock:
+            self._entries[staff_id] = (db_role, expires_at)
+            self._entries.move_to_end(staff_id)
+
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def invalidate(self, staff_id: int | None = None) -> None:
+        '''
+        staff_id 가 주어지면 해당 항목만, 없으면 전체 캐시 제거
+        '''
+        with self._lock:
+            if staff_id is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(staff_id, None)
+            self.invalidations += 1
+
+    def stats(self) -> dict:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "size": len(self._entries),
+                "max_size": self.max_size,
+                "ttl_seconds": self.ttl_seconds,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_ratio": (self.hits / lookups) if lookups else 0.0,
+                "evictions": self.evictions,
+                "invalidations": self.invalidations,
+            }
+
+
+# 앱 전체에서 공유하는 캐시 인스턴스 (환경변수로 크기/TTL 조정)
+staff_role_cache = StaffRoleCache(
+    max_size=int(os.getenv("STAFF_CACHE_MAX_SIZE", "1024")),
+    ttl_seconds=float(os.getenv("STAFF_CACHE_TTL_SECONDS", "300")),
+)
@@ -0,0 +1,86 @@
+import base64
+import hashlib
+import hmac
+import os
+import secrets
+import time
+
+# 서명 키 (여러 워커/서버가 같은 토큰을 검증하려면 반드시 환경변수로 지정)
+SESSION_TOKEN_SECRET = os.getenv("SESSION_TOKEN_SECRET")
+
+# 개발용: 워커 1개로 띄울 때만 프로세스별 임시 키 허용 (SESSION_TOKEN_DEV_SECRET=1)
+# - 워커마다 키가 달라지면 다른 워커가 발급한 토큰 검증이 실패하므로 운영에서는 사용 금지
+DEV_SECRET_ENABLED = os.getenv("SESSION_TOKEN_DEV_SECRET", "0") == "1"
+
+if not SESSION_TOKEN_SECRET:
+    if not DEV_SECRET_ENABLED:
+        raise ValueError(
+            "SESSION_TOKEN_SECRET 환경변수가 설정되지 않았습니다. .env 파일을 확인하세요. "
+            "(개발용 임시 키: SESSION_TOKEN_DEV_SECRET=1)"
+        )
+    print("SESSION_TOKEN_DEV_SECRET=1 -> 임시 키를 사용합니다. (워커 1개 전용, 재시작 시 기존 토큰 무효)")
+    SESSION_TOKEN_SECRET = secrets.token_urlsafe(32)
+
+# 토큰 유효 시간 (기본 12시간)
+SESSION_TOKEN_TTL_SECONDS = int(os.getenv("SESSION_TOKEN_TTL_SECONDS", "43200"))
+
+_SECRET_BYTES = SESSION_TOKEN_SECRET.encode("utf-8")
+
+
+def _b64encode(raw: bytes) -> str:
+    return base64.urlsafe_b64encode(raw).rstrip(b"=").decode("ascii")
+
+
+def _b64decode(data: str) -> bytes:
+    return base64.urlsafe_b64decode(data + "=" * (-len(data) % 4))
+
+
+def _sign(body: str) -> str:
+    digest = hmac.new(_SECRET_BYTES, body.encode("ascii"), hashlib.sha256).digest()
+    return _b64encode(digest)
+
+
+def issue_token(staff_id: int, role: str, ttl_seconds: int | None = None) -> tuple[str, int]:
+    '''
+    로그인 성공 시 발급하는 세션 토큰 생성
+
+    - 형식: base64url("StaffID:Role:만료시각") + "." + base64url(HMAC-SHA256)
+    - (토큰, 만료 시각 epoch 초) 반환
+    '''
+    ttl = SESSION_TOKEN_TTL_SECONDS if ttl_seconds is None else ttl_seconds
+    expires_at = int(time.time()) + ttl
+
+    body = _b64encode(f"{staff_id}:{role}:{expires_at}".encode("utf-8"))
+    return f"{body}.{_sign(body)}", expires_at
+
+
+def verify_token(token: str) -> tuple[int, str] | None:
+    '''
+    세션 토큰 검증 (DB 조회 없음)
+
+    - 서명 비교는 hmac.compare_digest 로 상수 시간 처리
+    - 유효하면 (StaffID, Role), 형식 오류/위조/만료면 None
+    '''
+    body, sep, signature = token.partition(".")
+    if not sep or not body or not signature:
+        return None
+
+    try:
+        body.encode("ascii")
+    except UnicodeEncodeError:
+        return None
+
+    if not hmac.compare_digest(_sign(body).encode("ascii"), signature.encode("utf-8")):
+        return None
+
+    try:
+        staff_id, role, expires_at = _b64decode(body).decode("utf-8").split(":")
+        staff_id = int(staff_id)
+        expires_at = int(expires_at)
+    except ValueError:
+        return None
+
+    if expires_at <= time.time():
+        return None
+
+    return staff_id, role
@@ -1,6 +1,22 @@
+import os
+import random
+import time
 from contextlib import contextmanager
-from typing import Iterator
+from typing import Callable, Iterator, TypeVar
+
+from fastapi import HTTPException
 from sqlalchemy.orm import Session
+from sqlalchemy.orm.exc import StaleDataError
+
+from backend.utils.conflict_metrics import conflict_metrics
+
+T = TypeVar("T")
+
+# 버전 충돌 시 최대 시도 횟수 (첫 시도 포함)
+OPTIMISTIC_MAX_ATTEMPTS = int(os.getenv("OPTIMISTIC_MAX_ATTEMPTS", "5"))
+
+# 재시도 전 대기 시간 (초, 시도마다 2배 + jitter)
+OPTIMISTIC_BACKOFF_SECONDS = float(os.getenv("OPTIMISTIC_BACKOFF_SECONDS", "0.005"))
 
 
 @contextmanager
@@ -15,3 +31,46 @@ def transactional_session(db: Session) -> Iterator[Session]:
     except Exception:
         db.rollback()
         raise
+
+
+def run_optimistic(
+    db: Session,
+    operation: str,
+    fn: Callable[[], T],
+    max_attempts: int = OPTIMISTIC_MAX_ATTEMPTS,
+    before_commit: Callable[[T], None] | None = None,
+) -> T:
+    """
+    version_id 충돌(StaleDataError) 시 자동 재시도하는 트랜잭션
+
+    - fn(): 읽기 -> 검증 -> 수정까지 한 번의 시도 (매 시도마다 DB 에서 다시 읽어야 함)
+    - 충돌이 없으면 COMMIT 후 fn 결과 반환
+    - 충돌하면 ROLLBACK (세션 객체 expire -> 다음 시도에서 최신 값 조회) 후 재시도
+    - max_attempts 번 모두 충돌하면 409
+    - 다른 예외는 ROLLBACK 후 그대로 발생 (재시도 안 함)
+    - 시도/충돌 횟수는 conflict_metrics 에 operation 이름으로 기록
+    - before_commit(결과): 있으면 fn 성공 후 같은 트랜잭션에서 COMMIT 직전에 호출
+      (Idempotency-Key 결과 저장 등, 예외를 내면 fn 의 변경도 함께 ROLLBACK)
+    """
+    for attempt in range(1, max_attempts + 1):
+        conflict_metrics.incr(operation, "attempts")
+        try:
+            with transactional_session(db):
+                result = fn()
+                if before_commit is not None:
+                    before_commit(result)
+
+            conflict_metrics.incr(operation, "committed")
+            return result
+
+        except StaleDataError:
+            conflict_metrics.incr(operation, "conflicts")
+            if attempt == max_attempts:
+                break
+            time.sleep(OPTIMISTIC_BACKOFF_SECONDS * 2 ** (attempt - 1) * random.uniform(0.5, 1.5))
+
+    conflict_metrics.incr(operation, "exhausted")
+    raise HTTPException(
+        status_code=409,
+        detail="동시에 수정한 요청이 많아 처리하지 못했습니다. 잠시 후 다시 시도하세요.",
+    )
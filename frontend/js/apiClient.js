@@ -16,17 +16,35 @@ export function initStaffId() {
   }
 }
 
+// 로그인 응답에 포함된 세션 토큰 조회
+function getSessionToken() {
+  try {
+    const user = JSON.parse(localStorage.getItem("currentUser") || "null");
+    return user ? user.token : null;
+  } catch (e) {
+    return null;
+  }
+}
+
 // 공통 GET 함수
 export async function apiGet(path) {
   if (!currentStaffId) {
     throw new Error("Missing staff ID. Please login again.");
   }
 
+  const headers = {
+    "x-staff-id": String(currentStaffId), // 없으면 빈 문자열
+  };
+
+  // 로그인 시 발급된 세션 토큰이 있으면 함께 전송 (서버에서 staff 조회 생략)
+  const token = getSessionToken();
+  if (token) {
+    headers["Authorization"] = `Bearer ${token}`;
+  }
+
   const res = await fetch(`${API_BASE}${path}`, {
     method: "GET",
-    headers: {
-      "x-staff-id": String(currentStaffId), // 없으면 빈 문자열
-    },
+    headers,
   });
 
   if (!res.ok) {
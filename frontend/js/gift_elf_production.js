@@ -427,7 +427,9 @@ async function handleProduce(giftId, qty) {
       method: "POST",
       headers: {
         "Content-Type": "application/json",
-        "x-staff-id": String(state.staffId)
+        "x-staff-id": String(state.staffId),
+        // 프록시가 재전송해도 같은 Job 이 두 번 생기지 않도록 요청마다 새 키
+        "Idempotency-Key": crypto.randomUUID ? crypto.randomUUID() : `${Date.now()}-${Math.random()}`
       },
       body: JSON.stringify({
         gift_id: giftId,
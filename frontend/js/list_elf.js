@@ -36,14 +36,29 @@ async function loadRegions() {
 }
 
 
-// Child 목록 불러오기
+// Child 목록 불러오기 (페이지 단위로 이어서 조회)
+const CHILD_PAGE_SIZE = 1000;
+
 async function loadChildren() {
-    const res = await fetch(`${BASE_URL}/list-elf/child/all`, {
-        headers: {
-            "x-staff-id": String(getStaffId())
-        }
-    });
-    childrenData = await res.json();
+    const rows = [];
+    let cursor = null;
+
+    do {
+        const params = new URLSearchParams({ limit: CHILD_PAGE_SIZE });
+        if (cursor) params.set("cursor", cursor);
+
+        const res = await fetch(`${BASE_URL}/list-elf/child/all?${params}`, {
+            headers: {
+                "x-staff-id": String(getStaffId())
+            }
+        });
+        rows.push(...await res.json());
+
+        // 다음 페이지가 없으면 헤더가 없음
+        cursor = res.headers.get("X-Next-Cursor");
+    } while (cursor);
+
+    childrenData = rows;
     renderChildren();
 }
 
@@ -94,7 +94,7 @@ async function handleLogin(event) {
     }
 
     const data = await res.json();
-    // data: { staff_id, username, name, role }
+    // data: { staff_id, username, name, role, token, token_expires_at }
 
     saveLoginInfo(data);
     redirectByRole(data.role);
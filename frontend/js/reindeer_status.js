@@ -7,6 +7,7 @@ const API = {
 
 let reindeers = [];
 let editModal;
+let editingVersion = null; // 수정 모달을 연 시점의 version_id
 
 // 유틸리티
 function $(sel) { return document.querySelector(sel); }
@@ -166,13 +167,16 @@ async function giveItem(r, type) {
         reindeer_id: r.reindeer_id,
         status: newStatus,
         current_stamina: newStamina,
-        current_magic: newMagic
+        current_magic: newMagic,
+        version_id: r.version_id
       })
     });
     showToast(type === "carrot" ? "체력 회복! (+10)" : "마력 충전! (+10)", "success");
     loadReindeers();
   } catch (err) {
+    // 다른 사람이 먼저 수정했으면(409) 최신 값으로 다시 그림
     showToast(err.message, "error");
+    loadReindeers();
   }
 }
 
@@ -182,6 +186,7 @@ function openEditModal(r) {
   $("#edit-stamina").value = r.current_stamina;
   $("#edit-magic").value = r.current_magic;
   $("#edit-status").value = r.status;
+  editingVersion = r.version_id;
   editModal.show();
 }
 
@@ -203,7 +208,8 @@ async function submitEdit() {
         reindeer_id: id,
         status: status,
         current_stamina: stamina,
-        current_magic: magic
+        current_magic: magic,
+        version_id: editingVersion
       })
     });
     showToast("정보가 수정되었습니다.", "success");
@@ -211,5 +217,6 @@ async function submitEdit() {
     loadReindeers();
   } catch (err) {
     showToast(err.message, "error");
+    loadReindeers();
   }
 }
\ No newline at end of file
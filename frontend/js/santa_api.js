@@ -4,7 +4,8 @@ const API_BASE = "http://127.0.0.1:8000";
 const santaState = {
     staffId: null,
     username: null,
-    role: null
+    role: null,
+    token: null
 };
 
 function initUserInfo() {
@@ -19,6 +20,7 @@ function initUserInfo() {
             santaState.staffId = user.staff_id;
             santaState.username = user.username;
             santaState.role = user.role;
+            santaState.token = user.token || null;
         }
 
         const nameEl = document.getElementById("header-user-name");
@@ -61,7 +63,14 @@ async function apiRequest(path, options = {}) {
         headers["x-staff-id"] = String(santaState.staffId);
     }
 
-    const res = await fetch(API_BASE + path, { ...options, headers });
+    // 로그인 시 발급된 세션 토큰 (서버에서 staff 조회 없이 검증)
+    if (santaState.token) {
+        headers["Authorization"] = `Bearer ${santaState.token}`;
+    }
+
+    const { onResponse, ...fetchOptions } = options;
+    const res = await fetch(API_BASE + path, { ...fetchOptions, headers });
+    if (onResponse) onResponse(res);
     
     // 204 처리
     if (res.status === 204) return true;
@@ -87,6 +96,27 @@ async function apiGET(path) {
     return apiRequest(path, { method: "GET" });
 }
 
+// keyset 페이지 API 전체 조회 (X-Next-Cursor 헤더가 없을 때까지 이어서 요청)
+async function apiGETAll(path, pageSize = 1000) {
+    const rows = [];
+    let cursor = null;
+
+    do {
+        const params = new URLSearchParams({ limit: pageSize });
+        if (cursor) params.set("cursor", cursor);
+
+        let next = null;
+        const page = await apiRequest(`${path}${path.includes("?") ? "&" : "?"}${params}`, {
+            method: "GET",
+            onResponse: (res) => { next = res.headers.get("X-Next-Cursor"); },
+        });
+        rows.push(...page);
+        cursor = next;
+    } while (cursor);
+
+    return rows;
+}
+
 async function apiPOST(path, body = {}) {
     return apiRequest(path, {
         method: "POST",
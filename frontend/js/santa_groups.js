@@ -523,6 +523,25 @@ async function handleAddToQueue() {
     }
 }
 
+// 백그라운드 작업이 끝날 때까지 대기 후 결과 반환 (실패 시 { detail } 로 throw)
+const JOB_POLL_INTERVAL_MS = 1000;
+
+async function waitForJob(jobId) {
+    while (true) {
+        const job = await apiGET(`/jobs/${jobId}`);
+
+        if (job.status === "SUCCEEDED") {
+            const done = await apiGET(`/jobs/${jobId}/result`);
+            return done.result;
+        }
+        if (job.status === "FAILED") {
+            throw { detail: job.error || "작업이 실패했습니다." };
+        }
+
+        await new Promise(resolve => setTimeout(resolve, JOB_POLL_INTERVAL_MS));
+    }
+}
+
 async function handleDeliverGroup(groupId) {
     const result = await Swal.fire({
         title: '!배송 시작!',
@@ -545,11 +564,10 @@ async function handleDeliverGroup(groupId) {
 
     try {
         setLoading(true);
-        const res = await apiPOST(
-            `/santa/groups/${groupId}/deliver`,
-            {}, 
-            { "x-staff-id": String(santaState.staffId) } 
-        );
+
+        // 큰 그룹도 요청이 오래 걸리지 않도록 백그라운드 작업으로 등록 후 완료까지 폴링
+        const job = await apiPOST(`/santa/groups/${groupId}/deliver-async`, {});
+        const res = await waitForJob(job.job_id);
         
         await Swal.fire({
             title: '배송 완료!',
@@ -324,7 +324,7 @@ async function loadLogsPage() {
             apiGET("/santa/groups?status_filter=FAILED"),
             apiGET("/reindeer/"),  
             apiGET("/staff"),
-            apiGET("/list-elf/child/all"), 
+            apiGETAll("/list-elf/child/all"), 
             apiGET("/gift/")
         ]);
 
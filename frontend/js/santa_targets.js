@@ -68,7 +68,7 @@ async function loadRegions() {
 
 // 전체 아이 불러오기 
 async function loadChildren() {
-    allChildren = await apiGET("/list-elf/child/all");
+    allChildren = await apiGETAll("/list-elf/child/all");
     renderFiltered();
 }
 
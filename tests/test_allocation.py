@@ -0,0 +1,111 @@
+import numpy as np
+
+from backend.services import allocation
+from backend.services.allocation import NO_GIFT, allocate_gifts, fair_order, solve_allocation
+
+
+def _wishes(rows):
+    return np.array(rows, dtype=np.int64)
+
+
+def test_stock_is_never_exceeded():
+    # 5명 모두 선물 0 만 원함, 재고 2개
+    wishes = _wishes([[0]] * 5)
+    stock = np.array([2], dtype=np.int64)
+
+    assigned, rank = solve_allocation(wishes, stock, np.arange(5))
+
+    assert (assigned == 0).sum() == 2
+    assert assigned.tolist() == [0, 0, NO_GIFT, NO_GIFT, NO_GIFT]
+    assert rank.tolist() == [0, 0, 1, 1, 1]
+    # 입력 재고 배열은 바뀌지 않음
+    assert stock.tolist() == [2]
+
+
+def test_first_choices_before_second_choices():
+    # 아이 0 은 1순위 선물 0 (재고 0) -> 2순위 선물 1
+    # 아이 1 은 1순위가 선물 1 -> 처리 순서가 뒤여도 아이 0 의 2순위보다 먼저
+    wishes = _wishes([[0, 1], [1, NO_GIFT]])
+    stock = np.array([0, 1], dtype=np.int64)
+
+    assigned, rank = solve_allocation(wishes, stock, np.array([0, 1]))
+
+    assert assigned.tolist() == [NO_GIFT, 1]
+    assert rank.tolist() == [2, 0]
+
+
+def test_falls_through_to_later_priorities():
+    wishes = _wishes([[0, 1, 2], [0, 1, 2], [0, 1, 2]])
+    stock = np.array([1, 1, 1], dtype=np.int64)
+
+    assigned, rank = solve_allocation(wishes, stock, np.arange(3))
+
+    assert assigned.tolist() == [0, 1, 2]
+    assert rank.tolist() == [0, 1, 2]
+
+
+def test_empty_input():
+    wishes = np.full((0, 0), NO_GIFT, dtype=np.int64)
+    order = fair_order(np.array([], dtype=np.int64))
+
+    assigned, rank = solve_allocation(wishes, np.array([3], dtype=np.int64), order)
+    assert assigned.size == 0 and rank.size == 0
+
+
+def test_fair_order_interleaves_regions_by_size():
+    # 지역 1: 4명, 지역 2: 2명 -> 지역 1 두 명마다 지역 2 한 명
+    region_ids = np.array([1, 1, 1, 1, 2, 2], dtype=np.int64)
+
+    order = fair_order(region_ids)
+
+    assert sorted(order.tolist()) == list(range(6))
+    assert region_ids[order].tolist() == [1, 2, 1, 1, 2, 1]
+    # 같은 지역 안에서는 입력 순서 유지
+    assert [i for i in order.tolist() if region_ids[i] == 1] == [0, 1, 2, 3]
+
+
+def test_short_stock_is_shared_in_proportion_to_regions():
+    # 지역 1: 60명, 지역 2: 20명, 모두 선물 0 원함, 재고 40 -> 30 : 10
+    region_ids = np.array([1] * 60 + [2] * 20, dtype=np.int64)
+    wishes = _wishes([[0]] * 80)
+    stock = np.array([40], dtype=np.int64)
+
+    assigned, _ = solve_allocation(wishes, stock, fair_order(region_ids))
+
+    got = assigned == 0
+    assert got[region_ids == 1].sum() == 30
+    assert got[region_ids == 2].sum() == 10
+
+
+class _GiftRows:
+    def __init__(self, rows):
+        self.rows = rows
+
+    def execute(self, query):
+        return self
+
+    def all(self):
+        return self.rows
+
+
+def test_allocate_gifts_reports_wishlist_priority(monkeypatch):
+    # (ChildID, RegionID, GiftID, Priority) - Priority 값이 1부터 연속이 아님
+    rows = np.array([
+        [1, 1, 10, 2],
+        [1, 1, 20, 5],
+        [2, 1, 20, 3],
+        [3, 1, 10, 7],
+    ], dtype=np.int64)
+    monkeypatch.setattr(allocation, "_copy_int_rows", lambda db, sql, params, columns: rows)
+
+    # 선물 10 재고 1, 선물 20 재고 5
+    result = allocate_gifts(_GiftRows([(10, 1), (20, 5)]))
+
+    assert result["assignments"] == [
+        {"child_id": 1, "gift_id": 10, "priority": 2},
+        {"child_id": 2, "gift_id": 20, "priority": 3},
+    ]
+    assert result["unassigned_child_ids"] == [3]
+    gifts = {g["gift_id"]: g for g in result["gifts"]}
+    assert gifts[10]["assigned"] == 1 and gifts[10]["unmet_demand"] == 1
+    assert gifts[20]["remaining"] == 4
@@ -0,0 +1,96 @@
+'''
+get_authorized_db / get_async_authorized_db 가 헤더에서 역할을 구해 세션에 설정하는지 확인
+
+- Bearer 토큰, 또는 캐시에 있는 X-Staff-ID 만 사용 -> staff 테이블 조회(DB 연결) 없음
+- 새 세션은 트랜잭션이 없으므로 SET LOCAL ROLE 도 실행되지 않음
+'''
+import asyncio
+
+import pytest
+from fastapi import HTTPException
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from backend.database import SessionLocal, get_async_authorized_db, get_authorized_db
+from backend.utils.staff_cache import staff_role_cache
+from backend.utils.tokens import issue_token
+
+
+def _resolve_sync(x_staff_id=None, authorization=None) -> dict:
+    gen = get_authorized_db(x_staff_id, authorization, SessionLocal())
+    db = next(gen)
+    info = dict(db.info)
+    gen.close()
+    # 의존성 종료 후 역할 정보는 세션에서 제거됨
+    assert "db_role" not in db.info and "session_role" not in db.info
+    return info
+
+
+def _resolve_async(x_staff_id=None, authorization=None) -> dict:
+    async def run():
+        gen = get_async_authorized_db(x_staff_id, authorization, AsyncSession())
+        db = await gen.__anext__()
+        info = dict(db.info)
+        await gen.aclose()
+        return info
+
+    return asyncio.run(run())
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    staff_role_cache.invalidate()
+    yield
+    staff_role_cache.invalidate()
+
+
+@pytest.mark.parametrize("resolve", [_resolve_sync, _resolve_async])
+def test_bearer_token_sets_role(resolve):
+    token, _ = issue_token(3, "Santa")
+
+    info = resolve(authorization=f"Bearer {token}")
+
+    assert info["staff_id"] == 3
+    assert info["db_role"] == "role_santa"
+    assert info["session_role"] == "role_santa"
+
+
+@pytest.mark.parametrize("resolve", [_resolve_sync, _resolve_async])
+def test_cached_staff_id_sets_role(resolve):
+    staff_role_cache.set(7, "role_keeper")
+
+    info = resolve(x_staff_id="7")
+
+    assert info["staff_id"] == 7
+    assert info["db_role"] == "role_keeper"
+
+
+@pytest.mark.parametrize("resolve", [_resolve_sync, _resolve_async])
+def test_invalid_token_is_401(resolve):
+    with pytest.raises(HTTPException) as exc:
+        resolve(authorization="Bearer not-a-token")
+    assert exc.value.status_code == 401
+
+
+@pytest.mark.parametrize("resolve", [_resolve_sync, _resolve_async])
+def test_token_and_other_staff_id_is_401(resolve):
+    token, _ = issue_token(3, "Santa")
+
+    with pytest.raises(HTTPException) as exc:
+        resolve(x_staff_id="4", authorization=f"Bearer {token}")
+    assert exc.value.status_code == 401
+
+
+@pytest.mark.parametrize("resolve", [_resolve_sync, _resolve_async])
+def test_missing_identity_is_401(resolve):
+    with pytest.raises(HTTPException) as exc:
+        resolve()
+    assert exc.value.status_code == 401
+
+
+@pytest.mark.parametrize("resolve", [_resolve_sync, _resolve_async])
+def test_unmapped_role_is_403(resolve):
+    token, _ = issue_token(3, "Reindeer")
+
+    with pytest.raises(HTTPException) as exc:
+        resolve(authorization=f"Bearer {token}")
+    assert exc.value.status_code == 403
@@ -0,0 +1,57 @@
+import pytest
+from sqlalchemy import Column, Integer, MetaData, String, Table, create_engine, select
+from sqlalchemy.orm import Session
+
+from backend.utils.bulk import bulk_insert, bulk_insert_returning, chunked
+
+metadata = MetaData()
+items = Table(
+    "items",
+    metadata,
+    Column("id", Integer, primary_key=True, autoincrement=True),
+    Column("name", String, nullable=False),
+)
+
+
+@pytest.fixture
+def db():
+    engine = create_engine("sqlite://")
+    metadata.create_all(engine)
+    with Session(engine) as session:
+        yield session
+
+
+def test_chunked_sizes():
+    chunks = list(chunked(({"n": i} for i in range(7)), size=3))
+
+    assert [len(c) for c in chunks] == [3, 3, 1]
+    assert [row["n"] for c in chunks for row in c] == list(range(7))
+
+
+def test_chunked_empty():
+    assert list(chunked([], size=3)) == []
+
+
+def test_bulk_insert_returning_keeps_input_order(db):
+    names = [f"row-{i}" for i in range(10)]
+
+    rows = bulk_insert_returning(
+        db,
+        items,
+        ({"name": n} for n in names),
+        returning=[items.c.id, items.c.name],
+        chunk_size=3,
+    )
+
+    # 청크가 여러 개여도 입력 순서대로 (id, name) 이 돌아옴
+    assert [r.name for r in rows] == names
+    stored = dict(db.execute(select(items.c.id, items.c.name)).all())
+    assert all(stored[r.id] == r.name for r in rows)
+
+
+def test_bulk_insert_all_chunks(db):
+    bulk_insert(db, items, ({"name": str(i)} for i in range(8)), chunk_size=3)
+
+    assert db.execute(select(items.c.name).order_by(items.c.id)).scalars().all() == [
+        str(i) for i in range(8)
+    ]
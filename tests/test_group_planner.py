@@ -0,0 +1,36 @@
+import pytest
+
+from backend.services.group_planner import split_by_capacity
+
+
+@pytest.mark.parametrize(
+    "count, capacities",
+    [
+        (10, [5, 5]),
+        (7, [10, 20, 30]),
+        (100, [10, 20]),
+        (0, [3, 4]),
+        (5, [0, 9]),
+        (11, [1, 1, 1, 100]),
+    ],
+)
+def test_shares_fit_capacity_and_sum(count, capacities):
+    shares = split_by_capacity(count, capacities)
+
+    assert len(shares) == len(capacities)
+    assert sum(shares) == min(count, sum(capacities))
+    assert all(0 <= s <= c for s, c in zip(shares, capacities))
+
+
+def test_shares_are_proportional():
+    assert split_by_capacity(60, [10, 20, 30]) == [10, 20, 30]
+    assert split_by_capacity(30, [10, 20, 30]) == [5, 10, 15]
+
+
+def test_remainder_goes_to_largest_spare_capacity():
+    # 7 * [1, 2] / 3 = [2.33, 4.67] -> 내림 [2, 4], 남은 1명은 여유가 큰 쪽
+    assert split_by_capacity(7, [10, 20]) == [2, 5]
+
+
+def test_overflow_is_capped():
+    assert split_by_capacity(100, [10, 20]) == [10, 20]
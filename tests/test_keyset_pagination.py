@@ -0,0 +1,107 @@
+'''
+ChildID keyset 페이지네이션 (X-Next-Cursor)
+
+- /list-elf/child/all (get_all_children), /santa/targets (get_santa_targets)
+- 마지막 페이지가 아니면 X-Next-Cursor 로 이어서 조회했을 때 빠짐/중복 없이 전체가 나와야 함
+'''
+import pytest
+from fastapi import Response
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session
+
+from backend.database import Base
+from backend.models.child import Child, Wishlist
+from backend.models.child_status_code import ChildStatusCode
+from backend.models.delivery_status_code import DeliveryStatusCode
+from backend.models.gift import FinishedGoods
+from backend.models.region import Region
+from backend.routers.list_elf_child import get_all_children
+from backend.routers.santa_view import get_santa_targets
+
+TABLES = [Region, ChildStatusCode, DeliveryStatusCode, FinishedGoods, Child, Wishlist]
+
+
+@pytest.fixture
+def db():
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine, tables=[m.__table__ for m in TABLES])
+
+    with Session(engine) as session:
+        session.add(Region(RegionID=1, RegionName="North"))
+        session.add_all([ChildStatusCode(Code=c, Description=c) for c in ("PENDING", "NICE", "NAUGHTY")])
+        session.add_all([DeliveryStatusCode(Code=c, Description=c) for c in ("PENDING", "DELIVERED")])
+        session.add(FinishedGoods(gift_id=1, gift_name="Teddy", stock_quantity=10))
+        session.flush()
+
+        for i in range(1, 12):
+            session.add(Child(
+                ChildID=i,
+                Name=f"child {i}",
+                Address=f"{i} Snow St",
+                RegionID=1,
+                # 3의 배수는 NAUGHTY, 5는 배송 완료 -> /santa/targets 에서 제외
+                StatusCode="NAUGHTY" if i % 3 == 0 else "NICE",
+                DeliveryStatusCode="DELIVERED" if i == 5 else "PENDING",
+            ))
+        session.flush()
+        session.add(Wishlist(ChildID=1, GiftID=1, Priority=1))
+        session.commit()
+
+        yield session
+
+
+def _walk(fetch, limit):
+    '''
+    X-Next-Cursor 가 없을 때까지 이어서 조회 -> (페이지별 ChildID 목록, 마지막 응답)
+    '''
+    pages, cursor = [], None
+    while True:
+        response = Response()
+        page = fetch(response, cursor, limit)
+        pages.append(page)
+        cursor = response.headers.get("X-Next-Cursor")
+        if cursor is None:
+            return pages
+        assert cursor == str(page[-1])
+        cursor = int(cursor)
+
+
+def test_child_list_pages_cover_all_rows(db):
+    def fetch(response, cursor, limit):
+        children = get_all_children(
+            response, cursor=cursor, limit=limit, region_id=None,
+            status_code=None, delivery_status_code=None, db=db,
+        )
+        return [c.child_id for c in children]
+
+    pages = _walk(fetch, limit=4)
+
+    assert pages == [[1, 2, 3, 4], [5, 6, 7, 8], [9, 10, 11]]
+
+
+def test_child_list_exact_multiple_has_no_empty_page(db):
+    def fetch(response, cursor, limit):
+        children = get_all_children(
+            response, cursor=cursor, limit=limit, region_id=None,
+            status_code="nice", delivery_status_code=None, db=db,
+        )
+        return [c.child_id for c in children]
+
+    # NICE 8명 -> 4명씩 2페이지, 빈 3번째 페이지 없음
+    pages = _walk(fetch, limit=4)
+
+    assert pages == [[1, 2, 4, 5], [7, 8, 10, 11]]
+
+
+def test_santa_targets_pages_cover_all_targets(db):
+    def fetch(response, cursor, limit):
+        rows = get_santa_targets(
+            response, region_id=None, cursor=cursor, limit=limit, fields=None, db=db,
+        )
+        return [r.child_id for r in rows]
+
+    pages = _walk(fetch, limit=3)
+
+    assert [c for page in pages for c in page] == [1, 2, 4, 7, 8, 10, 11]
+    assert all(len(page) <= 3 for page in pages)
+
@@ -0,0 +1,76 @@
+import pytest
+
+from backend.utils import staff_cache
+from backend.utils.staff_cache import StaffRoleCache
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    '''
+    time.monotonic 을 직접 움직이는 가짜 시계
+    '''
+    now = [1000.0]
+    monkeypatch.setattr(staff_cache.time, "monotonic", lambda: now[0])
+    return now
+
+
+def test_hit_and_miss():
+    cache = StaffRoleCache(max_size=4, ttl_seconds=60)
+    cache.set(1, "role_santa")
+
+    assert cache.get(1) == "role_santa"
+    assert cache.get(2) is None
+    assert cache.stats()["hits"] == 1
+    assert cache.stats()["misses"] == 1
+
+
+def test_ttl_expiry(clock):
+    cache = StaffRoleCache(max_size=4, ttl_seconds=10)
+    cache.set(1, "role_santa")
+
+    clock[0] += 9.9
+    assert cache.get(1) == "role_santa"
+
+    clock[0] += 0.1
+    assert cache.get(1) is None
+    assert cache.stats()["size"] == 0
+
+
+def test_set_refreshes_ttl(clock):
+    cache = StaffRoleCache(max_size=4, ttl_seconds=10)
+    cache.set(1, "role_santa")
+
+    clock[0] += 8
+    cache.set(1, "role_keeper")
+    clock[0] += 8
+
+    assert cache.get(1) == "role_keeper"
+
+
+def test_lru_eviction():
+    cache = StaffRoleCache(max_size=2, ttl_seconds=60)
+    cache.set(1, "role_santa")
+    cache.set(2, "role_listelf")
+
+    # 1 을 최근에 사용 -> 가장 오래된 항목은 2
+    assert cache.get(1) == "role_santa"
+    cache.set(3, "role_keeper")
+
+    assert cache.get(2) is None
+    assert cache.get(1) == "role_santa"
+    assert cache.get(3) == "role_keeper"
+    assert cache.stats()["evictions"] == 1
+
+
+def test_invalidate_one_and_all():
+    cache = StaffRoleCache(max_size=4, ttl_seconds=60)
+    cache.set(1, "role_santa")
+    cache.set(2, "role_listelf")
+
+    cache.invalidate(1)
+    assert cache.get(1) is None
+    assert cache.get(2) == "role_listelf"
+
+    cache.invalidate()
+    assert cache.get(2) is None
+    assert cache.stats()["invalidations"] == 2
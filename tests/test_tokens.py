@@ -0,0 +1,52 @@
+from backend.utils import tokens
+from backend.utils.tokens import _b64encode, issue_token, verify_token
+
+
+def test_round_trip():
+    token, expires_at = issue_token(12, "GiftElf")
+
+    assert verify_token(token) == (12, "GiftElf")
+    assert expires_at > 0
+
+
+def test_expired_token(monkeypatch):
+    token, expires_at = issue_token(12, "GiftElf", ttl_seconds=60)
+
+    monkeypatch.setattr(tokens.time, "time", lambda: expires_at)
+    assert verify_token(token) is None
+
+    monkeypatch.setattr(tokens.time, "time", lambda: expires_at - 1)
+    assert verify_token(token) == (12, "GiftElf")
+
+
+def test_tampered_body_is_rejected():
+    token, expires_at = issue_token(12, "GiftElf")
+    _, signature = token.split(".")
+
+    # 서명은 그대로 두고 역할만 바꾼 본문
+    forged = _b64encode(f"12:Santa:{expires_at}".encode("utf-8"))
+    assert verify_token(f"{forged}.{signature}") is None
+
+
+def test_tampered_signature_is_rejected():
+    token, _ = issue_token(12, "GiftElf")
+    body, signature = token.split(".")
+    flipped = ("A" if signature[0] != "A" else "B") + signature[1:]
+
+    assert verify_token(f"{body}.{flipped}") is None
+
+
+def test_token_signed_with_other_secret(monkeypatch):
+    token, _ = issue_token(12, "GiftElf")
+
+    monkeypatch.setattr(tokens, "_SECRET_BYTES", b"another-secret")
+    assert verify_token(token) is None
+
+
+def test_malformed_tokens():
+    for token in ["", ".", "abc", "abc.", ".abc", "한글.서명"]:
+        assert verify_token(token) is None
+
+    # 서명은 맞지만 본문 형식이 틀린 경우
+    body = _b64encode(b"not-a-number:Santa:xyz")
+    assert verify_token(f"{body}.{tokens._sign(body)}") is None